@@ -0,0 +1,68 @@
+"""
+Benchmark: alpha001–003 on Polars operators vs. the pandas groupby.apply
+reference in factors.alphas.pandas_reference.
+
+    python scripts/bench_alpha101.py [n_tickers] [n_days]
+"""
+
+import datetime as dt
+import os
+import sys
+import time
+
+import numpy as np
+import polars as pl
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from factors import get_factor_fn  # noqa: E402
+from factors.alphas import pandas_reference as ref  # noqa: E402
+
+
+def synthetic_ohlcv(n_tickers: int, n_days: int, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_tickers, n_days)), 1))
+    start = dt.date(2020, 1, 1)
+    return pl.DataFrame(
+        {
+            "ticker": np.repeat([f"T{i:04d}" for i in range(n_tickers)], n_days),
+            "timestamps": pl.date_range(
+                start, start + dt.timedelta(days=n_days - 1), eager=True
+            ).to_list()
+            * n_tickers,
+            "open": close.ravel() * np.exp(rng.normal(0, 0.01, close.size)),
+            "close": close.ravel(),
+            "volume": rng.integers(1_000, 100_000, close.size),
+        }
+    )
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    n_tickers = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 252
+    ohlcv = synthetic_ohlcv(n_tickers, n_days)
+    print(f"{n_tickers} tickers × {n_days} days = {ohlcv.height:,} rows")
+
+    references = {
+        "alpha001": ref.alpha001,
+        "alpha002": ref.alpha002,
+        "alpha003": ref.alpha003,
+    }
+    for name, reference in references.items():
+        polars_fn = get_factor_fn(name).__wrapped__
+        t_polars = timed(lambda: polars_fn(ohlcv))
+        t_pandas = timed(lambda: reference(*ref.to_pandas(ohlcv)), repeat=1)
+        print(
+            f"{name}: pandas {t_pandas * 1e3:8.1f} ms   polars {t_polars * 1e3:7.1f} ms"
+            f"   ({t_pandas / t_polars:5.1f}x)"
+        )
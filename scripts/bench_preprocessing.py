@@ -0,0 +1,82 @@
+"""
+Benchmark: fused preprocess_factor vs. the step-by-step pipeline
+(winsorize → zscore_normalize → sector_neutralize, one window pass each).
+
+    python scripts/bench_preprocessing.py [n_dates] [n_tickers] [n_factors]
+
+Default size is the production-scale panel: 2,500 dates × 5,000 tickers ×
+20 factors (12.5M rows per factor).
+"""
+
+import datetime as dt
+import os
+import sys
+import time
+
+import numpy as np
+import polars as pl
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from alpha.preprocessing import (  # noqa: E402
+    preprocess_factor,
+    sector_neutralize,
+    winsorize,
+    zscore_normalize,
+)
+
+
+def synthetic_factor(n_dates: int, n_tickers: int, seed: int) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = dt.date(2015, 1, 1)
+    dates = pl.date_range(start, start + dt.timedelta(days=n_dates - 1), eager=True)
+    return pl.DataFrame(
+        {
+            "date": np.repeat(dates.to_numpy(), n_tickers),
+            "ticker": [f"T{i:04d}" for i in range(n_tickers)] * n_dates,
+            "value": rng.standard_t(3, n_dates * n_tickers),
+        }
+    )
+
+
+def stepwise(df: pl.DataFrame, sectors: pl.DataFrame) -> pl.DataFrame:
+    df = df.filter(pl.col("value").is_not_null() & pl.col("value").is_finite())
+    df = winsorize(df, pct=0.01)
+    df = zscore_normalize(df)
+    return sector_neutralize(df, sectors)
+
+
+def fused(df: pl.DataFrame, sectors: pl.DataFrame) -> pl.DataFrame:
+    return preprocess_factor(df, sectors=sectors, neutralize=["sector"])
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n_dates = int(sys.argv[1]) if len(sys.argv) > 1 else 2_500
+    n_tickers = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    n_factors = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    sectors = pl.DataFrame(
+        {
+            "ticker": [f"T{i:04d}" for i in range(n_tickers)],
+            "sector": [f"S{i % 11:02d}" for i in range(n_tickers)],
+        }
+    )
+    print(f"{n_dates} dates × {n_tickers} tickers × {n_factors} factors")
+
+    totals = {"stepwise": 0.0, "fused": 0.0}
+    for k in range(n_factors):
+        factor = synthetic_factor(n_dates, n_tickers, seed=k)
+        totals["stepwise"] += timed(lambda: stepwise(factor, sectors))
+        totals["fused"] += timed(lambda: fused(factor, sectors))
+
+    for name, seconds in totals.items():
+        print(
+            f"{name:>9}: {seconds:8.2f} s   ({seconds / n_factors * 1e3:8.1f} ms/factor)"
+        )
+    print(f"  speedup: {totals['stepwise'] / totals['fused']:.2f}x")
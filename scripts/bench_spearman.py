@@ -0,0 +1,170 @@
+"""
+Benchmark: callers of the shared Spearman kernel (alpha.spearman) vs. the
+Polars rank / rank-IC code they used before:
+
+    - FactorAnalyzer.ic_series_by_horizon   (rank().over("date") + corr)
+    - portfolio.pipeline IC-weight ICs      (per factor: join + corr(rank(), rank()))
+    - FactorAnalyzer.turnover               (rank().over("date") normalization)
+
+    python scripts/bench_spearman.py [n_dates] [n_tickers] [n_factors]
+
+Default size is a wide universe: 1,000 dates × 5,000 tickers (5M rows),
+3 forward-return horizons and 5 factors, rows in (ticker, date) order as
+factor frames come out of the time-series factor code.
+"""
+
+import datetime as dt
+import os
+import sys
+import time
+
+import numpy as np
+import polars as pl
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from alpha.factor_analyzer import FactorAnalyzer  # noqa: E402
+from portfolio.pipeline import _compute_ic_series_list  # noqa: E402
+
+HORIZONS = [1, 5, 10]
+
+
+def synthetic_panel(
+    n_dates: int, n_tickers: int, n_factors: int, seed: int = 0
+) -> tuple:
+    """Factors (date, ticker, value) and returns (date, ticker, returns...)."""
+    rng = np.random.default_rng(seed)
+    start = dt.date(2015, 1, 1)
+    dates = pl.date_range(start, start + dt.timedelta(days=n_dates - 1), eager=True)
+    n = n_dates * n_tickers
+    keys = pl.DataFrame(
+        {
+            "date": np.tile(dates.to_numpy(), n_tickers),
+            "ticker": np.repeat([f"T{i:04d}" for i in range(n_tickers)], n_dates),
+        }
+    )
+    factors = [
+        keys.with_columns(pl.Series("value", rng.standard_normal(n)))
+        for _ in range(n_factors)
+    ]
+    returns = keys
+    for h in HORIZONS:
+        ret = 0.05 * factors[0]["value"].to_numpy() + rng.standard_normal(n)
+        ret[rng.random(n) < 0.01 * h] = np.nan
+        returns = returns.with_columns(pl.Series(f"forward_return_{h}d", ret))
+    returns = returns.with_columns(
+        pl.col("forward_return_1d").fill_nan(None).alias("next_day_return")
+    )
+    return factors, returns
+
+
+# ── Polars code replaced by the kernel ──────────────────────────────────────
+
+
+def polars_analyzer_ic(merged: pl.DataFrame) -> pl.DataFrame:
+    signal = pl.col("value")
+    columns = []
+    for h in HORIZONS:
+        ret = pl.col(f"forward_return_{h}d")
+        valid = signal.is_finite() & ret.is_not_null() & ret.is_finite()
+        columns += [
+            pl.when(valid).then(signal).rank().over("date").alias(f"_sr{h}"),
+            pl.when(valid).then(ret).rank().over("date").alias(f"_rr{h}"),
+            valid.alias(f"_ok{h}"),
+        ]
+    return (
+        merged.select(pl.col("date"), *columns)
+        .group_by("date")
+        .agg(
+            [pl.corr(f"_sr{h}", f"_rr{h}").alias(f"ic_{h}") for h in HORIZONS]
+            + [pl.col(f"_ok{h}").sum().alias(f"n_{h}") for h in HORIZONS]
+        )
+        .sort("date")
+    )
+
+
+def polars_pipeline_ic(factors: list, returns: pl.DataFrame) -> list:
+    out = []
+    for factor in factors:
+        merged = factor.join(returns, on=["date", "ticker"], how="inner")
+        out.append(
+            merged.group_by("date")
+            .agg(
+                pl.corr(pl.col("value").rank(), pl.col("next_day_return").rank()).alias(
+                    "ic"
+                )
+            )
+            .sort("date")
+            .filter(pl.col("ic").is_not_null() & pl.col("ic").is_finite())
+        )
+    return out
+
+
+def polars_turnover(signal: pl.DataFrame) -> pl.DataFrame:
+    ranked = signal.with_columns(
+        (
+            (pl.col("value").rank().over("date") - 1)
+            / (pl.col("value").count().over("date") - 1)
+            * 2
+            - 1
+        ).alias("weight")
+    ).sort(["ticker", "date"])
+    ranked = ranked.with_columns(
+        (pl.col("weight") - pl.col("weight").shift(1).over("ticker"))
+        .abs()
+        .alias("weight_change")
+    )
+    return (
+        ranked.filter(pl.col("weight_change").is_not_null())
+        .group_by("date")
+        .agg(pl.col("weight_change").mean().alias("turnover"), pl.len())
+        .sort("date")
+    )
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    n_dates = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    n_tickers = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    n_factors = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    factors, returns = synthetic_panel(n_dates, n_tickers, n_factors)
+    print(
+        f"{n_dates} dates × {n_tickers} tickers, horizons {HORIZONS}, "
+        f"{n_factors} factors"
+    )
+
+    analyzer = FactorAnalyzer(factors[0], returns)
+    next_day = returns.select("date", "ticker", "next_day_return")
+    cases = [
+        (
+            "analyzer IC",
+            lambda: polars_analyzer_ic(analyzer._merged),
+            lambda: analyzer._compute_ic(HORIZONS),
+        ),
+        (
+            "pipeline ICs",
+            lambda: polars_pipeline_ic(factors, next_day),
+            lambda: _compute_ic_series_list(factors, next_day),
+        ),
+        (
+            "turnover",
+            lambda: polars_turnover(factors[0]),
+            analyzer.turnover,
+        ),
+    ]
+    for name, old, new in cases:
+        before = timed(old)
+        after = timed(new)
+        print(
+            f"{name:>13}: polars {before:6.2f} s   kernel {after:6.2f} s"
+            f"   speedup {before / after:5.2f}x"
+        )
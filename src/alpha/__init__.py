@@ -4,8 +4,12 @@ Alpha Research Module — Factor construction, evaluation, and combination.
 Sub-modules:
     forward_returns: Compute N-day forward returns for the universe
     factor_analyzer: IC, IR, IC decay, turnover analysis
+    factor_panel: IC matrix and factor correlations for many factors at once
+    spearman: Cross-sectional rank and Spearman IC kernel
     preprocessing: Winsorize, z-score, rank-normalize, sector neutralize
     combination: Factor combination methods (equal-weight, IC-weight, MV)
+    orthogonalization: Per-date residualization of factors on each other
+    operators: Alpha 101 operators as composable Polars expressions
 
 Convention:
     - Factor DataFrame: (date, ticker, value) — long format, one row per stock-date
@@ -14,12 +18,14 @@ Convention:
 
 from alpha.combination import combine_factors
 from alpha.factor_analyzer import FactorAnalyzer
+from alpha.factor_panel import FactorPanel
 from alpha.forward_returns import compute_forward_returns
 from alpha.preprocessing import preprocess_factor
 
 __all__ = [
     "compute_forward_returns",
     "FactorAnalyzer",
+    "FactorPanel",
     "preprocess_factor",
     "combine_factors",
 ]
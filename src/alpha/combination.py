@@ -11,6 +11,20 @@ Methods (ordered by complexity):
     3. Mean-variance — maximize Sharpe on the IC covariance matrix
     4. Risk-parity — equal risk contribution, robust
 
+Factors are aligned once on a shared (date, ticker) index
+(``align_factors``).  By default only pairs present in every factor are
+combined; ``how="outer"`` keeps the union, with per-factor handling of
+missing values.
+
+IC-based weights are fitted on the whole IC history by default.  With
+``ic_window`` ("expanding" or a window length) the weights are per date
+instead, fitted only on the ICs known at that date
+(``rolling_combination_weights``); the IC mean and covariance are
+updated incrementally (``ICMoments``), O(K²) per new date.
+
+Optionally, factors are orthogonalized first (``orthogonalize=True``), so
+each factor only contributes what the factors before it do not explain.
+
 Usage:
     from alpha.combination import combine_factors
 
@@ -18,16 +32,20 @@ Usage:
         factors=[factor_a, factor_b, factor_c],
         method="ic_weight",
         ic_series_list=[ic_a, ic_b, ic_c],  # required for ic_weight / mv
+        ic_window="expanding",              # optional: no look-ahead
     )
 
 Reference: guidance/quant_lab.pdf — Part III, Chapter 12 (Factor Combination)
 """
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import polars as pl
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 def combine_factors(
     factors: List[pl.DataFrame],
@@ -37,6 +55,13 @@ def combine_factors(
     value_col: str = "value",
     date_col: str = "date",
     ticker_col: str = "ticker",
+    orthogonalize: bool = False,
+    ridge: float = 0.0,
+    how: str = "inner",
+    missing: Union[str, List[str]] = "skip",
+    ic_window: Optional[Union[int, str]] = None,
+    min_periods: int = 20,
+    ic_horizon: int = 1,
 ) -> pl.DataFrame:
     """
     Combine multiple factor signals into a single composite.
@@ -57,6 +82,25 @@ def combine_factors(
         value_col: Signal column name in factor DataFrames.
         date_col: Date column name.
         ticker_col: Ticker column name.
+        orthogonalize: If True, replace each factor by its per-date residual
+                       on the factors before it in the list (see
+                       ``alpha.orthogonalization.orthogonalize_factors``)
+                       before combining.  ``ic_series_list`` should then
+                       describe the orthogonalized factors.
+        ridge: Ridge penalty for the orthogonalization regressions.
+        how: "inner" keeps the (date, ticker) pairs present in every factor;
+             "outer" keeps those present in any factor, handling missing
+             values as set by ``missing`` (see ``combine_columns``).
+        missing: For how="outer" — "skip" or "zero", for all factors or
+                 one per factor.
+        ic_window: None fits one weight vector on the whole IC history.
+                   "expanding" or a window length (in IC dates) fits
+                   per-date weights on the ICs known at each date, with
+                   no look-ahead (see ``rolling_combination_weights``).
+        min_periods: Minimum IC dates before per-date weights leave equal
+                     weight (``ic_window`` only).
+        ic_horizon: Forward-return horizon of the ICs, in dates
+                    (``ic_window`` only).
 
     Returns:
         Composite signal DataFrame with columns (date, ticker, value).
@@ -67,39 +111,152 @@ def combine_factors(
     if k == 1:
         return factors[0]
 
-    # Compute weights based on method
-    weights = _compute_weights(
+    # Compute weights based on method (validates method and IC series)
+    weights: Union[List[float], pl.DataFrame] = compute_combination_weights(
         method=method,
         k=k,
         ic_series_list=ic_series_list,
         risk_aversion=risk_aversion,
     )
 
-    # Rename value columns to avoid collision
-    renamed = []
-    for i, f in enumerate(factors):
-        renamed.append(
-            f.select(
-                [
-                    pl.col(date_col),
-                    pl.col(ticker_col),
-                    pl.col(value_col).alias(f"factor_{i}"),
-                ]
-            )
-        )
+    if orthogonalize:
+        from alpha.orthogonalization import orthogonalize_factors
 
-    # Join all factors on (date, ticker)
-    merged = renamed[0]
-    for i in range(1, k):
-        merged = merged.join(renamed[i], on=[date_col, ticker_col], how="inner")
+        factors = orthogonalize_factors(
+            factors,
+            ridge=ridge,
+            value_col=value_col,
+            date_col=date_col,
+            ticker_col=ticker_col,
+        )
 
-    # Weighted sum: composite = sum(w_k * factor_k)
+    # Align all factors once on a shared (date, ticker) index
     factor_cols = [f"factor_{i}" for i in range(k)]
-    composite_expr = pl.lit(0.0)
-    for i, col_name in enumerate(factor_cols):
-        composite_expr = composite_expr + pl.col(col_name) * weights[i]
+    merged = align_factors(
+        factors,
+        factor_cols,
+        value_col=value_col,
+        date_col=date_col,
+        ticker_col=ticker_col,
+    )
+    if ic_window is not None and method != "equal_weight":
+        weights = rolling_combination_weights(
+            ic_series_list,
+            method=method,
+            window=ic_window,
+            min_periods=min_periods,
+            horizon=ic_horizon,
+            risk_aversion=risk_aversion,
+            dates=merged[date_col].unique(),
+            names=factor_cols,
+            date_col=date_col,
+        )
+    return combine_columns(
+        merged,
+        factor_cols,
+        weights,
+        value_col=value_col,
+        date_col=date_col,
+        ticker_col=ticker_col,
+        how=how,
+        missing=missing,
+    )
+
+
+def combine_columns(
+    frame: FrameT,
+    columns: List[str],
+    weights: Union[List[float], pl.DataFrame],
+    value_col: str = "value",
+    date_col: str = "date",
+    ticker_col: str = "ticker",
+    how: str = "inner",
+    missing: Union[str, List[str]] = "skip",
+) -> FrameT:
+    """
+    Weighted sum of factor columns of a wide (date, ticker, f_1, ..., f_k) frame.
+
+    With how="inner", rows where any factor is null are dropped.  With
+    how="outer", rows where at least one factor is valid are kept, and a
+    null factor is handled per ``missing``:
+
+        - "skip": the factor drops out of that row and the weights of the
+          present factors are scaled up to the full total weight.
+        - "zero": the factor counts as 0 (its cross-sectional mean after
+          z-scoring / rank normalization) with its full weight.
+
+    On rows where every factor is present both give the inner composite.
+    Works on a DataFrame or a LazyFrame, so the combination can stay
+    inside a lazy factor plan.
+
+    Args:
+        frame: Wide factor frame, one column per factor.
+        columns: Factor columns to combine.
+        weights: One weight per column (see ``compute_combination_weights``),
+                 or per-date weights: a DataFrame with the date column and
+                 one column per factor column (see
+                 ``rolling_combination_weights``).  Dates without weights
+                 are dropped.
+        value_col: Name of the composite column.
+        date_col: Date column name.
+        ticker_col: Ticker column name.
+        how: "inner" or "outer".
+        missing: "skip" or "zero" (how="outer"), for all columns or one
+                 per column.
+
+    Returns:
+        Composite signal with columns (date, ticker, value).
+    """
+    if how not in ("inner", "outer"):
+        raise ValueError(f"Unknown how '{how}'. Use 'inner' or 'outer'.")
+    if isinstance(missing, str):
+        missing = [missing] * len(columns)
+    if len(missing) != len(columns) or not set(missing) <= {"skip", "zero"}:
+        raise ValueError(
+            f"missing must be 'skip' or 'zero', or one of those per column; "
+            f"got {missing!r}."
+        )
+
+    if isinstance(weights, pl.DataFrame):
+        # per-date weights: join them on as _w_{column} columns
+        table = weights.select(
+            pl.col(date_col), *[pl.col(c).alias(f"_w_{c}") for c in columns]
+        )
+        frame = frame.join(
+            table.lazy() if isinstance(frame, pl.LazyFrame) else table,
+            on=date_col,
+            how="left",
+            maintain_order="left",
+        )
+        w_exprs = [pl.col(f"_w_{c}") for c in columns]
+        has_weights = pl.all_horizontal([w.is_not_null() for w in w_exprs])
+    else:
+        w_exprs = [pl.lit(float(w)) for w in weights]
+        has_weights = pl.lit(True)
+
+    if how == "inner":
+        # Weighted sum: composite = sum(w_k * factor_k)
+        composite_expr = pl.lit(0.0)
+        for col_name, w in zip(columns, w_exprs):
+            composite_expr = composite_expr + pl.col(col_name) * w
+        keep = pl.all_horizontal([pl.col(c).is_not_null() for c in columns])
+    else:
+        # composite = sum(w_k * x_k) / sum(w_k counted) * sum(w_k), where a
+        # null x_k adds 0 and counts only if missing_k == "zero"
+        numerator = pl.lit(0.0)
+        counted = pl.lit(0.0)
+        for col_name, w, fill in zip(columns, w_exprs, missing):
+            numerator = numerator + pl.col(col_name).fill_null(0.0) * w
+            present = pl.col(col_name).is_not_null()
+            if fill == "zero":
+                present = pl.lit(True)
+            counted = counted + present.cast(pl.Float64) * w
+        composite_expr = numerator / counted * pl.sum_horizontal(w_exprs)
+        keep = pl.any_horizontal([pl.col(c).is_not_null() for c in columns]) & (
+            counted != 0
+        )
 
-    result = merged.select(
+    return frame.filter(keep & has_weights).select(
         [
             pl.col(date_col),
             pl.col(ticker_col),
@@ -107,10 +264,88 @@ def combine_factors(
         ]
     )
 
-    return result
+
+def align_factors(
+    factors: List[pl.DataFrame],
+    names: List[str],
+    value_col: str = "value",
+    date_col: str = "date",
+    ticker_col: str = "ticker",
+) -> pl.DataFrame:
+    """
+    Align long factor frames into one wide (date, ticker, f_1, ..., f_k) frame.
+
+    Rows are the union of all (date, ticker) keys; a factor column is null
+    where that factor has no row.
+    Factors computed on the same OHLCV usually share their keys row for
+    row: then the columns are simply stacked side by side.  Otherwise the
+    keys are encoded once as integer (date, ticker) grid positions and
+    every factor is scattered into that grid — no joins, whose cost grows
+    with each of the K-1 pairwise steps.  Rows come out sorted by
+    (date, ticker).
+
+    Args:
+        factors: Factor DataFrames, each with (date, ticker, value) and
+                 unique (date, ticker) keys.
+        names: Column name for each factor.
+        value_col: Signal column name in factor DataFrames.
+        date_col: Date column name.
+        ticker_col: Ticker column name.
+
+    Returns:
+        Wide DataFrame with columns (date, ticker, *names).
+    """
+    if len(names) != len(factors):
+        raise ValueError(f"Got {len(factors)} factors but {len(names)} names.")
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate factor names in {names}.")
+
+    keys = [date_col, ticker_col]
+    base = factors[0].select(keys)
+    if all(f.select(keys).equals(base) for f in factors[1:]):
+        return base.with_columns(
+            f[value_col].cast(pl.Float64).alias(name) for name, f in zip(names, factors)
+        )
+
+    # Integer (date, ticker) index shared by all factors: date position
+    # among the sorted unique dates, ticker code in a sorted Enum.  Each
+    # factor is then scattered into a (dates × tickers) grid by position,
+    # with no join and no sort of the long frame.
+    long = pl.concat([f.select(keys) for f in factors])
+    dates, date_codes = _sorted_codes(long[date_col])
+    tickers, ticker_codes = _sorted_codes(long[ticker_col])
+    n_tickers = len(tickers)
+    cell = date_codes * n_tickers + ticker_codes
+
+    present = np.zeros(len(dates) * n_tickers, dtype=bool)
+    present[cell] = True
+    rows = np.flatnonzero(present)
+    columns = []
+    offset = 0
+    for name, f in zip(names, factors):
+        values = f[value_col].cast(pl.Float64)
+        factor_cell = cell[offset : offset + f.height][values.is_not_null().to_numpy()]
+        offset += f.height
+        grid = np.full(present.size, np.nan)
+        grid[factor_cell] = values.drop_nulls().to_numpy()
+        valid = np.zeros(present.size, dtype=bool)
+        valid[factor_cell] = True
+        columns.append(
+            pl.select(pl.when(pl.Series(valid[rows])).then(pl.Series(grid[rows])))
+            .to_series()
+            .alias(name)
+        )
+
+    return pl.DataFrame(
+        [
+            dates.gather(rows // n_tickers).alias(date_col),
+            tickers.gather(rows % n_tickers).alias(ticker_col),
+            *columns,
+        ]
+    )
 
 
-def _compute_weights(
+def compute_combination_weights(
     method: str,
     k: int,
     ic_series_list: Optional[List[pl.DataFrame]],
@@ -119,7 +354,8 @@ def _compute_weights(
     """
     Compute combination weights from the IC time series.
 
-    Returns a list of k float weights (normalized to sum to 1).
+    Returns a list of k float weights (normalized to sum to 1), in the
+    order of ``ic_series_list``.
     """
     if method == "equal_weight":
         return [1.0 / k] * k
@@ -149,19 +385,214 @@ def _compute_weights(
         )
 
 
+class ICMoments:
+    """
+    Running mean and covariance of the K-factor IC vector.
+
+    Welford updates: adding a day is a rank-one update of the mean and of
+    the co-moment matrix M2, O(K²).  With ``window`` set, the day leaving
+    the window is removed the same way (reverse Welford), so a trailing
+    window costs O(K²) per day as well.  To bound floating-point drift,
+    the rolling moments are recomputed from the window once every
+    ``window`` removals (amortized O(K²)).
+
+    Args:
+        k: Number of factors.
+        window: Trailing window length in days (default: None, expanding).
+    """
+
+    def __init__(self, k: int, window: Optional[int] = None):
+        if window is not None and window < 2:
+            raise ValueError(f"window must be at least 2, got {window}.")
+        self.k = k
+        self.window = window
+        self.n = 0
+        self.mean = np.zeros(k)
+        self._m2 = np.zeros((k, k))
+        self._history: Deque[np.ndarray] = deque()
+        self._removed = 0
+
+    def update(self, ic: np.ndarray) -> None:
+        """Add one day's IC vector (length K); vectors with NaN are skipped."""
+        x = np.asarray(ic, dtype=np.float64)
+        if x.shape != (self.k,):
+            raise ValueError(f"Expected an IC vector of length {self.k}.")
+        if np.isnan(x).any():
+            return
+        if self.window is not None:
+            if len(self._history) == self.window:
+                self._remove(self._history.popleft())
+            self._history.append(x)
+        self._add(x)
+
+    @property
+    def cov(self) -> np.ndarray:
+        """Sample covariance (ddof=1); NaN with fewer than two days."""
+        if self.n < 2:
+            return np.full((self.k, self.k), np.nan)
+        return self._m2 / (self.n - 1)
+
+    @property
+    def std(self) -> np.ndarray:
+        """Sample standard deviation (ddof=1) of each factor's IC."""
+        return np.sqrt(np.diag(self.cov))
+
+    def weights(self, method: str, risk_aversion: float = 1.0) -> np.ndarray:
+        """
+        Combination weights from the current moments, as
+        ``compute_combination_weights`` on the same IC history.
+
+        Equal weights until there is enough history (one day for
+        "ic_weight", two for the covariance-based methods).
+        """
+        equal = np.full(self.k, 1.0 / self.k)
+        if method == "equal_weight":
+            return equal
+        if method not in ("ic_weight", "mean_variance", "risk_parity"):
+            raise ValueError(
+                f"Unknown method '{method}'. "
+                "Use 'equal_weight', 'ic_weight', 'mean_variance', or 'risk_parity'."
+            )
+        if self.n < (1 if method == "ic_weight" else 2):
+            return equal
+        if method == "ic_weight":
+            return _ic_weight_from_moments(self.mean)
+        if method == "mean_variance":
+            return _mean_variance_from_moments(self.mean, self.cov, risk_aversion)
+        return _risk_parity_from_moments(self.std)
+
+    def _add(self, x: np.ndarray) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += np.outer(delta, x - self.mean)
+
+    def _remove(self, x: np.ndarray) -> None:
+        if self.n == 1:
+            self.n = 0
+            self.mean = np.zeros(self.k)
+            self._m2 = np.zeros((self.k, self.k))
+            return
+        mean = (self.n * self.mean - x) / (self.n - 1)
+        self._m2 -= np.outer(x - mean, x - self.mean)
+        self.mean = mean
+        self.n -= 1
+        self._removed += 1
+        if self._removed >= self.window:
+            # refresh from the window (still holds n days, x already popped)
+            history = np.array(self._history)
+            self.mean = history.mean(axis=0)
+            centered = history - self.mean
+            self._m2 = centered.T @ centered
+            self._removed = 0
+
+
+def rolling_combination_weights(
+    ic_series_list: List[pl.DataFrame],
+    method: str = "ic_weight",
+    window: Union[int, str] = "expanding",
+    min_periods: int = 20,
+    horizon: int = 1,
+    risk_aversion: float = 1.0,
+    dates: Optional[pl.Series] = None,
+    names: Optional[List[str]] = None,
+    date_col: str = "date",
+) -> pl.DataFrame:
+    """
+    Per-date combination weights, fitted only on ICs known at each date.
+
+    The static ``compute_combination_weights`` fits one weight vector on
+    the whole IC history — including ICs realized after the dates being
+    combined.  Here the weights for date t use only the ICs dated at
+    least ``horizon`` dates before t (an IC dated s needs returns up to
+    s + horizon).  The IC moments are updated incrementally
+    (``ICMoments``), so each date costs O(K²) rather than a refit on the
+    whole history (plus a K × K solve for "mean_variance").
+
+    IC series are aligned on date; a date contributes only if every
+    factor has an IC on it.  Until ``min_periods`` such dates are known
+    the weights are equal (1/K).
+
+    Args:
+        ic_series_list: IC DataFrames (date, ic), one per factor.
+        method: "equal_weight", "ic_weight", "mean_variance" or "risk_parity".
+        window: "expanding" or a trailing window length in IC dates.
+        min_periods: Minimum number of IC dates before the weights leave
+                     equal weight.
+        horizon: Forward-return horizon of the ICs, in dates.
+        risk_aversion: Lambda parameter for mean-variance optimization.
+        dates: Dates to emit weights for (default: the IC dates).
+        names: Weight column names (default: factor_0, ..., factor_{K-1}).
+        date_col: Date column name.
+
+    Returns:
+        DataFrame with columns (date, *names), one row per date, sorted by
+        date.  Rows sum to 1.
+    """
+    k = len(ic_series_list)
+    if k == 0:
+        raise ValueError("At least one IC series required.")
+    if names is None:
+        names = [f"factor_{i}" for i in range(k)]
+    if len(names) != k:
+        raise ValueError(f"Got {k} IC series but {len(names)} names.")
+    if window != "expanding" and not (isinstance(window, int) and window >= 2):
+        raise ValueError(
+            f"window must be 'expanding' or an integer >= 2, got {window!r}."
+        )
+    if horizon < 0:
+        raise ValueError(f"horizon must be non-negative, got {horizon}.")
+
+    # One calendar for the IC dates and the emitted dates
+    ic_dates = pl.concat([ic.get_column(date_col) for ic in ic_series_list])
+    if dates is None:
+        dates = ic_dates
+    dates = dates.cast(ic_dates.dtype)
+    calendar = pl.concat([ic_dates, dates]).unique().sort()
+    frame = pl.DataFrame({date_col: calendar})
+    ics = np.column_stack(
+        [
+            frame.join(ic.select(date_col, "ic"), on=date_col, how="left")
+            .get_column("ic")
+            .cast(pl.Float64)
+            .fill_null(np.nan)
+            .to_numpy()
+            for ic in ic_series_list
+        ]
+    )
+    emit = np.zeros(len(calendar), dtype=bool)
+    emit[calendar.search_sorted(dates.unique()).to_numpy()] = True
+
+    moments = ICMoments(k, window=None if window == "expanding" else window)
+    out = np.full((int(emit.sum()), k), 1.0 / k)
+    # walk the calendar: the IC dated at position p is known from p + horizon
+    known = 0
+    for row, i in enumerate(np.flatnonzero(emit)):
+        while known <= i - horizon:
+            moments.update(ics[known])
+            known += 1
+        if moments.n >= min_periods:
+            out[row] = moments.weights(method, risk_aversion)
+
+    return pl.DataFrame(
+        {
+            date_col: calendar.filter(pl.Series(emit)),
+            **{name: out[:, j] for j, name in enumerate(names)},
+        }
+    )
+
+
+# ── Internal ──────────────────────────────────────────────────────────────────
+
+
 def _ic_weight(ic_arrays: List[np.ndarray]) -> List[float]:
     """
     Weight proportional to mean IC.
 
     w_k ∝ max(mean(IC_k), 0) — negative IC factors get zero weight.
     """
-    means = [max(float(np.mean(arr)), 0.0) for arr in ic_arrays]
-    total = sum(means)
-    if total == 0:
-        # Fallback to equal weight if all ICs are non-positive
-        k = len(means)
-        return [1.0 / k] * k
-    return [m / total for m in means]
+    means = np.array([float(np.mean(arr)) for arr in ic_arrays])
+    return _ic_weight_from_moments(means).tolist()
 
 
 def _mean_variance_weight(
@@ -175,52 +606,85 @@ def _mean_variance_weight(
 
     Constrained to long-only (w_k >= 0), normalized to sum to 1.
     """
-    k = len(ic_arrays)
-
     # Align IC series to same length (trim to shortest)
     min_len = min(len(arr) for arr in ic_arrays)
     aligned = np.column_stack([arr[:min_len] for arr in ic_arrays])
 
     mu = np.mean(aligned, axis=0)
     sigma = np.cov(aligned, rowvar=False)
+    return _mean_variance_from_moments(mu, sigma, risk_aversion).tolist()
+
+
+def _risk_parity_weight(ic_arrays: List[np.ndarray]) -> List[float]:
+    """
+    Risk parity: weight inversely proportional to IC volatility.
+
+    w_k ∝ 1 / std(IC_k)
+
+    Does not require estimating expected IC — only volatility.
+    More robust than mean-variance when IC estimates are noisy.
+    """
+    stds = np.array([float(np.std(arr, ddof=1)) for arr in ic_arrays])
+    return _risk_parity_from_moments(stds).tolist()
+
+
+# ── Weights from IC moments (shared by static and rolling weights) ──────────
+
+
+def _ic_weight_from_moments(mean: np.ndarray) -> np.ndarray:
+    means = np.maximum(mean, 0.0)
+    total = means.sum()
+    if total == 0:
+        # Fallback to equal weight if all ICs are non-positive
+        return np.full(len(means), 1.0 / len(means))
+    return means / total
+
+
+def _mean_variance_from_moments(
+    mu: np.ndarray, sigma: np.ndarray, risk_aversion: float
+) -> np.ndarray:
+    k = len(mu)
 
     # Regularize: add ridge to diagonal for numerical stability
-    sigma += np.eye(k) * 1e-6
+    sigma = sigma + np.eye(k) * 1e-6
 
     try:
         sigma_inv = np.linalg.inv(sigma)
         raw_weights = (1.0 / risk_aversion) * sigma_inv @ mu
     except np.linalg.LinAlgError:
         # Fallback to equal weight if singular
-        return [1.0 / k] * k
+        return np.full(k, 1.0 / k)
 
     # Long-only constraint: clip negative weights
     raw_weights = np.maximum(raw_weights, 0.0)
 
     total = np.sum(raw_weights)
     if total == 0:
-        return [1.0 / k] * k
-
-    return (raw_weights / total).tolist()
+        return np.full(k, 1.0 / k)
 
+    return raw_weights / total
 
-def _risk_parity_weight(ic_arrays: List[np.ndarray]) -> List[float]:
-    """
-    Risk parity: weight inversely proportional to IC volatility.
-
-    w_k ∝ 1 / std(IC_k)
-
-    Does not require estimating expected IC — only volatility.
-    More robust than mean-variance when IC estimates are noisy.
-    """
-    stds = [float(np.std(arr, ddof=1)) for arr in ic_arrays]
 
+def _risk_parity_from_moments(stds: np.ndarray) -> np.ndarray:
     # Avoid division by zero
-    inv_stds = [1.0 / s if s > 1e-10 else 0.0 for s in stds]
-    total = sum(inv_stds)
+    inv_stds = np.where(stds > 1e-10, 1.0 / np.maximum(stds, 1e-10), 0.0)
+    total = inv_stds.sum()
 
     if total == 0:
-        k = len(stds)
-        return [1.0 / k] * k
+        return np.full(len(stds), 1.0 / len(stds))
 
-    return [w / total for w in inv_stds]
+    return inv_stds / total
+
+
+def _sorted_codes(keys: pl.Series) -> Tuple[pl.Series, np.ndarray]:
+    """Sorted unique values of ``keys`` and each key's position among them."""
+    if keys.dtype in (pl.String, pl.Categorical) or isinstance(keys.dtype, pl.Enum):
+        strings = keys.cast(pl.String)
+        uniques = strings.unique().sort()
+        codes = strings.cast(pl.Enum(uniques)).to_physical().to_numpy()
+        return uniques.cast(keys.dtype), codes.astype(np.int64)
+    uniques = keys.unique().sort()
+    codes = np.searchsorted(
+        uniques.to_physical().to_numpy(), keys.to_physical().to_numpy()
+    )
+    return uniques, codes.astype(np.int64)
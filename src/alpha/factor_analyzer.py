@@ -1,5 +1,5 @@
 """
-Factor Analyzer — IC, IR, IC decay, and turnover analysis.
+Factor Analyzer — IC, IR, IC decay, turnover and quantile analysis.
 
 This is the core evaluation tool for alpha research.  Given a signal DataFrame
 and forward returns, it answers: "does this signal predict future returns?"
@@ -11,6 +11,11 @@ The four key metrics:
     - IC Decay: How IC changes across forecast horizons (reveals natural frequency).
     - Turnover: How much the signal ranking changes day to day.
 
+Quantile portfolios: stocks get an integer quantile per date from their
+signal rank, and one aggregation gives the (date × quantile) mean return of
+every horizon.  Spread, cumulative curves, monotonicity and per-quantile
+turnover are views of that matrix.
+
 Usage:
     from alpha.factor_analyzer import FactorAnalyzer
 
@@ -19,6 +24,7 @@ Usage:
     ir = analyzer.ir(horizon=5)
     decay = analyzer.ic_decay(horizons=[1, 2, 5, 10, 20])
     turnover = analyzer.turnover()
+    spread = analyzer.quantile_spread(horizon=5)      # (date, q5 - q1)
     analyzer.summary(horizon=5)
 
 Reference: guidance/quant_lab.pdf — Part III, Chapter 10 (Factor Evaluation)
@@ -29,6 +35,8 @@ from typing import Dict, List, Optional
 import numpy as np
 import polars as pl
 
+from alpha.spearman import cross_sectional_ranks, cross_sectional_spearman, spearman
+
 
 class FactorAnalyzer:
     """
@@ -58,6 +66,12 @@ class FactorAnalyzer:
             self.returns, on=["date", "ticker"], how="inner"
         )
 
+        # Per-horizon memo: IC series and their summary statistics
+        self._ic_cache: Dict[int, pl.DataFrame] = {}
+        self._stats_cache: Dict[int, Dict[str, float]] = {}
+        # Per-n_quantiles memo: (date, quantile) mean returns, all horizons
+        self._quantile_cache: Dict[int, pl.DataFrame] = {}
+
     def ic_series(self, horizon: int = 5) -> pl.DataFrame:
         """
         Compute the cross-sectional Spearman IC at each date.
@@ -77,37 +91,51 @@ class FactorAnalyzer:
                 f"Column '{return_col}' not found. "
                 f"Available: {[c for c in self._merged.columns if c.startswith('forward')]}"
             )
+        return self.ic_series_by_horizon([horizon])[horizon]
 
-        # Filter rows with valid signal and return values
-        valid = self._merged.filter(
-            pl.col("value").is_not_null()
-            & pl.col("value").is_finite()
-            & pl.col(return_col).is_not_null()
-            & pl.col(return_col).is_finite()
-        )
+    def ic_series_by_horizon(self, horizons: List[int]) -> Dict[int, pl.DataFrame]:
+        """
+        IC series for several horizons, computed in one pass.
 
-        # Compute Spearman rank correlation per date
-        # Spearman = Pearson correlation of ranks
-        ranked = valid.with_columns(
-            [
-                pl.col("value").rank().over("date").alias("signal_rank"),
-                pl.col(return_col).rank().over("date").alias("return_rank"),
-            ]
-        )
+        All horizons go through one call of the Spearman kernel
+        (``alpha.spearman.cross_sectional_spearman``): the signal is ranked
+        once, and re-ranked only on the dates where a horizon loses stocks
+        (Spearman needs both ranks over the same stocks, and longer
+        horizons lose stocks near the end of the sample).
+        Results are memoized per horizon on the analyzer, so ``ic_stats``,
+        ``ir``, ``ic_decay`` and ``summary`` never recompute them.
 
-        # Count observations per date and filter
-        ranked = ranked.with_columns(
-            pl.col("ticker").count().over("date").alias("n_obs")
-        ).filter(pl.col("n_obs") >= self.min_observations)
+        Args:
+            horizons: Forecast horizons; missing forward_return columns
+                      are skipped.
 
-        # Pearson correlation of ranks = Spearman correlation
-        ic_df = (
-            ranked.group_by("date")
-            .agg(pl.corr("signal_rank", "return_rank").alias("ic"))
-            .sort("date")
+        Returns:
+            Dict horizon → DataFrame (date, ic), as ``ic_series``.
+        """
+        todo = [
+            h
+            for h in dict.fromkeys(horizons)
+            if h not in self._ic_cache
+            and f"forward_return_{h}d" in self._merged.columns
+        ]
+        if todo:
+            self._ic_cache.update(self._compute_ic(todo))
+        return {h: self._ic_cache[h] for h in horizons if h in self._ic_cache}
+
+    def _compute_ic(self, horizons: List[int]) -> Dict[int, pl.DataFrame]:
+        return_cols = [f"forward_return_{h}d" for h in horizons]
+        per_date = cross_sectional_spearman(
+            self._merged,
+            "value",
+            return_cols,
+            min_observations=self.min_observations,
         )
 
-        return ic_df
+        # Dates with fewer than min_observations valid stocks have a null IC
+        return {
+            h: per_date.select("date", pl.col(col).alias("ic")).drop_nulls("ic")
+            for h, col in zip(horizons, return_cols)
+        }
 
     def ic_stats(self, horizon: int = 5) -> Dict[str, float]:
         """
@@ -116,34 +144,10 @@ class FactorAnalyzer:
         Returns:
             Dictionary with keys: mean_ic, std_ic, ir, t_stat, hit_rate, n_dates
         """
-        ic_df = self.ic_series(horizon)
-        ic_arr = ic_df["ic"].drop_nulls().to_numpy()
-
-        n = len(ic_arr)
-        if n == 0:
-            return {
-                "mean_ic": 0.0,
-                "std_ic": 0.0,
-                "ir": 0.0,
-                "t_stat": 0.0,
-                "hit_rate": 0.0,
-                "n_dates": 0,
-            }
-
-        mean_ic = float(np.mean(ic_arr))
-        std_ic = float(np.std(ic_arr, ddof=1))
-        ir = mean_ic / std_ic if std_ic > 0 else 0.0
-        t_stat = mean_ic / (std_ic / np.sqrt(n)) if std_ic > 0 else 0.0
-        hit_rate = float(np.mean(ic_arr > 0)) * 100  # % of dates with positive IC
-
-        return {
-            "mean_ic": mean_ic,
-            "std_ic": std_ic,
-            "ir": ir,
-            "t_stat": t_stat,
-            "hit_rate": hit_rate,
-            "n_dates": n,
-        }
+        if horizon not in self._stats_cache:
+            ic_df = self.ic_series(horizon)
+            self._stats_cache[horizon] = ic_summary_stats(ic_df["ic"])
+        return dict(self._stats_cache[horizon])
 
     def ir(self, horizon: int = 5) -> float:
         """
@@ -168,10 +172,12 @@ class FactorAnalyzer:
         Returns:
             DataFrame with columns (horizon, mean_ic, std_ic, ir, t_stat)
         """
+        # One batched pass for every horizon not computed yet
+        available = self.ic_series_by_horizon(horizons)
+
         results = []
         for h in horizons:
-            return_col = f"forward_return_{h}d"
-            if return_col not in self._merged.columns:
+            if h not in available:
                 continue
             stats = self.ic_stats(h)
             results.append(
@@ -200,16 +206,16 @@ class FactorAnalyzer:
             DataFrame with columns (date, turnover, n_stocks)
         """
         # Rank-normalize the signal cross-sectionally at each date
-        ranked = self.signal.filter(
-            pl.col("value").is_not_null() & pl.col("value").is_finite()
-        ).with_columns(
+        ranked = cross_sectional_ranks(
+            self.signal.filter(
+                pl.col("value").is_not_null() & pl.col("value").is_finite()
+            ),
+            "value",
+        ).select(
+            "date",
+            "ticker",
             # Normalize rank to [-1, 1]
-            (
-                (pl.col("value").rank().over("date") - 1)
-                / (pl.col("value").count().over("date") - 1)
-                * 2
-                - 1
-            ).alias("weight")
+            ((pl.col("rank") - 1) / (pl.col("n") - 1) * 2 - 1).alias("weight"),
         )
 
         # Sort by ticker then date for shift
@@ -237,12 +243,35 @@ class FactorAnalyzer:
 
         return turnover_df
 
+    def quantile_assignments(self, n_quantiles: int = 5) -> pl.DataFrame:
+        """
+        Integer quantile of every stock at every date.
+
+        Quantiles come from rank arithmetic on the cross-sectional signal
+        rank (``alpha.spearman.cross_sectional_ranks``), computed once per
+        date for all horizons:
+
+            quantile = floor((rank - 1) * n_quantiles / n) + 1
+
+        Quantile 1 holds the lowest signals; each quantile holds about
+        n / n_quantiles stocks, and tied signals share a quantile.
+
+        Args:
+            n_quantiles: Number of quantiles (default: 5 = quintiles).
+
+        Returns:
+            DataFrame with columns (date, ticker, quantile) — every stock
+            with a valid signal and a forward-return row.
+        """
+        return self._quantiled(n_quantiles).select("date", "ticker", "quantile")
+
     def quantile_returns(self, horizon: int = 5, n_quantiles: int = 5) -> pl.DataFrame:
         """
         Compute mean forward return by signal quantile (long-short analysis).
 
         Splits the universe into N quantiles by signal value at each date,
-        then computes the mean forward return for each quantile.
+        then computes the mean forward return for each quantile, pooled
+        over all (date, stock) observations.
 
         Args:
             horizon: Forecast horizon in days.
@@ -251,37 +280,158 @@ class FactorAnalyzer:
         Returns:
             DataFrame with columns (quantile, mean_return, n_observations)
         """
-        return_col = f"forward_return_{horizon}d"
-        if return_col not in self._merged.columns:
-            raise ValueError(f"Column '{return_col}' not found.")
-
-        valid = self._merged.filter(
-            pl.col("value").is_not_null()
-            & pl.col("value").is_finite()
-            & pl.col(return_col).is_not_null()
-            & pl.col(return_col).is_finite()
-        )
-
-        # Assign quantiles cross-sectionally
-        quantiled = valid.with_columns(
-            pl.col("value")
-            .qcut(n_quantiles, labels=[str(i + 1) for i in range(n_quantiles)])
-            .over("date")
-            .alias("quantile")
-        )
-
-        result = (
-            quantiled.group_by("quantile")
+        return_col = self._return_col(horizon)
+        count = pl.col(f"n_{return_col}")
+        return (
+            self._quantile_means(n_quantiles)
+            .group_by("quantile")
             .agg(
                 [
-                    pl.col(return_col).mean().alias("mean_return"),
-                    pl.col(return_col).count().alias("n_observations"),
+                    ((pl.col(return_col) * count).sum() / count.sum()).alias(
+                        "mean_return"
+                    ),
+                    count.sum().alias("n_observations"),
                 ]
             )
+            .filter(pl.col("n_observations") > 0)
             .sort("quantile")
         )
 
-        return result
+    def quantile_return_matrix(
+        self, horizon: int = 5, n_quantiles: int = 5
+    ) -> pl.DataFrame:
+        """
+        Mean forward return of each quantile portfolio at each date.
+
+        All horizons are aggregated in one pass and memoized, so every
+        quantile view below is a cheap reshape of the same matrix.
+
+        Returns:
+            DataFrame with columns (date, q1, ..., q{n_quantiles}); null where
+            a quantile has no stock with a valid return on that date.
+        """
+        return_col = self._return_col(horizon)
+        return _by_quantile(self._quantile_means(n_quantiles), return_col, n_quantiles)
+
+    def quantile_spread(self, horizon: int = 5, n_quantiles: int = 5) -> pl.DataFrame:
+        """
+        Top-minus-bottom quantile return at each date.
+
+        Returns:
+            DataFrame with columns (date, spread) — q{n_quantiles} - q1.
+        """
+        matrix = self.quantile_return_matrix(horizon, n_quantiles)
+        return matrix.select(
+            "date", (pl.col(f"q{n_quantiles}") - pl.col("q1")).alias("spread")
+        )
+
+    def quantile_cumulative_returns(
+        self, horizon: int = 1, n_quantiles: int = 5
+    ) -> pl.DataFrame:
+        """
+        Cumulative return of each quantile portfolio, rebalanced daily.
+
+        For horizon > 1 the overlapping h-day returns are converted to a
+        daily rate (1 + r)^(1/h) - 1 before compounding.  Dates where a
+        quantile has no return count as 0.
+
+        Returns:
+            DataFrame with columns (date, q1, ..., q{n_quantiles}).
+        """
+        matrix = self.quantile_return_matrix(horizon, n_quantiles)
+        quantiles = [f"q{q}" for q in range(1, n_quantiles + 1)]
+        return matrix.select(
+            "date",
+            *[
+                (
+                    ((1 + pl.col(q)) ** (1 / horizon)).fill_null(1.0).cum_prod() - 1
+                ).alias(q)
+                for q in quantiles
+            ],
+        )
+
+    def quantile_monotonicity(
+        self, horizon: int = 5, n_quantiles: int = 5
+    ) -> pl.DataFrame:
+        """
+        Rank correlation between quantile and quantile return at each date.
+
+        +1: returns rise strictly from q1 to the top quantile; -1: they
+        fall strictly; near 0: no ordering.
+
+        Returns:
+            DataFrame with columns (date, monotonicity).
+        """
+        matrix = self.quantile_return_matrix(horizon, n_quantiles)
+        returns = matrix.drop("date").to_numpy().astype(np.float64)
+        order = np.broadcast_to(np.arange(1.0, n_quantiles + 1), returns.shape)
+        return matrix.select("date").with_columns(
+            pl.Series("monotonicity", spearman(order, returns, min_observations=2))
+        )
+
+    def quantile_turnover(self, n_quantiles: int = 5) -> pl.DataFrame:
+        """
+        Share of each quantile's stocks that were not in it the day before.
+
+        A stock's previous quantile is the one at its previous date in the
+        sample; a stock's first date is not counted.
+
+        Returns:
+            DataFrame with columns (date, q1, ..., q{n_quantiles}).
+        """
+        changes = (
+            self.quantile_assignments(n_quantiles)
+            .sort(["ticker", "date"])
+            .with_columns(pl.col("quantile").shift(1).over("ticker").alias("_prev"))
+            .filter(pl.col("_prev").is_not_null())
+            .group_by(["date", "quantile"])
+            .agg((pl.col("_prev") != pl.col("quantile")).mean().alias("turnover"))
+        )
+        return _by_quantile(changes, "turnover", n_quantiles)
+
+    def _return_col(self, horizon: int) -> str:
+        return_col = f"forward_return_{horizon}d"
+        if return_col not in self._merged.columns:
+            raise ValueError(f"Column '{return_col}' not found.")
+        return return_col
+
+    def _quantiled(self, n_quantiles: int) -> pl.DataFrame:
+        """Signal rows with their quantile; non-finite returns set to null."""
+        if n_quantiles < 1:
+            raise ValueError(f"n_quantiles must be at least 1, got {n_quantiles}.")
+        return_cols = [c for c in self._merged.columns if c.startswith("forward_")]
+        signal = self._merged.filter(
+            pl.col("value").is_not_null() & pl.col("value").is_finite()
+        )
+        return cross_sectional_ranks(signal, "value").select(
+            "date",
+            "ticker",
+            (
+                ((pl.col("rank") - 1) * n_quantiles / pl.col("n"))
+                .floor()
+                .cast(pl.Int32)
+                + 1
+            ).alias("quantile"),
+            *[
+                pl.when(pl.col(c).is_finite()).then(pl.col(c)).alias(c)
+                for c in return_cols
+            ],
+        )
+
+    def _quantile_means(self, n_quantiles: int) -> pl.DataFrame:
+        """(date, quantile) mean return and count of every horizon, memoized."""
+        if n_quantiles not in self._quantile_cache:
+            quantiled = self._quantiled(n_quantiles)
+            return_cols = quantiled.columns[3:]
+            self._quantile_cache[n_quantiles] = (
+                quantiled.group_by(["date", "quantile"])
+                .agg(
+                    [pl.col(c).mean() for c in return_cols]
+                    + [pl.col(c).count().alias(f"n_{c}") for c in return_cols]
+                )
+                .sort(["date", "quantile"])
+            )
+        return self._quantile_cache[n_quantiles]
 
     def summary(self, horizon: int = 5, print_output: bool = True) -> Dict:
         """
@@ -334,3 +484,52 @@ class FactorAnalyzer:
             print()
 
         return result
+
+
+def ic_summary_stats(ic: pl.Series) -> Dict[str, float]:
+    """
+    Mean, std, IR, t-stat, hit rate and count of an IC series (nulls dropped).
+    """
+    ic_arr = ic.drop_nulls().to_numpy()
+    n = len(ic_arr)
+    if n == 0:
+        return {
+            "mean_ic": 0.0,
+            "std_ic": 0.0,
+            "ir": 0.0,
+            "t_stat": 0.0,
+            "hit_rate": 0.0,
+            "n_dates": 0,
+        }
+
+    mean_ic = float(np.mean(ic_arr))
+    std_ic = float(np.std(ic_arr, ddof=1))
+    ir = mean_ic / std_ic if std_ic > 0 else 0.0
+    t_stat = mean_ic / (std_ic / np.sqrt(n)) if std_ic > 0 else 0.0
+    hit_rate = float(np.mean(ic_arr > 0)) * 100  # % of dates with positive IC
+
+    return {
+        "mean_ic": mean_ic,
+        "std_ic": std_ic,
+        "ir": ir,
+        "t_stat": t_stat,
+        "hit_rate": hit_rate,
+        "n_dates": n,
+    }
+
+
+# ── Internal ──────────────────────────────────────────────────────────────────
+
+
+def _by_quantile(long: pl.DataFrame, values: str, n_quantiles: int) -> pl.DataFrame:
+    """(date, quantile, values) long frame → (date, q1, ..., qN) matrix."""
+    wide = long.pivot(on="quantile", index="date", values=values).sort("date")
+    return wide.select(
+        "date",
+        *[
+            (pl.col(str(q)) if str(q) in wide.columns else pl.lit(None, pl.Float64))
+            .cast(pl.Float64)
+            .alias(f"q{q}")
+            for q in range(1, n_quantiles + 1)
+        ],
+    )
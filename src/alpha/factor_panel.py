@@ -0,0 +1,265 @@
+"""
+Factor Panel — IC and correlation analysis for many factors at once.
+
+``FactorAnalyzer`` evaluates one signal; a factor zoo of K factors would
+need K analyzers, each re-joining the returns frame.  ``FactorPanel``
+aligns all factors and the forward returns once into dense arrays
+
+    X: (dates × tickers × K)  factor values
+    R: (dates × tickers × H)  forward returns
+
+and computes everything with vectorized NumPy over those arrays:
+
+    - IC matrix (K × H): mean IC, std, IR, t-stat per factor and horizon,
+      with the same per-date Spearman IC as ``FactorAnalyzer.ic_series``.
+    - Factor correlation (K × K): time-averaged cross-sectional rank
+      correlation, plus the per-date correlation series of any pair.
+
+Usage:
+    from alpha.factor_panel import FactorPanel
+
+    panel = FactorPanel({"mom": mom_df, "vol": vol_df}, forward_returns)
+    panel.ic_matrix()               # factor × horizon mean IC
+    panel.ic_summary()              # long: factor, horizon, mean_ic, ir, ...
+    panel.factor_correlation()      # factor × factor mean rank correlation
+    panel.factor_correlation_series("mom", "vol")
+
+Missing values: a factor's IC at a date is computed over the stocks where
+both the factor and the return are valid (ranks are recomputed on that
+set, as in ``FactorAnalyzer``).  Factor correlations use each factor's
+cross-sectional rank over its own valid stocks, correlated over the
+stocks where both factors are valid.
+
+Memory: X holds dates × tickers × K float64 values (e.g. 2,500 dates ×
+500 tickers × 100 factors ≈ 1 GB).
+
+Reference: guidance/quant_lab.pdf — Part III, Chapter 10 (Factor Evaluation)
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import polars as pl
+
+from alpha.factor_analyzer import ic_summary_stats
+from alpha.spearman import average_ranks, spearman
+
+
+class FactorPanel:
+    """
+    Dense (date × ticker × factor) panel aligned with forward returns.
+
+    Args:
+        factors: Factor name → DataFrame with columns (date, ticker, value).
+        returns: DataFrame with columns (date, ticker, forward_return_1d, ...).
+                 Output of compute_forward_returns().  Its (date, ticker)
+                 grid defines the panel.
+        horizons: Horizons to evaluate (default: every forward_return_{h}d
+                  column in ``returns``).
+        min_observations: Minimum number of stocks per date for an IC or a
+                          correlation value (default: 30).
+    """
+
+    def __init__(
+        self,
+        factors: Dict[str, pl.DataFrame],
+        returns: pl.DataFrame,
+        horizons: Optional[List[int]] = None,
+        min_observations: int = 30,
+    ):
+        if not factors:
+            raise ValueError("At least one factor required.")
+        if horizons is None:
+            horizons = sorted(
+                int(c[len("forward_return_") : -1])
+                for c in returns.columns
+                if c.startswith("forward_return_") and c.endswith("d")
+            )
+        missing = [h for h in horizons if f"forward_return_{h}d" not in returns.columns]
+        if missing:
+            raise ValueError(f"Columns for horizons {missing} not found in returns.")
+
+        self.names = list(factors)
+        self.horizons = list(horizons)
+        self.min_observations = min_observations
+
+        # ── align once: integer (date, ticker) coordinates ──
+        self.dates = returns["date"].unique().sort()
+        self.tickers = returns["ticker"].unique().sort()
+        date_idx = pl.DataFrame({"date": self.dates}).with_row_index("_d")
+        ticker_idx = pl.DataFrame({"ticker": self.tickers}).with_row_index("_t")
+        shape = (len(self.dates), len(self.tickers))
+
+        def scatter(frame: pl.DataFrame, columns: List[str]) -> np.ndarray:
+            located = frame.join(date_idx, on="date").join(ticker_idx, on="ticker")
+            out = np.full(shape + (len(columns),), np.nan)
+            d = located["_d"].to_numpy()
+            t = located["_t"].to_numpy()
+            for j, col in enumerate(columns):
+                out[d, t, j] = (
+                    located[col].cast(pl.Float64).fill_null(np.nan).to_numpy()
+                )
+            out[~np.isfinite(out)] = np.nan
+            return out
+
+        self.X = np.concatenate(
+            [
+                scatter(f.select("date", "ticker", "value"), ["value"])
+                for f in factors.values()
+            ],
+            axis=2,
+        )
+        self.R = scatter(returns, [f"forward_return_{h}d" for h in self.horizons])
+
+        self._ic: Optional[np.ndarray] = None
+        self._corr: Optional[np.ndarray] = None
+
+    # ── IC ────────────────────────────────────────────────────────────────
+
+    def ic_tensor(self) -> np.ndarray:
+        """Per-date IC, shape (dates, K, H); NaN where fewer than
+        ``min_observations`` stocks are valid."""
+        if self._ic is None:
+            # (dates, K, tickers) layout: the ticker axis is last
+            x = np.ascontiguousarray(self.X.transpose(0, 2, 1))
+            x_ranks = average_ranks(x)
+            ic = np.empty((len(self.dates), len(self.names), len(self.horizons)))
+            for h in range(len(self.horizons)):
+                # each return is ranked once and shared by the K factors
+                r = self.R[:, None, :, h]
+                ic[:, :, h] = spearman(
+                    x,
+                    np.broadcast_to(r, x.shape),
+                    self.min_observations,
+                    x_ranks=x_ranks,
+                    y_ranks=np.broadcast_to(average_ranks(r), x.shape),
+                )
+            self._ic = ic
+        return self._ic
+
+    def ic_series(self, factor: str, horizon: int = 5) -> pl.DataFrame:
+        """
+        IC time series of one factor, as ``FactorAnalyzer.ic_series``.
+
+        Returns:
+            DataFrame with columns (date, ic) — dates with enough stocks.
+        """
+        k = self.names.index(factor)
+        h = self.horizons.index(horizon)
+        counts = (~np.isnan(self.X[:, :, k]) & ~np.isnan(self.R[:, :, h])).sum(axis=1)
+        keep = (counts >= self.min_observations) & (counts > 0)
+        return pl.DataFrame(
+            {
+                "date": self.dates.filter(pl.Series(keep)),
+                "ic": self.ic_tensor()[keep, k, h],
+            }
+        )
+
+    def ic_summary(self) -> pl.DataFrame:
+        """
+        IC statistics for every (factor, horizon).
+
+        Returns:
+            DataFrame with columns (factor, horizon, mean_ic, std_ic, ir,
+            t_stat, hit_rate, n_dates).
+        """
+        rows = []
+        for name in self.names:
+            for horizon in self.horizons:
+                ic = self.ic_series(name, horizon)["ic"]
+                rows.append(
+                    {"factor": name, "horizon": horizon, **ic_summary_stats(ic)}
+                )
+        return pl.DataFrame(rows)
+
+    def ic_matrix(self, metric: str = "mean_ic") -> pl.DataFrame:
+        """
+        K × H matrix of one IC statistic.
+
+        Args:
+            metric: Column of ``ic_summary`` (mean_ic, std_ic, ir, t_stat,
+                    hit_rate, n_dates).
+
+        Returns:
+            DataFrame with a ``factor`` column and one ``ic_{h}d`` column
+            per horizon.
+        """
+        summary = self.ic_summary()
+        if metric not in summary.columns or metric in ("factor", "horizon"):
+            raise ValueError(f"Unknown metric '{metric}'.")
+        return summary.pivot(on="horizon", index="factor", values=metric).rename(
+            {str(h): f"ic_{h}d" for h in self.horizons}
+        )
+
+    # ── factor correlation ────────────────────────────────────────────────
+
+    def rank_correlation_tensor(self) -> np.ndarray:
+        """Per-date cross-sectional rank correlation, shape (dates, K, K)."""
+        if self._corr is None:
+            valid = ~np.isnan(self.X)
+            w = valid.astype(np.float64)
+            ranks = average_ranks(self.X.transpose(0, 2, 1)).transpose(0, 2, 1)
+            ranks = np.where(valid, ranks, 0.0)
+            # pairwise-complete sums over the stocks where both are valid
+            n = np.einsum("dnk,dnl->dkl", w, w)
+            sx = np.einsum("dnk,dnl->dkl", ranks, w)
+            sxx = np.einsum("dnk,dnl->dkl", ranks**2, w)
+            sxy = np.einsum("dnk,dnl->dkl", ranks, ranks)
+            sy = sx.transpose(0, 2, 1)
+            syy = sxx.transpose(0, 2, 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cov = sxy - sx * sy / n
+                var = (sxx - sx**2 / n) * (syy - sy**2 / n)
+                corr = cov / np.sqrt(var)
+            corr[(n < self.min_observations) | (n == 0)] = np.nan
+            self._corr = corr
+        return self._corr
+
+    def factor_correlation(self) -> pl.DataFrame:
+        """
+        Time-averaged K × K cross-sectional rank correlation.
+
+        Returns:
+            DataFrame with a ``factor`` column and one column per factor.
+        """
+        with np.errstate(invalid="ignore"):
+            # dates without enough stocks are NaN and ignored
+            mean = np.nanmean(self.rank_correlation_tensor(), axis=0)
+        return pl.DataFrame(
+            {
+                "factor": self.names,
+                **{name: mean[:, k] for k, name in enumerate(self.names)},
+            }
+        )
+
+    def factor_correlation_series(
+        self, factor_a: Optional[str] = None, factor_b: Optional[str] = None
+    ) -> pl.DataFrame:
+        """
+        Per-date rank correlation between factors.
+
+        Args:
+            factor_a, factor_b: A factor pair.  If omitted, every pair
+                                (a < b in panel order) is returned.
+
+        Returns:
+            (date, corr) for one pair, or (date, factor_a, factor_b, corr)
+            for all pairs.
+        """
+        corr = self.rank_correlation_tensor()
+        if factor_a is not None and factor_b is not None:
+            a, b = self.names.index(factor_a), self.names.index(factor_b)
+            return pl.DataFrame({"date": self.dates, "corr": corr[:, a, b]})
+        a, b = np.triu_indices(len(self.names), k=1)
+        names = np.array(self.names)
+        n_dates = len(self.dates)
+        return pl.DataFrame(
+            {
+                "date": (
+                    pl.concat([self.dates] * len(a)) if len(a) else self.dates.clear()
+                ),
+                "factor_a": np.repeat(names[a], n_dates),
+                "factor_b": np.repeat(names[b], n_dates),
+                "corr": corr[:, a, b].T.ravel(),
+            }
+        )
@@ -0,0 +1,288 @@
+"""
+Alpha 101 Operators — composable Polars expressions.
+
+Every operator takes ``pl.Expr`` (or a column name) and returns a
+``pl.Expr``, so a formula reads like the paper and evaluates as one
+Polars query — no per-ticker Python lambdas, no pandas round-trip::
+
+    from alpha.operators import cs_rank, delay, signed_power, ts_argmax
+
+    ret = pl.col("close") / delay("close", 1) - 1
+    ohlcv.sort(["ticker", "timestamps"]).with_columns(
+        cs_rank(ts_argmax(signed_power(ret, 2), 5)).alias("value")
+    )
+
+Conventions:
+    - Time-series ops (``delay``, ``ts_*``, ``decay_linear``) window per
+      ticker ``by``; rows of each ticker must be in date order (e.g. the
+      frame sorted by [ticker, date]).
+    - Cross-sectional ops (``cs_*``) group rows by the date column ``by``.
+    - A ts window of ``d`` rows is null until ``d`` non-null values are
+      available (pandas ``rolling(d, min_periods=d)``).
+    - NaN is treated as missing by the rank operators, as in pandas.
+    - Results are Float64, except ``delay``, ``sign`` and ``signed_power``,
+      which follow their input.
+
+Each windowed operator is a native ``build(x).over(by)`` expression when
+its inputs are element-wise expressions of columns (``ts_sum("close", 5)``,
+``cs_rank(pl.col("volume").log())``), so Polars can push predicates and
+projections through it and fuse it into a lazy plan.  Polars evaluates the
+whole tree under a window once per group, though, so an input that holds a
+window itself — i.e. another operator — is materialised first with
+``pl.map_batches`` and the window is applied to the resulting column:
+
+    - a window on another key would be wrong: ``rank().over(date)`` around
+      ``shift().over(ticker)`` shifts within each date;
+    - a window on the same key is re-run inside every group, once per
+      reference (ts_argmax(x, 5) reads x six times): ~10x slower than
+      materialising on 500 tickers × 252 days.
+
+Aggregations and Python UDFs are materialised for the same reason.
+
+ts_rank / ts_argmax / ts_argmin / ts_product are built from ``d`` lagged
+copies of ``x`` combined element-wise, which keeps them fully vectorised
+(cost O(n·d)) instead of calling a Python function per window.
+
+Reference: https://arxiv.org/abs/1601.00991  Table 2 & 3
+"""
+
+from __future__ import annotations
+
+import json
+from functools import reduce
+from operator import mul
+from typing import Any, Callable, Union
+
+import polars as pl
+
+from constants import OHLCV_DATE_COL, TICKER_COL
+
+IntoExpr = Union[pl.Expr, str]
+
+
+def _expr(x: IntoExpr) -> pl.Expr:
+    return pl.col(x) if isinstance(x, str) else x
+
+
+def _apply(
+    build: Callable[..., pl.Expr],
+    by: str,
+    *inputs: IntoExpr,
+    dtype: pl.DataType | None = pl.Float64,
+) -> pl.Expr:
+    """``build(*inputs).over(by)`` — natively if every input is
+    element-wise, else on the materialised inputs.
+
+    ``dtype=None`` keeps the dtype of the first input.
+    """
+    exprs = [_expr(x) for x in inputs]
+    if all(_elementwise(x) for x in exprs):
+        result = build(*exprs).over(by)
+        return result if dtype is None else result.cast(dtype)
+
+    names = [f"_x{i}" for i in range(len(exprs))]
+
+    def kernel(series: list[pl.Series]) -> pl.Series:
+        frame = pl.DataFrame(dict(zip(names + ["_by"], series)))
+        result = build(*[pl.col(n) for n in names]).over("_by")
+        if dtype is not None:
+            result = result.cast(dtype)
+        return frame.select(result).to_series()
+
+    return pl.map_batches([*exprs, pl.col(by)], kernel, return_dtype=dtype)
+
+
+# Functions whose value at a row depends on that row only
+_ELEMENTWISE = {
+    "Abs",
+    "Clip",
+    "Exp",
+    "FillNull",
+    "Log",
+    "Log1p",
+    "MaxHorizontal",
+    "MeanHorizontal",
+    "MinHorizontal",
+    "Negate",
+    "Pow",
+    "Round",
+    "Sign",
+    "SumHorizontal",
+}
+_ELEMENTWISE_BOOLEAN = {
+    "IsFinite",
+    "IsInfinite",
+    "IsNan",
+    "IsNotNan",
+    "IsNotNull",
+    "IsNull",
+    "Not",
+}
+
+
+def _elementwise(x: pl.Expr) -> bool:
+    """True if every row of *x* depends on that row only, so evaluating it
+    per window group changes nothing (and costs nothing extra)."""
+    try:
+        tree = json.loads(x.meta.serialize(format="json"))
+    except Exception:  # unserialisable input: materialise it
+        return False
+    return _elementwise_node(tree)
+
+
+def _elementwise_node(node: Any) -> bool:
+    if not isinstance(node, dict) or len(node) != 1:
+        return False
+    ((kind, body),) = node.items()
+    if kind == "Column":
+        return True
+    if kind == "Literal":
+        return isinstance(body, dict) and ("Dyn" in body or "Scalar" in body)
+    if kind == "Alias":
+        return _elementwise_node(body[0])
+    if kind == "Cast":
+        return _elementwise_node(body["expr"])
+    if kind == "BinaryExpr":
+        return _elementwise_node(body["left"]) and _elementwise_node(body["right"])
+    if kind == "Ternary":
+        return all(_elementwise_node(body[k]) for k in ("predicate", "truthy", "falsy"))
+    if kind == "Function":
+        function = body["function"]
+        if isinstance(function, str):
+            elementwise = function in _ELEMENTWISE
+        else:
+            ((name, option),) = function.items()
+            elementwise = name in _ELEMENTWISE or (
+                name == "Boolean" and option in _ELEMENTWISE_BOOLEAN
+            )
+        return elementwise and all(_elementwise_node(i) for i in body["input"])
+    return False
+
+
+def _full_window(x: pl.Expr, d: int) -> pl.Expr:
+    """True where the last d values of x are all non-null."""
+    return x.is_not_null().cast(pl.UInt32).rolling_sum(d) == d
+
+
+# ── element-wise ──────────────────────────────────────────────────────────────
+
+
+def sign(x: IntoExpr) -> pl.Expr:
+    return _expr(x).sign()
+
+
+def signed_power(x: IntoExpr, a: float) -> pl.Expr:
+    """sign(x) · |x|^a."""
+    x = _expr(x)
+    return x.sign() * x.abs().pow(a)
+
+
+# ── time-series (per ticker) ──────────────────────────────────────────────────
+
+
+def delay(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Value of *x* d days ago (per ticker)."""
+    return _apply(lambda c: c.shift(d), by, x, dtype=None)
+
+
+def delta(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """x - delay(x, d)."""
+    return _apply(lambda c: c - c.shift(d), by, x)
+
+
+def ts_sum(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    return _apply(lambda c: c.rolling_sum(d), by, x)
+
+
+def ts_product(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    return _apply(lambda c: reduce(mul, [c.shift(k) for k in range(d)]), by, x)
+
+
+def ts_min(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    return _apply(lambda c: c.rolling_min(d), by, x)
+
+
+def ts_max(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    return _apply(lambda c: c.rolling_max(d), by, x)
+
+
+def ts_stddev(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Rolling sample standard deviation (ddof=1)."""
+    return _apply(lambda c: c.rolling_std(d), by, x)
+
+
+def ts_corr(x: IntoExpr, y: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """correlation(x, y, d) = time-serial correlation of x and y for the past d days"""
+    return _apply(
+        lambda a, b: pl.rolling_corr(a, b, window_size=d, min_samples=d), by, x, y
+    )
+
+
+def ts_cov(x: IntoExpr, y: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Rolling sample covariance (ddof=1) of x and y over the past d days."""
+    return _apply(
+        lambda a, b: pl.rolling_cov(a, b, window_size=d, min_samples=d), by, x, y
+    )
+
+
+def _arg_extreme(c: pl.Expr, d: int, maximum: bool) -> pl.Expr:
+    c = c.fill_nan(None)
+    extreme = c.rolling_max(d) if maximum else c.rolling_min(d)
+    # Oldest lag first so ties resolve to the earliest bar, like np.argmax
+    position = pl.when(c.shift(d - 1) == extreme).then(0)
+    for k in range(1, d):
+        position = position.when(c.shift(d - 1 - k) == extreme).then(k)
+    return position
+
+
+def ts_argmax(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Position (0-based from window start) of max in last d bars."""
+    return _apply(lambda c: _arg_extreme(c, d, maximum=True), by, x)
+
+
+def ts_argmin(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Position (0-based from window start) of min in last d bars."""
+    return _apply(lambda c: _arg_extreme(c, d, maximum=False), by, x)
+
+
+def _rank_last(c: pl.Expr, d: int) -> pl.Expr:
+    c = c.fill_nan(None)
+    lags = [c.shift(k) for k in range(1, d)]
+    below = pl.sum_horizontal([lag < c for lag in lags])
+    tied = pl.sum_horizontal([lag == c for lag in lags])
+    return pl.when(_full_window(c, d)).then(1 + below + tied / 2)
+
+
+def ts_rank(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Rank (1..d, ties averaged) of today's x within its last d values."""
+    return _apply(lambda c: _rank_last(c, d), by, x)
+
+
+def decay_linear(x: IntoExpr, d: int, by: str = TICKER_COL) -> pl.Expr:
+    """Weighted average of the last d values, weights d, d-1, ..., 1 (newest first)."""
+    total = d * (d + 1) / 2
+    weights = [k / total for k in range(1, d + 1)]  # oldest → newest
+    return _apply(lambda c: c.rolling_sum(d, weights=weights), by, x)
+
+
+# ── cross-sectional (per date) ────────────────────────────────────────────────
+
+
+def _pct_rank(c: pl.Expr) -> pl.Expr:
+    c = c.fill_nan(None)
+    return c.rank("average") / c.count()
+
+
+def cs_rank(x: IntoExpr, by: str = OHLCV_DATE_COL) -> pl.Expr:
+    """Cross-sectional percentile rank (0–1] per date, ties averaged."""
+    return _apply(_pct_rank, by, x)
+
+
+def cs_scale(x: IntoExpr, a: float = 1.0, by: str = OHLCV_DATE_COL) -> pl.Expr:
+    """Rescale so that sum(|x|) = a per date."""
+    return _apply(lambda c: c * a / c.abs().sum(), by, x)
+
+
+def cs_zscore(x: IntoExpr, by: str = OHLCV_DATE_COL) -> pl.Expr:
+    """(x − mean) / std per date."""
+    return _apply(lambda c: (c - c.mean()) / c.std(), by, x)
@@ -0,0 +1,202 @@
+"""
+Factor Orthogonalization — strip known exposures out of a new factor.
+
+A new factor is only interesting for what the existing ones do not already
+explain.  Per date, regress it cross-sectionally on the existing factors
+and keep the residual:
+
+    new_orth = new - (alpha + beta · old)        (one regression per date)
+
+Instead of one ``lstsq`` call per date, all dates are solved in one batch:
+the factors are aligned into dense (dates × tickers) arrays, the normal
+equations X'X β = X'y are stacked into a (dates, K, K) tensor and solved
+with a single ``np.linalg.solve``.
+
+    - Missing tickers: a stock enters a date's regression only if the new
+      factor and every existing factor are valid for it; other stocks get
+      no residual on that date.
+    - Ridge: ``ridge`` > 0 adds λ·I to X'X (intercept not penalized), which
+      keeps nearly collinear factors stable.
+    - Dates with fewer than ``min_observations`` usable stocks are dropped.
+
+Usage:
+    from alpha.orthogonalization import orthogonalize, orthogonalize_factors
+
+    residual = orthogonalize(new_factor, [momentum, value])
+    orth = orthogonalize_factors([momentum, value, quality])   # Gram-Schmidt
+
+Reference: guidance/quant_lab.pdf — Part III, Chapter 12 (Factor Combination)
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+
+def orthogonalize(
+    factor: pl.DataFrame,
+    others: List[pl.DataFrame],
+    ridge: float = 0.0,
+    min_observations: Optional[int] = None,
+    value_col: str = "value",
+    date_col: str = "date",
+    ticker_col: str = "ticker",
+) -> pl.DataFrame:
+    """
+    Residual of ``factor`` after a per-date regression on ``others``.
+
+    Args:
+        factor: Factor to orthogonalize, with (date, ticker, value).
+        others: Factors to regress on, each with (date, ticker, value).
+        ridge: Ridge penalty λ added to the diagonal of X'X (default: 0, OLS).
+        min_observations: Minimum usable stocks per date (default: K + 2,
+                          i.e. at least one residual degree of freedom).
+        value_col: Signal column name in factor DataFrames.
+        date_col: Date column name.
+        ticker_col: Ticker column name.
+
+    Returns:
+        DataFrame with columns (date, ticker, value) — the residuals, for
+        the stocks that were in the regression.
+    """
+    if not others:
+        return factor.select(date_col, ticker_col, value_col)
+
+    merged = factor.select(date_col, ticker_col, pl.col(value_col).alias("_y"))
+    for i, other in enumerate(others):
+        merged = merged.join(
+            other.select(date_col, ticker_col, pl.col(value_col).alias(f"_x{i}")),
+            on=[date_col, ticker_col],
+            how="left",
+        )
+    merged = merged.sort(date_col, ticker_col)
+    x_cols = [f"_x{i}" for i in range(len(others))]
+
+    (y, x), rows = _to_dense(merged, ["_y"], x_cols, date_col=date_col)
+    if min_observations is None:
+        min_observations = len(others) + 2
+    residual = cross_sectional_residuals(
+        y[:, :, 0], x, ridge=ridge, min_observations=min_observations
+    )
+
+    return (
+        merged.select(date_col, ticker_col)
+        .with_columns(pl.Series(value_col, residual[rows]))
+        .filter(pl.col(value_col).is_not_nan())
+    )
+
+
+def orthogonalize_factors(
+    factors: List[pl.DataFrame],
+    ridge: float = 0.0,
+    min_observations: Optional[int] = None,
+    value_col: str = "value",
+    date_col: str = "date",
+    ticker_col: str = "ticker",
+) -> List[pl.DataFrame]:
+    """
+    Sequential (Gram-Schmidt) orthogonalization in list order.
+
+    The first factor is kept as is; factor k is replaced by its residual on
+    factors 0..k-1, so earlier factors take priority for shared exposure.
+
+    Args:
+        factors: Factor DataFrames, each with (date, ticker, value).
+        ridge, min_observations, value_col, date_col, ticker_col:
+            As in ``orthogonalize``.
+
+    Returns:
+        List of factor DataFrames with columns (date, ticker, value).
+    """
+    return [
+        orthogonalize(
+            f,
+            factors[:k],
+            ridge=ridge,
+            min_observations=min_observations,
+            value_col=value_col,
+            date_col=date_col,
+            ticker_col=ticker_col,
+        )
+        for k, f in enumerate(factors)
+    ]
+
+
+def cross_sectional_residuals(
+    y: np.ndarray,
+    x: np.ndarray,
+    ridge: float = 0.0,
+    min_observations: int = 2,
+) -> np.ndarray:
+    """
+    Batched per-date OLS / ridge residuals, with an intercept.
+
+    Args:
+        y: (D, N) dependent variable; NaN = missing.
+        x: (D, N, K) regressors; NaN = missing.
+        ridge: Ridge penalty on the slopes (intercept not penalized).
+        min_observations: Minimum usable stocks per date.
+
+    Returns:
+        (D, N) residuals; NaN where the stock or the date was not usable.
+    """
+    d, n, k = x.shape
+    mask = ~np.isnan(y) & ~np.isnan(x).any(axis=2)
+    counts = mask.sum(axis=1)
+
+    # design matrix with intercept, zeroed outside the mask
+    design = np.concatenate([np.ones((d, n, 1)), x], axis=2)
+    design = np.where(mask[:, :, None], design, 0.0)
+    target = np.where(mask, y, 0.0)
+
+    xtx = np.einsum("dnk,dnl->dkl", design, design)
+    xty = np.einsum("dnk,dn->dk", design, target)
+    xtx[:, 1:, 1:] += ridge * np.eye(k)
+
+    usable = counts >= max(min_observations, 1)
+    # unusable dates get an identity system, masked out below
+    xtx[~usable] = np.eye(k + 1)
+    try:
+        beta = np.linalg.solve(xtx, xty[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        # exactly collinear factors on some date (ridge = 0)
+        beta = np.einsum("dkl,dl->dk", np.linalg.pinv(xtx), xty)
+
+    residual = y - np.einsum("dnk,dk->dn", design, beta)
+    residual[~(mask & usable[:, None])] = np.nan
+    return residual
+
+
+# ── Internal ──────────────────────────────────────────────────────────────────
+
+
+def _to_dense(
+    merged: pl.DataFrame, *column_groups: List[str], date_col: str
+) -> Tuple[List[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Scatter a date-sorted long frame into (dates, max tickers per date, K)
+    arrays, one per column group.
+
+    Returns:
+        The arrays and the (date index, slot) of each row of ``merged``.
+    """
+    located = merged.select(
+        pl.col(date_col).rle_id().alias("_d"),
+        pl.int_range(pl.len()).over(date_col).alias("_s"),
+    )
+    rows = (located["_d"].to_numpy(), located["_s"].to_numpy())
+    shape = (
+        (int(rows[0].max()) + 1, int(rows[1].max()) + 1) if merged.height else (0, 0)
+    )
+
+    arrays = []
+    for columns in column_groups:
+        out = np.full(shape + (len(columns),), np.nan)
+        for j, col in enumerate(columns):
+            out[rows[0], rows[1], j] = (
+                merged[col].cast(pl.Float64).fill_null(np.nan).to_numpy()
+            )
+        out[~np.isfinite(out)] = np.nan
+        arrays.append(out)
+    return arrays, rows
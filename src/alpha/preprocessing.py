@@ -20,13 +20,163 @@ Usage:
         method="zscore",         # or "rank"
     )
 
+The winsorize / normalize steps are also available as expressions
+(``winsorize_expr``, ``zscore_expr``, ``rank_normalize_expr``,
+``preprocess_expr``) so several factors can be preprocessed side by side
+in one lazy query.  ``preprocess_columns`` does that for a wide
+(date, ticker, f_1, ..., f_k) frame, neutralization included: each step
+is one ``with_columns`` over all K columns, so the per-date partition is
+built once per step instead of once per factor.  Invalid values are
+nulled instead of dropped there; every step ignores nulls, so each column
+matches ``preprocess_factor``.
+
 Reference: guidance/quant_lab.pdf — Part III, Chapter 11 (Factor Construction)
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, TypeVar, Union
 
 import polars as pl
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# Sector column joined into wide frames (kept clear of factor names)
+_SECTOR = "__sector"
+
+
+# ── Expressions ──────────────────────────────────────────────────────────────
+
+
+def winsorize_expr(
+    value: Union[pl.Expr, str], date_col: str = "date", pct: float = 0.01
+) -> pl.Expr:
+    """Clip to the per-date (pct, 1-pct) quantiles."""
+    value = pl.col(value) if isinstance(value, str) else value
+    return value.clip(
+        lower_bound=value.quantile(pct).over(date_col),
+        upper_bound=value.quantile(1.0 - pct).over(date_col),
+    )
+
+
+def zscore_expr(value: Union[pl.Expr, str], date_col: str = "date") -> pl.Expr:
+    """(x - mean_t) / std_t per date."""
+    value = pl.col(value) if isinstance(value, str) else value
+    return (value - value.mean().over(date_col)) / value.std().over(date_col)
+
+
+def rank_normalize_expr(value: Union[pl.Expr, str], date_col: str = "date") -> pl.Expr:
+    """Per-date rank percentile mapped linearly to [-1, 1]."""
+    value = pl.col(value) if isinstance(value, str) else value
+    return (value.rank().over(date_col) - 1) / (
+        value.count().over(date_col) - 1
+    ) * 2 - 1
+
+
+def preprocess_expr(
+    value: Union[pl.Expr, str],
+    winsorize_pct: float = 0.01,
+    method: str = "zscore",
+    date_col: str = "date",
+) -> pl.Expr:
+    """
+    Expression form of ``preprocess_factor`` without neutralization.
+
+    Null / NaN / Inf values become null (and stay null) instead of being
+    dropped, so the expression can run on a wide frame of many factors.
+    """
+    value = pl.col(value) if isinstance(value, str) else value
+    value = pl.when(value.is_finite()).then(value)
+    if winsorize_pct > 0:
+        value = winsorize_expr(value, date_col=date_col, pct=winsorize_pct)
+    if method == "zscore":
+        return zscore_expr(value, date_col=date_col)
+    if method == "rank":
+        return rank_normalize_expr(value, date_col=date_col)
+    raise ValueError(f"Unknown method '{method}'. Use 'zscore' or 'rank'.")
+
+
+def preprocess_columns(
+    frame: FrameT,
+    columns: List[str],
+    sectors: Optional[pl.DataFrame] = None,
+    winsorize_pct: Union[float, Dict[str, float]] = 0.01,
+    method: Union[str, Dict[str, str]] = "zscore",
+    neutralize: Union[List[str], Dict[str, List[str]], None] = None,
+    date_col: str = "date",
+    ticker_col: str = "ticker",
+) -> FrameT:
+    """
+    ``preprocess_factor`` for every factor column of a wide frame.
+
+    Args:
+        frame: Wide (date, ticker, f_1, ..., f_k) DataFrame or LazyFrame.
+        columns: Factor columns to preprocess; other columns pass through.
+        sectors: DataFrame with (ticker, sector).  Required if any column
+                 is sector-neutralized.
+        winsorize_pct, method, neutralize: As in ``preprocess_factor``,
+                 either one setting for all columns or a dict
+                 column → setting (missing columns use the default).
+        date_col: Column name for dates.
+        ticker_col: Column name for tickers.
+
+    Returns:
+        Frame of the same type and columns; null where a factor value was
+        null / NaN / Inf.
+    """
+
+    def setting(value, column, default):
+        return value.get(column, default) if isinstance(value, dict) else value
+
+    methods = {c: setting(method, c, "zscore") for c in columns}
+    for m in methods.values():
+        if m not in ("zscore", "rank"):
+            raise ValueError(f"Unknown method '{m}'. Use 'zscore' or 'rank'.")
+    by_sector = {c for c in columns if "sector" in (setting(neutralize, c, None) or [])}
+    if by_sector:
+        if sectors is None:
+            raise ValueError("sectors DataFrame required for sector neutralization.")
+        sector_map = sectors.select(ticker_col, pl.col("sector").alias(_SECTOR))
+        frame = frame.join(
+            sector_map.lazy() if isinstance(frame, pl.LazyFrame) else sector_map,
+            on=ticker_col,
+            how="left",
+            maintain_order="left",
+        )
+
+    # Step 0-1: null invalid values, winsorize
+    winsorized = []
+    for c in columns:
+        value = pl.when(pl.col(c).is_finite()).then(pl.col(c))
+        pct = setting(winsorize_pct, c, 0.01)
+        if pct > 0:
+            value = winsorize_expr(value, date_col=date_col, pct=pct)
+        winsorized.append(value.alias(c))
+    frame = frame.with_columns(winsorized)
+
+    # Step 2-3: normalize; a z-score's sector demeaning folds into its center
+    # (see ``preprocess_factor``), a rank's needs one more pass
+    normalized = []
+    for c in columns:
+        value = pl.col(c)
+        if methods[c] == "zscore":
+            center = value.mean().over(
+                [date_col, _SECTOR] if c in by_sector else date_col
+            )
+            normalized.append(((value - center) / value.std().over(date_col)).alias(c))
+        else:
+            normalized.append(rank_normalize_expr(value, date_col=date_col).alias(c))
+    frame = frame.with_columns(normalized)
+
+    ranked_by_sector = [c for c in columns if c in by_sector and methods[c] == "rank"]
+    if ranked_by_sector:
+        frame = frame.with_columns(
+            pl.col(ranked_by_sector)
+            - pl.col(ranked_by_sector).mean().over(date_col, _SECTOR)
+        )
+    return frame.drop(_SECTOR) if by_sector else frame
+
+
+# ── DataFrame steps ──────────────────────────────────────────────────────────
+
 
 def winsorize(
     df: pl.DataFrame,
@@ -50,12 +200,7 @@ def winsorize(
         DataFrame with outliers capped.
     """
     return df.with_columns(
-        pl.col(value_col)
-        .clip(
-            lower_bound=pl.col(value_col).quantile(pct).over(date_col),
-            upper_bound=pl.col(value_col).quantile(1.0 - pct).over(date_col),
-        )
-        .alias(value_col)
+        winsorize_expr(value_col, date_col=date_col, pct=pct).alias(value_col)
     )
 
 
@@ -79,12 +224,7 @@ def zscore_normalize(
     Returns:
         DataFrame with z-scored values.
     """
-    return df.with_columns(
-        (
-            (pl.col(value_col) - pl.col(value_col).mean().over(date_col))
-            / pl.col(value_col).std().over(date_col)
-        ).alias(value_col)
-    )
+    return df.with_columns(zscore_expr(value_col, date_col=date_col).alias(value_col))
 
 
 def rank_normalize(
@@ -107,12 +247,7 @@ def rank_normalize(
         DataFrame with rank-normalized values in [-1, 1].
     """
     return df.with_columns(
-        (
-            (pl.col(value_col).rank().over(date_col) - 1)
-            / (pl.col(value_col).count().over(date_col) - 1)
-            * 2
-            - 1
-        ).alias(value_col)
+        rank_normalize_expr(value_col, date_col=date_col).alias(value_col)
     )
 
 
@@ -199,34 +334,47 @@ def preprocess_factor(
     """
     if neutralize is None:
         neutralize = []
-
-    # Step 0: Remove invalid rows
-    df = raw_signal.filter(
-        pl.col(value_col).is_not_null() & pl.col(value_col).is_finite()
-    )
+    if method not in ("zscore", "rank"):
+        raise ValueError(f"Unknown method '{method}'. Use 'zscore' or 'rank'.")
+    if "sector" in neutralize and sectors is None:
+        raise ValueError("sectors DataFrame required for sector neutralization.")
+
+    neutralize_sector = "sector" in neutralize
+    value = pl.col(value_col)
+
+    # Step 0: Remove invalid rows (sectors are joined once, up front)
+    df = raw_signal.lazy().filter(value.is_not_null() & value.is_finite())
+    if neutralize_sector:
+        df = df.join(
+            sectors.lazy().select(ticker_col, "sector"),
+            on=ticker_col,
+            how="left",
+            maintain_order="left",
+        )
 
     # Step 1: Winsorize
     if winsorize_pct > 0:
-        df = winsorize(df, value_col=value_col, date_col=date_col, pct=winsorize_pct)
+        df = df.with_columns(
+            winsorize_expr(value, date_col=date_col, pct=winsorize_pct).alias(value_col)
+        )
 
-    # Step 2: Normalize
+    # Steps 2-3: Normalize and neutralize.  A z-score is affine per date, so
+    # demeaning it within (date, sector) equals centering the winsorized
+    # values on their sector mean: both steps share one window context.
     if method == "zscore":
-        df = zscore_normalize(df, value_col=value_col, date_col=date_col)
-    elif method == "rank":
-        df = rank_normalize(df, value_col=value_col, date_col=date_col)
+        center = value.mean().over(
+            [date_col, "sector"] if neutralize_sector else date_col
+        )
+        df = df.with_columns(
+            ((value - center) / value.std().over(date_col)).alias(value_col)
+        )
     else:
-        raise ValueError(f"Unknown method '{method}'. Use 'zscore' or 'rank'.")
-
-    # Step 3: Neutralize
-    if "sector" in neutralize:
-        if sectors is None:
-            raise ValueError("sectors DataFrame required for sector neutralization.")
-        df = sector_neutralize(
-            df,
-            sectors,
-            value_col=value_col,
-            date_col=date_col,
-            ticker_col=ticker_col,
+        df = df.with_columns(
+            rank_normalize_expr(value, date_col=date_col).alias(value_col)
         )
+        if neutralize_sector:
+            df = df.with_columns(value - value.mean().over(date_col, "sector"))
 
-    return df
+    if neutralize_sector:
+        df = df.drop("sector")
+    return df.collect()
@@ -0,0 +1,285 @@
+"""
+Cross-sectional Spearman Kernel — per-date ranks and rank correlations.
+
+Rank IC is the workhorse of factor evaluation: per date, the Pearson
+correlation of the cross-sectional ranks of a signal and of a forward
+return.  Every IC in the library (``FactorAnalyzer``, ``FactorPanel``, the
+IC-weighted combination in ``portfolio.pipeline``) and the rank-based
+turnover go through this one kernel:
+
+    1. Lay the long (date, ticker) frame out as contiguous per-date blocks:
+       a dense (dates × max stocks per date) array, NaN-padded.
+    2. Rank every block at once with one ``argsort`` along the last axis;
+       ties get their average rank (as ``rank(method="average")``).
+    3. Correlate the ranks per date with closed-form sums.  Average ranks
+       of n stocks always have mean (n + 1) / 2, so the ranks are centered
+       exactly, without a mean pass.
+
+Missing values: a stock enters a date's correlation only if both values
+are valid (non-null, finite), and both sides are ranked over those stocks.
+Dates with fewer than ``min_observations`` such stocks get no IC.
+
+Usage:
+    from alpha.spearman import cross_sectional_spearman, cross_sectional_ranks
+
+    ic = cross_sectional_spearman(merged, "value", ["forward_return_5d"])
+    ranks = cross_sectional_ranks(signal, "value")
+
+Reference: guidance/quant_lab.pdf — Part III, Chapter 10 (Factor Evaluation)
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+
+def average_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    Average ranks (1..n) along the last axis; NaN stays NaN.
+
+    Args:
+        values: Array of any shape; NaN = missing.
+
+    Returns:
+        Float array of the same shape.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    m = values.shape[-1]
+    if m == 0:
+        return values.copy()
+    # Missing values sort last, so each row's valid values come first.
+    # They are sorted as +inf: NaN takes NumPy off its vectorized sort.
+    # The sort need not be stable: tied values get the same rank anyway.
+    missing = np.isnan(values)
+    as_inf = missing.any() and not np.isposinf(values).any()
+    key = np.where(missing, np.inf, values) if as_inf else values
+    order = np.argsort(key, axis=-1)
+    ordered = np.take_along_axis(key, order, axis=-1)
+    position = np.broadcast_to(np.arange(1.0, m + 1.0), values.shape)
+
+    tied = ordered[..., 1:] == ordered[..., :-1]
+    if as_inf:
+        tied &= ordered[..., 1:] != np.inf
+    if tied.any():
+        # a tie run spans [first, last]; every member gets the midpoint
+        index = np.arange(m)
+        new_run = np.ones(ordered.shape, dtype=bool)
+        new_run[..., 1:] = ~tied
+        run_end = np.ones(ordered.shape, dtype=bool)
+        run_end[..., :-1] = ~tied
+        first = np.maximum.accumulate(np.where(new_run, index, 0), axis=-1)
+        last = np.flip(
+            np.minimum.accumulate(np.flip(np.where(run_end, index, m), -1), axis=-1),
+            -1,
+        )
+        position = (first + last) / 2.0 + 1.0
+
+    ranks = np.empty_like(values)
+    np.put_along_axis(ranks, order, position, axis=-1)
+    ranks[missing] = np.nan
+    return ranks
+
+
+def spearman(
+    x: np.ndarray,
+    y: np.ndarray,
+    min_observations: int = 2,
+    x_ranks: Optional[np.ndarray] = None,
+    y_ranks: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Spearman correlation along the last axis, over the jointly valid entries.
+
+    Args:
+        x, y: Arrays of the same shape; NaN = missing.
+        min_observations: Minimum jointly valid entries for a value.
+        x_ranks, y_ranks: Precomputed ``average_ranks`` of x / y (e.g. a
+                          signal shared by several returns).  Only the
+                          slices where the other side drops valid entries
+                          are re-ranked.
+
+    Returns:
+        Correlations, shape ``x.shape[:-1]``; NaN where fewer than
+        ``min_observations`` entries are valid or a side is constant.
+    """
+    x_valid = ~np.isnan(x)
+    y_valid = ~np.isnan(y)
+    joint = x_valid & y_valid
+    a = _joint_ranks(x, x_valid, joint, x_ranks)
+    b = _joint_ranks(y, y_valid, joint, y_ranks)
+
+    n = joint.sum(axis=-1)
+    center = ((n + 1) / 2.0)[..., None]
+    a = np.where(joint, a - center, 0.0)
+    b = np.where(joint, b - center, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.einsum("...n,...n->...", a, b) / np.sqrt(
+            np.einsum("...n,...n->...", a, a) * np.einsum("...n,...n->...", b, b)
+        )
+    corr[(n < min_observations) | (n == 0)] = np.nan
+    return corr
+
+
+def cross_sectional_ranks(
+    frame: pl.DataFrame, column: str, date_col: str = "date"
+) -> pl.DataFrame:
+    """
+    Per-date average ranks of one column of a long frame.
+
+    Args:
+        frame: Long DataFrame with a date column.
+        column: Column to rank; null / non-finite values are not ranked.
+        date_col: Date column name.
+
+    Returns:
+        ``frame`` (in its row order) with ``rank`` — null for invalid
+        values — and ``n``, the number of valid values on that date.
+    """
+    (values,), position, _ = _blocks(frame, [column], date_col)
+    ranks = average_ranks(values)
+    counts = (~np.isnan(values)).sum(axis=1)
+    return frame.with_columns(
+        pl.Series("rank", ranks.ravel()[position]).fill_nan(None),
+        pl.Series("n", counts[position // max(values.shape[1], 1)]),
+    )
+
+
+def cross_sectional_spearman(
+    frame: pl.DataFrame,
+    x_col: str,
+    y_cols: List[str],
+    date_col: str = "date",
+    min_observations: int = 2,
+) -> pl.DataFrame:
+    """
+    Per-date Spearman correlation of ``x_col`` with each of ``y_cols``.
+
+    ``x_col`` is ranked once; for each ``y_col`` only the dates where that
+    column drops stocks are re-ranked.
+
+    Args:
+        frame: Long DataFrame, one row per (date, stock).
+        x_col: Signal column.
+        y_cols: Columns to correlate with (e.g. forward returns).
+        date_col: Date column name.
+        min_observations: Minimum stocks valid in both columns per date.
+
+    Returns:
+        DataFrame with columns (date, *y_cols), one row per date sorted by
+        date; each value is the IC with ``x_col`` — null below
+        ``min_observations``, NaN where a side is constant.
+    """
+    (x, *ys), _, dates = _blocks(frame, [x_col, *y_cols], date_col)
+    x_ranks = average_ranks(x)
+    columns = []
+    for col, y in zip(y_cols, ys):
+        enough = (~np.isnan(x) & ~np.isnan(y)).sum(axis=1) >= max(min_observations, 1)
+        ic = spearman(x, y, min_observations, x_ranks=x_ranks)
+        columns.append(
+            pl.select(pl.when(pl.Series(enough)).then(pl.Series(ic)))
+            .to_series()
+            .alias(col)
+        )
+    return pl.DataFrame([dates, *columns])
+
+
+# ── Internal ──────────────────────────────────────────────────────────────────
+
+
+def _joint_ranks(
+    values: np.ndarray,
+    valid: np.ndarray,
+    joint: np.ndarray,
+    ranks: Optional[np.ndarray],
+) -> np.ndarray:
+    """Ranks over the ``joint`` entries, re-ranking only stale slices.
+
+    A stale slice without ties holds the ranks 1..n: dropping entries
+    only compacts them, so its new ranks are a cumulative count of the
+    kept entries in rank order — no sort.  Slices with ties are re-sorted.
+    """
+    if ranks is None:
+        return average_ranks(np.where(joint, values, np.nan))
+    stale = (valid != joint).any(axis=-1)
+    if not stale.any():
+        return ranks
+    out = np.array(ranks)
+
+    # no ties <=> the ranks are exactly 1..n <=> sum of squares is maximal
+    n = valid.sum(axis=-1)
+    squares = np.where(valid, ranks, 0.0) ** 2
+    distinct = squares.sum(axis=-1) == n * (n + 1) * (2 * n + 1) / 6
+
+    compact = stale & distinct
+    if compact.any():
+        width = values.shape[-1]
+        keep = joint[compact]
+        slot = np.where(valid[compact], ranks[compact] - 1, width).astype(np.intp)
+        in_rank_order = np.zeros(keep.shape[:-1] + (width + 1,), dtype=np.intp)
+        np.put_along_axis(in_rank_order, slot, keep, axis=-1)
+        in_rank_order[..., width] = 0
+        kept_before = np.cumsum(in_rank_order, axis=-1)
+        out[compact] = np.where(
+            keep, np.take_along_axis(kept_before, slot, axis=-1), np.nan
+        )
+
+    resort = stale & ~distinct
+    if resort.any():
+        out[resort] = average_ranks(np.where(joint[resort], values[resort], np.nan))
+    return out
+
+
+def _blocks(
+    frame: pl.DataFrame, columns: List[str], date_col: str
+) -> Tuple[List[np.ndarray], np.ndarray, pl.Series]:
+    """
+    Lay a long frame out as per-date blocks, without sorting it.
+
+    Returns:
+        One (dates, max stocks per date) float array per column (NaN =
+        missing / padding), the flat block position of each row of
+        ``frame``, and the sorted unique dates.
+    """
+    dates = frame.get_column(date_col)
+    unique = dates.unique().sort()
+    codes = _date_codes(dates, unique)
+    n = len(codes)
+    counts = np.bincount(codes, minlength=len(unique))
+    width = int(counts.max()) if n else 0
+    # flat block position: date row, then slot = order of arrival in the date
+    offset = np.arange(len(unique)) * width - (np.cumsum(counts) - counts)
+    if n == 0 or (codes[1:] >= codes[:-1]).all():
+        position = np.arange(n) + offset[codes]
+    else:
+        # stable sort by date code (radix sort for 16-bit codes)
+        key = codes.astype(np.int16 if len(unique) < 2**15 else np.int64)
+        order = np.argsort(key, kind="stable")
+        position = np.empty(n, dtype=np.int64)
+        position[order] = np.arange(n) + offset[codes[order]]
+
+    arrays = []
+    for col in columns:
+        out = np.full(len(unique) * width, np.nan)
+        out[position] = (
+            frame.get_column(col).cast(pl.Float64).fill_null(np.nan).to_numpy()
+        )
+        out[~np.isfinite(out)] = np.nan
+        arrays.append(out.reshape(len(unique), width))
+    return arrays, position, unique
+
+
+def _date_codes(dates: pl.Series, unique: pl.Series) -> np.ndarray:
+    """Position (int64) of each date among the sorted ``unique`` dates."""
+    physical = dates.to_physical()
+    if physical.dtype.is_integer() and len(dates):
+        # dates / day-resolution keys: a lookup table over the value range
+        values = physical.to_numpy().astype(np.int64)
+        low = int(values.min())
+        span = int(values.max()) - low + 1
+        if span <= 4 * len(values) + 4096:
+            present = np.zeros(span, dtype=bool)
+            present[values - low] = True
+            return (np.cumsum(present) - 1)[values - low]
+    # search_sorted gives unsigned indices; int64 keeps differences signed
+    return unique.search_sorted(dates).to_numpy().astype(np.int64)
@@ -1,3 +1,4 @@
+from .dense_tracker import DensePanel, DensePortfolioTracker
 from .engine import BacktestEngine
 from .performance_analyzer import PerformanceAnalyzer
 from .portfolio_tracker import PortfolioTracker, TrackingResult
@@ -9,6 +10,8 @@ from .weight_backtester import BacktestResult, WeightBacktester
 __all__ = [
     "BacktestEngine",
     "BacktestResult",
+    "DensePanel",
+    "DensePortfolioTracker",
     "PerformanceAnalyzer",
     "PortfolioTracker",
     "StrategyBase",
@@ -0,0 +1,371 @@
+"""
+Dense Tracker — NumPy matrix core for weight-based portfolio simulation.
+
+``PortfolioTracker`` works on long-format (date, ticker, weight) frames and
+pays for a Polars join + group-by on every run.  When sweeping hundreds of
+configurations against the same returns, that overhead dominates.
+
+``DensePortfolioTracker`` converts returns **once** into an aligned float64
+date × ticker matrix (``DensePanel``) with cached date / ticker index maps,
+then maps each weight frame onto the same axes.  Portfolio returns,
+turnover, costs and position counts are pure NumPy row operations, and the
+output is the same ``TrackingResult`` the Polars tracker produces.
+
+``run_batch`` stacks N weight frames into one (strategy × date × ticker)
+array so a whole grid of sizing methods / rebalance frequencies is
+simulated with a single set of array operations.
+
+Usage:
+    tracker = DensePortfolioTracker(cost_bps=5.0)
+    for w in weight_grid:
+        result = tracker.run(w, next_day_returns)   # returns aligned once
+
+    # or evaluate many weight sets in one stacked pass
+    results = tracker.run_batch({"EW": w_ew, "IV": w_iv}, next_day_returns)
+
+    # or via the backtester
+    bt = WeightBacktester(cost_bps=5.0, engine="dense")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+import polars as pl
+
+from constants import DATE_COL, TICKER_COL, WEIGHT_COL
+
+from .portfolio_tracker import PortfolioTracker, TrackingResult
+
+_POSITION_EPS = 1e-8
+
+
+@dataclass(frozen=True)
+class DensePanel:
+    """A long (date, ticker, value) frame scattered into a date × ticker matrix.
+
+    Attributes:
+        dates: Sorted unique dates (row axis).  Keeps the input dtype.
+        tickers: Sorted unique tickers (column axis).
+        values: float64 matrix (n_dates, n_tickers).  Cells absent from the
+            input are 0.0; nulls are 0.0; NaN is kept as NaN.
+        present: Boolean matrix — ``True`` where a (date, ticker) row existed.
+    """
+
+    dates: pl.Series
+    tickers: pl.Series
+    values: np.ndarray
+    present: np.ndarray
+
+    @classmethod
+    def from_long(
+        cls,
+        df: pl.DataFrame,
+        value_col: str,
+        date_col: str = DATE_COL,
+        ticker_col: str = TICKER_COL,
+        tickers: pl.Series | None = None,
+    ) -> DensePanel:
+        """Build a panel from a long frame.
+
+        Args:
+            df: Long DataFrame with (date, ticker, value).
+            value_col: Column to scatter into the matrix.
+            date_col: Date column name.
+            ticker_col: Ticker column name.
+            tickers: Optional sorted ticker axis to reuse (e.g. the returns
+                panel's).  Tickers in ``df`` not on this axis are appended
+                after it, so a prefix of the columns lines up with the
+                reference panel.
+
+        Duplicate (date, ticker) rows are summed.
+        """
+        dates, row, tickers, col = _long_axes(df, date_col, ticker_col, tickers)
+
+        values = np.zeros((len(dates), len(tickers)), dtype=np.float64)
+        present = np.zeros((len(dates), len(tickers)), dtype=bool)
+        vals = df[value_col].cast(pl.Float64).fill_null(0.0).to_numpy()
+        np.add.at(values, (row, col), vals)
+        present[row, col] = True
+
+        return cls(dates=dates, tickers=tickers, values=values, present=present)
+
+    def row_index(self, dates: pl.Series) -> np.ndarray:
+        """Map ``dates`` onto this panel's rows; ``-1`` where absent."""
+        return _index_of(self.dates, dates, missing=-1)
+
+
+class DensePortfolioTracker(PortfolioTracker):
+    """``PortfolioTracker`` with a dense NumPy matrix core.
+
+    Same constructor, ``run()`` signature and ``TrackingResult`` output as
+    the Polars tracker.  The aligned returns panel is cached on the instance
+    and reused while the same returns DataFrame object is passed in.
+
+    Args:
+        initial_capital: Starting portfolio value (default 100.0 = percentage).
+        cost_bps: One-way transaction cost in basis points (default 0 = no cost).
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100.0,
+        cost_bps: float = 0.0,
+    ):
+        super().__init__(initial_capital=initial_capital, cost_bps=cost_bps)
+        self._returns_key: tuple | None = None
+        self._returns_ref: pl.DataFrame | None = None
+        self._returns_panel: DensePanel | None = None
+
+    def returns_panel(
+        self,
+        returns: pl.DataFrame,
+        date_col: str = DATE_COL,
+        ticker_col: str = TICKER_COL,
+        return_col: str = "next_day_return",
+    ) -> DensePanel:
+        """Return the aligned returns panel, building it on first use."""
+        key = (id(returns), date_col, ticker_col, return_col)
+        if self._returns_key != key or self._returns_panel is None:
+            self._returns_panel = DensePanel.from_long(
+                returns, return_col, date_col=date_col, ticker_col=ticker_col
+            )
+            # Hold a reference so the id() cannot be recycled while cached.
+            self._returns_key = key
+            self._returns_ref = returns
+        return self._returns_panel
+
+    def run(
+        self,
+        weights: pl.DataFrame,
+        returns: pl.DataFrame,
+        date_col: str = DATE_COL,
+        ticker_col: str = TICKER_COL,
+        weight_col: str = WEIGHT_COL,
+        return_col: str = "next_day_return",
+    ) -> TrackingResult:
+        """Run the portfolio simulation on dense matrices.
+
+        See ``PortfolioTracker.run`` for argument semantics.
+        """
+        if weights.is_empty() or returns.is_empty():
+            return self._empty_result()
+
+        r_panel = self.returns_panel(returns, date_col, ticker_col, return_col)
+        w_panel = DensePanel.from_long(
+            weights,
+            weight_col,
+            date_col=date_col,
+            ticker_col=ticker_col,
+            tickers=r_panel.tickers,
+        )
+        return self.run_panels(w_panel, r_panel, date_col=date_col)
+
+    def run_batch(
+        self,
+        weights: Dict[str, pl.DataFrame],
+        returns: pl.DataFrame,
+        date_col: str = DATE_COL,
+        ticker_col: str = TICKER_COL,
+        weight_col: str = WEIGHT_COL,
+        return_col: str = "next_day_return",
+    ) -> Dict[str, TrackingResult]:
+        """Simulate several weight frames against the same returns at once.
+
+        The weight frames are scattered into one (N, n_dates, n_tickers)
+        array on a shared date / ticker axis and evaluated together.  Each
+        result is identical to ``run(weights[name], returns)``.
+
+        Args:
+            weights: Mapping of strategy name → DataFrame(date, ticker, weight).
+            returns: DataFrame(date, ticker, <return_col>).
+
+        Returns:
+            Mapping of strategy name → ``TrackingResult`` (same key order).
+        """
+        names = list(weights)
+        if returns.is_empty() or not names:
+            return {name: self._empty_result() for name in names}
+
+        r_panel = self.returns_panel(returns, date_col, ticker_col, return_col)
+        stacked = pl.concat(
+            [
+                weights[name].select(
+                    pl.lit(i, dtype=pl.Int64).alias("_strategy"),
+                    date_col,
+                    ticker_col,
+                    pl.col(weight_col).cast(pl.Float64),
+                )
+                for i, name in enumerate(names)
+            ]
+        )
+        if stacked.is_empty():
+            return {name: self._empty_result() for name in names}
+
+        dates, row, tickers, col = _long_axes(
+            stacked, date_col, ticker_col, r_panel.tickers
+        )
+        shape = (len(names), len(dates), len(tickers))
+        values = np.zeros(shape, dtype=np.float64)
+        present = np.zeros(shape, dtype=bool)
+        strat = stacked["_strategy"].to_numpy()
+        np.add.at(
+            values, (strat, row, col), stacked[weight_col].fill_null(0.0).to_numpy()
+        )
+        present[strat, row, col] = True
+
+        results = self._simulate(values, present, dates, r_panel, date_col)
+        return dict(zip(names, results))
+
+    def run_panels(
+        self,
+        w_panel: DensePanel,
+        r_panel: DensePanel,
+        date_col: str = DATE_COL,
+    ) -> TrackingResult:
+        """Simulate from pre-built panels.
+
+        ``w_panel``'s first ``len(r_panel.tickers)`` columns must line up
+        with ``r_panel`` (build it with ``tickers=r_panel.tickers``).
+        """
+        return self._simulate(
+            w_panel.values[None],
+            w_panel.present[None],
+            w_panel.dates,
+            r_panel,
+            date_col,
+        )[0]
+
+    def _simulate(
+        self,
+        values: np.ndarray,
+        present: np.ndarray,
+        dates: pl.Series,
+        r_panel: DensePanel,
+        date_col: str,
+    ) -> list[TrackingResult]:
+        """Stacked simulation core over (N, n_dates, n_tickers) weights.
+
+        Dates on the shared axis that a strategy never traded (no row in
+        its weight frame) are skipped for that strategy, so turnover is
+        measured between its own consecutive rebalance rows.
+        """
+        n_rt = len(r_panel.tickers)
+        r_rows = r_panel.row_index(dates)
+        has_r = r_rows >= 0
+        own = present.any(axis=2)  # (N, D): date is in the strategy's frame
+
+        # ── Daily portfolio return over matched (date, ticker) cells ──
+        r = r_panel.values[r_rows[has_r]]
+        matched = present[:, has_r, :n_rt] & r_panel.present[r_rows[has_r]]
+        port_ret = np.where(matched, values[:, has_r, :n_rt] * r, 0.0).sum(axis=2)
+        keep = matched.any(axis=2)
+        has_r_rows = np.flatnonzero(has_r)
+
+        # ── Turnover vs. each strategy's previous own row (first = 0) ──
+        n_dates = len(dates)
+        own_idx = np.where(own, np.arange(n_dates), -1)
+        last_own = np.maximum.accumulate(own_idx, axis=1)
+        prev = np.full_like(last_own, -1)
+        prev[:, 1:] = last_own[:, :-1]
+        prev_w = np.take_along_axis(values, np.maximum(prev, 0)[:, :, None], axis=1)
+        turnover = 0.5 * np.abs(values - prev_w).sum(axis=2)
+        turnover[prev < 0] = 0.0
+
+        if self.cost_bps > 0.0:
+            port_ret = port_ret - turnover[:, has_r] * (self.cost_bps / 10_000)
+
+        n_long = (values > _POSITION_EPS).sum(axis=2).astype(np.uint32)
+        n_short = (values < -_POSITION_EPS).sum(axis=2).astype(np.uint32)
+        n_total = (np.abs(values) > _POSITION_EPS).sum(axis=2).astype(np.uint32)
+
+        results = []
+        for i in range(values.shape[0]):
+            if not keep[i].any():
+                results.append(self._empty_result())
+                continue
+
+            ret_i = port_ret[i, keep[i]]
+            own_rows = np.flatnonzero(own[i])
+            turnover_i = turnover[i, own_rows]
+            own_dates = dates.gather(own_rows)
+
+            portfolio_daily = pl.DataFrame(
+                {
+                    date_col: dates.gather(has_r_rows[keep[i]]),
+                    "portfolio_return": ret_i,
+                    "equity_curve": np.cumprod(1.0 + ret_i),
+                }
+            )
+            turnover_df = pl.DataFrame({date_col: own_dates, "turnover": turnover_i})
+            position_count = pl.DataFrame(
+                {
+                    date_col: own_dates,
+                    "n_long": n_long[i, own_rows],
+                    "n_short": n_short[i, own_rows],
+                    "n_total": n_total[i, own_rows],
+                }
+            )
+            results.append(
+                TrackingResult(
+                    portfolio_daily=portfolio_daily,
+                    turnover=turnover_df,
+                    total_turnover=float(turnover_i.sum()),
+                    n_days=len(ret_i),
+                    position_count=position_count,
+                )
+            )
+        return results
+
+
+def _long_axes(
+    df: pl.DataFrame,
+    date_col: str,
+    ticker_col: str,
+    tickers: pl.Series | None = None,
+) -> tuple[pl.Series, np.ndarray, pl.Series, np.ndarray]:
+    """Sorted date / ticker axes of a long frame and each row's position.
+
+    With a reference ``tickers`` axis, off-axis tickers are appended after
+    it (see ``DensePanel.from_long``).
+    """
+    dates = df[date_col].unique().sort()
+    row = _index_of(dates, df[date_col])
+
+    own_tickers = df[ticker_col].unique().sort()
+    if tickers is None:
+        tickers = own_tickers
+        col = _index_of(tickers, df[ticker_col])
+    else:
+        col = _index_of(tickers, df[ticker_col], missing=-1)
+        off_axis = col < 0
+        if off_axis.any():
+            extra = own_tickers.filter(~own_tickers.is_in(tickers.implode()))
+            col[off_axis] = len(tickers) + _index_of(
+                extra, df[ticker_col].filter(pl.Series(off_axis))
+            )
+            tickers = pl.concat([tickers, extra])
+    return dates, row, tickers, col
+
+
+def _index_of(axis: pl.Series, values: pl.Series, missing: int | None = None):
+    """Positions of ``values`` in the sorted ``axis``.
+
+    String axes (tickers) are mapped through an ``Enum`` cast, which is a
+    hash lookup; other dtypes use binary search.  If ``missing`` is given,
+    values not found on the axis map to it; otherwise every value is
+    assumed present.
+    """
+    if axis.dtype == pl.String:
+        idx = values.cast(pl.Enum(axis), strict=False).to_physical()
+        idx = idx.cast(pl.Int64).fill_null(-1 if missing is None else missing)
+        return idx.to_numpy(writable=True)
+
+    idx = axis.search_sorted(values).to_numpy().astype(np.int64)
+    if missing is None:
+        return idx
+    clipped = np.minimum(idx, len(axis) - 1)
+    found = (idx < len(axis)) & (axis.gather(clipped).to_numpy() == values.to_numpy())
+    return np.where(found, idx, missing)
@@ -32,6 +32,7 @@ from constants import (
     TRADING_DAYS_PER_YEAR,
     WEIGHT_COL,
 )
+from execution.cost_analysis import compute_turnover
 
 
 @dataclass(frozen=True)
@@ -169,43 +170,16 @@ class PortfolioTracker:
         """Compute daily one-way turnover (sum of absolute weight changes).
 
         Turnover on day t = 0.5 × Σ|w_t(i) - w_{t-1}(i)| across all tickers.
+        Delegates to the shared ``execution.cost_analysis`` kernel; the first
+        day is kept with zero turnover.
         """
-        dates = weights.select(date_col).unique().sort(date_col)
-        date_list = dates[date_col].to_list()
-
-        if len(date_list) < 2:
-            return pl.DataFrame(
-                {date_col: date_list, "turnover": [0.0] * len(date_list)}
-            )
-
-        turnovers = [0.0]  # First day: no prior weights
-        prev_weights = weights.filter(pl.col(date_col) == date_list[0])
-
-        for d in date_list[1:]:
-            curr_weights = weights.filter(pl.col(date_col) == d)
-
-            # Full outer join on ticker to handle tickers appearing/disappearing
-            merged = (
-                prev_weights.select([ticker_col, pl.col(weight_col).alias("w_prev")])
-                .join(
-                    curr_weights.select(
-                        [ticker_col, pl.col(weight_col).alias("w_curr")]
-                    ),
-                    on=ticker_col,
-                    how="full",
-                    coalesce=True,
-                )
-                .with_columns(
-                    pl.col("w_prev").fill_null(0.0),
-                    pl.col("w_curr").fill_null(0.0),
-                )
-            )
-
-            turnover = float((merged["w_curr"] - merged["w_prev"]).abs().sum()) * 0.5
-            turnovers.append(turnover)
-            prev_weights = curr_weights
-
-        return pl.DataFrame({date_col: date_list, "turnover": turnovers})
+        return compute_turnover(
+            weights,
+            include_first_date=True,
+            date_col=date_col,
+            ticker_col=ticker_col,
+            weight_col=weight_col,
+        )
 
     def _compute_position_counts(
         self,
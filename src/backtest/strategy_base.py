@@ -1,11 +1,12 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence
 
 import polars as pl
 
 from config import cache_dir
 from data.loader.benchmark_loader import load_irx_data
+from indicators.cache import IndicatorCache
 
 strategy_cache_dir = os.path.join(cache_dir, "strategies")
 
@@ -21,30 +22,69 @@ class StrategyBase(ABC):
         self.ohlcv_data = None
         self.tickers = None
 
-        self.cache_file = os.path.join(strategy_cache_dir, f"{self.name}.csv")
+        self.indicator_cache = IndicatorCache(strategy_cache_dir)
 
         os.makedirs(strategy_cache_dir, exist_ok=True)
 
-    def load_cached_indicators(self) -> Optional[pl.DataFrame]:
-        """load cached indicators"""
-        if os.path.exists(self.cache_file):
-            print(f"loading {self.name} cached indicators: {self.cache_file}")
-            df = pl.read_csv(self.cache_file, try_parse_dates=True)
-            # Convert datetime columns to datetime[ns, America/New_York] format
-            for col in df.columns:
-                if df[col].dtype in [pl.Datetime, pl.Datetime("us"), pl.Datetime("ms")]:
-                    df = df.with_columns(
-                        pl.col(col)
-                        .dt.convert_time_zone("America/New_York")
-                        .dt.cast_time_unit("ns")
-                    )
-            return df
-        return None
+    def cache_params(self) -> Dict[str, Any]:
+        """
+        parameters that affect calculate_indicators(); part of the cache key.
+        Defaults to the whole config; override to narrow it.
+        """
+        return dict(self.config)
 
-    def save_indicators_cache(self, indicators: pl.DataFrame) -> None:
-        """save indicators to cache"""
-        indicators.write_csv(self.cache_file)
-        print(f"{self.name} cache saved into: {self.cache_file}")
+    def load_cached_indicators(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        load cached indicators computed from the current ohlcv_data with the
+        same params (default: cache_params()); None on a miss
+        """
+        if self.ohlcv_data is None:
+            return None
+        params = self.cache_params() if params is None else params
+        df = self.indicator_cache.load(self.name, params, self.ohlcv_data)
+        if df is not None:
+            print(f"loading {self.name} cached indicators")
+        return df
+
+    def cached_indicators(
+        self,
+        compute: Callable[[pl.DataFrame], pl.DataFrame],
+        lookback: Optional[int] = None,
+        cumulative: Sequence[str] = (),
+        refresh: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> pl.DataFrame:
+        """
+        indicators of the current ohlcv_data through the cache: an exact hit
+        is loaded; when dates were appended to the cached ohlcv, only the new
+        rows are computed, with the last `lookback` rows per ticker as
+        warm-up (see IndicatorCache.get_or_compute); otherwise compute() runs
+        on the full ohlcv. The result is saved either way.
+        """
+        if self.ohlcv_data is None:
+            raise ValueError("no ohlcv data, please set_data() first.")
+        params = self.cache_params() if params is None else params
+        return self.indicator_cache.get_or_compute(
+            self.name,
+            self.ohlcv_data,
+            compute,
+            params=params,
+            lookback=lookback,
+            cumulative=cumulative,
+            refresh=refresh,
+        )
+
+    def save_indicators_cache(
+        self, indicators: pl.DataFrame, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """save indicators to cache, keyed by params and ohlcv fingerprint"""
+        if self.ohlcv_data is None:
+            return
+        params = self.cache_params() if params is None else params
+        path = self.indicator_cache.save(self.name, params, self.ohlcv_data, indicators)
+        print(f"{self.name} cache saved into: {path}")
 
     def set_data(self, ohlcv_data: pl.DataFrame, tickers: list = None):
         """set ohlcv data for backtest"""
@@ -0,0 +1,141 @@
+"""
+Trade Scan — event-driven kernel for path-dependent entry / exit rules.
+
+Strategies such as BBIBOLL hold a position from an entry bar until an exit
+rule fires, and the exit rule depends on the entry (e.g. return vs. the
+entry price).  That state machine cannot be written as a single column
+expression, and iterating rows with ``iter_rows(named=True)`` allocates a
+dict per bar.
+
+``scan_trades`` instead jumps from event to event over contiguous NumPy
+arrays: the next entry is found with ``searchsorted`` over the precomputed
+entry candidates, and the matching exit is found by evaluating the exit
+rule vectorised over geometrically growing windows after the entry.
+Python-level work is proportional to the number of trades, not bars.
+
+Usage:
+    frame = indicators.sort(["ticker", "timestamps"])
+    close = frame["close"].to_numpy()
+    opens = frame["open"].to_numpy()
+
+    def exit_rule(entry, lo, hi):
+        ret = opens[lo:hi] / close[entry] - 1
+        return (ret > 0.3) | (ret < -0.3)
+
+    entries, exits = scan_trades(
+        frame["dev_pct"].to_numpy() <= 3, exit_rule, segment_bounds(frame["ticker"])
+    )
+    signals = trades_to_signals(frame, entries, exits)
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import polars as pl
+
+ExitRule = Callable[[int, int, int], np.ndarray]
+"""``exit_rule(entry_idx, lo, hi)`` → bool array for rows ``lo:hi``."""
+
+
+def segment_bounds(keys: pl.Series) -> np.ndarray:
+    """(start, stop) row ranges of consecutive equal ``keys``.
+
+    ``keys`` must already be grouped (e.g. a frame sorted by ticker).
+
+    Returns:
+        int64 array of shape (n_segments, 2).
+    """
+    if keys.is_empty():
+        return np.empty((0, 2), dtype=np.int64)
+    change = (keys != keys.shift(1)).fill_null(True).to_numpy()
+    starts = np.flatnonzero(change)
+    stops = np.append(starts[1:], len(keys))
+    return np.column_stack([starts, stops]).astype(np.int64)
+
+
+def scan_trades(
+    entry: np.ndarray,
+    exit_rule: ExitRule,
+    segments: np.ndarray,
+    min_window: int = 16,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run a flat → hold → flat state machine over segmented arrays.
+
+    Within each segment (one ticker), a position opens on the first row
+    where ``entry`` is True, then closes on the first *later* row where
+    ``exit_rule`` is True.  Scanning for the next entry resumes on the row
+    after the exit — the exit bar itself never re-enters.
+
+    Args:
+        entry: Boolean array over all rows (NaN-derived values must be
+            False).
+        exit_rule: ``exit_rule(entry_idx, lo, hi)`` returning a boolean
+            array for rows ``lo:hi`` given a position opened at
+            ``entry_idx``.  It is only called with rows inside the entry's
+            segment.
+        segments: (start, stop) ranges from ``segment_bounds``.
+        min_window: First exit-search window length; doubles until an exit
+            is found or the segment ends.
+
+    Returns:
+        ``(entries, exits)`` int64 row indices of equal length.  ``exits``
+        is ``-1`` for a position still open at the end of its segment.
+    """
+    candidates = np.flatnonzero(np.asarray(entry, dtype=bool))
+    entries: list[int] = []
+    exits: list[int] = []
+
+    for start, stop in segments:
+        pos = start
+        while True:
+            k = np.searchsorted(candidates, pos)
+            if k == len(candidates) or candidates[k] >= stop:
+                break
+            i = int(candidates[k])
+            j = _first_exit(exit_rule, i, stop, min_window)
+            entries.append(i)
+            exits.append(j)
+            if j < 0:
+                break
+            pos = j + 1
+
+    return np.asarray(entries, dtype=np.int64), np.asarray(exits, dtype=np.int64)
+
+
+def trades_to_signals(
+    frame: pl.DataFrame,
+    entries: np.ndarray,
+    exits: np.ndarray,
+    ticker_col: str = "ticker",
+    date_col: str = "timestamps",
+) -> pl.DataFrame:
+    """Turn ``scan_trades`` output into a (ticker, date, signal) frame.
+
+    Entry rows get ``signal = 1`` and exit rows ``signal = -1``; open
+    positions contribute only their entry.  Sorted by ticker then date.
+    """
+    closed = exits[exits >= 0]
+    rows = np.concatenate([entries, closed])
+    signal = np.concatenate(
+        [np.ones(len(entries), np.int64), -np.ones(len(closed), np.int64)]
+    )
+    return (
+        frame.select(ticker_col, date_col)[rows]
+        .with_columns(pl.Series("signal", signal))
+        .sort([ticker_col, date_col])
+    )
+
+
+def _first_exit(exit_rule: ExitRule, entry_idx: int, stop: int, window: int) -> int:
+    """First row in ``(entry_idx, stop)`` where the exit rule fires, else -1."""
+    lo = entry_idx + 1
+    while lo < stop:
+        hi = min(lo + window, stop)
+        hit = np.flatnonzero(exit_rule(entry_idx, lo, hi))
+        if len(hit):
+            return lo + int(hit[0])
+        lo = hi
+        window *= 2
+    return -1
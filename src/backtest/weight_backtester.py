@@ -18,19 +18,27 @@ Usage:
     bt.print_summary(result)
     bt.export(result, output_dir="results/signal_weighted")
 
+    # Parameter sweeps: dense NumPy core, returns aligned once per frame
+    bt = WeightBacktester(cost_bps=5.0, engine="dense")
+
+    # Many weight sets in one stacked pass
+    results = bt.run_many({"EW": w_ew, "IV": w_iv}, next_day_returns)
+    print(bt.compare(results))
+
 Reference: guidance/quant_lab.pdf — Part III, Chapter 12
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 import numpy as np
 import polars as pl
 
 from constants import DATE_COL, TICKER_COL, TRADING_DAYS_PER_YEAR, WEIGHT_COL
 
+from .dense_tracker import DensePortfolioTracker
 from .performance_analyzer import PerformanceAnalyzer
 from .portfolio_tracker import PortfolioTracker, TrackingResult
 
@@ -90,6 +98,10 @@ class WeightBacktester:
         initial_capital: Starting portfolio value (default 100.0).
         cost_bps: One-way transaction cost in basis points (default 5.0).
         trading_fee_rate: Legacy fee rate for PerformanceAnalyzer (default 0.007).
+        engine: Simulation core.  ``"polars"`` (default) joins long frames
+            on every run; ``"dense"`` uses ``DensePortfolioTracker``, which
+            aligns the returns frame into a date × ticker matrix once and
+            reuses it across runs — much faster for parameter sweeps.
     """
 
     def __init__(
@@ -97,13 +109,19 @@ class WeightBacktester:
         initial_capital: float = 100.0,
         cost_bps: float = 5.0,
         trading_fee_rate: float = 0.007,
+        engine: Literal["polars", "dense"] = "polars",
     ):
+        if engine not in ("polars", "dense"):
+            raise ValueError(f"Unknown engine '{engine}'. Use 'polars' or 'dense'.")
         self.initial_capital = initial_capital
         self.cost_bps = cost_bps
-        self.tracker = PortfolioTracker(
+        self.engine = engine
+        tracker_cls = DensePortfolioTracker if engine == "dense" else PortfolioTracker
+        self.tracker = tracker_cls(
             initial_capital=initial_capital,
             cost_bps=cost_bps,
         )
+        self._batch_tracker: Optional[DensePortfolioTracker] = None
         self.analyzer = PerformanceAnalyzer(
             initial_capital=initial_capital,
             trading_fee_rate=trading_fee_rate,
@@ -137,52 +155,55 @@ class WeightBacktester:
             return_col=return_col,
         )
 
-        # ── Preprocess benchmark ──
-        # PerformanceAnalyzer expects benchmark with 'benchmark_return' column
-        # (cumulative value, not daily returns).  If caller passes raw
-        # close prices, derive it automatically.
-        bench_for_analyzer = self._prepare_benchmark(benchmark_data)
-
-        # ── Compute performance metrics ──
-        # PerformanceAnalyzer expects a trades DataFrame — pass empty since
-        # weight-based strategies don't produce discrete trade records.
-        empty_trades = pl.DataFrame(
-            {
-                "ticker": [],
-                "buy_date": [],
-                "sell_date": [],
-                "buy_price": [],
-                "sell_price": [],
-                "return": [],
-            }
+        return self._build_result(
+            tracking,
+            benchmark_data,
+            self._prepare_benchmark(benchmark_data),
+            name,
         )
 
-        metrics = self.analyzer.calculate_performance_metrics(
-            portfolio_daily=tracking.portfolio_daily,
-            trades=empty_trades,
-            benchmark_data=bench_for_analyzer,
-        )
+    def run_many(
+        self,
+        weights: Dict[str, pl.DataFrame],
+        returns: pl.DataFrame,
+        benchmark_data: Optional[pl.DataFrame] = None,
+        return_col: str = "next_day_return",
+    ) -> Dict[str, BacktestResult]:
+        """Backtest several weight sets against the same returns in one pass.
 
-        # ── Augment metrics with turnover info ──
-        metrics["Total Turnover"] = tracking.total_turnover
-        metrics["Avg Daily Turnover"] = tracking.total_turnover / max(
-            1, tracking.n_days
-        )
-        metrics["Cost (bps)"] = self.cost_bps
+        The returns frame is aligned into a dense matrix once and all
+        weight sets are simulated as one stacked (strategy × date × ticker)
+        array via ``DensePortfolioTracker.run_batch`` — regardless of
+        ``engine``.  Comparing e.g. every ``build_sizing_methods`` output ×
+        several rebalance frequencies costs roughly one backtest.
 
-        config = {
-            "strategy_name": name,
-            "initial_capital": self.initial_capital,
-            "cost_bps": self.cost_bps,
-            "n_days": tracking.n_days,
-        }
+        Args:
+            weights: Mapping of strategy name → DataFrame(date, ticker, weight).
+            returns: DataFrame(date, ticker, <return_col>).
+            benchmark_data: Optional benchmark DataFrame(date, close).
+            return_col: Name of the return column in ``returns``.
 
-        return BacktestResult(
-            tracking=tracking,
-            metrics=metrics,
-            config=config,
-            benchmark_data=benchmark_data,
-        )
+        Returns:
+            Mapping of strategy name → ``BacktestResult``; pass it straight
+            to ``compare()``.
+        """
+        tracker = self.tracker
+        if not isinstance(tracker, DensePortfolioTracker):
+            if self._batch_tracker is None:
+                self._batch_tracker = DensePortfolioTracker(
+                    initial_capital=self.initial_capital,
+                    cost_bps=self.cost_bps,
+                )
+            tracker = self._batch_tracker
+
+        trackings = tracker.run_batch(weights, returns, return_col=return_col)
+        bench_for_analyzer = self._prepare_benchmark(benchmark_data)
+        return {
+            name: self._build_result(
+                tracking, benchmark_data, bench_for_analyzer, name, engine="dense"
+            )
+            for name, tracking in trackings.items()
+        }
 
     def run_from_pipeline(
         self,
@@ -301,6 +322,60 @@ class WeightBacktester:
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
+    def _build_result(
+        self,
+        tracking: TrackingResult,
+        benchmark_data: Optional[pl.DataFrame],
+        bench_for_analyzer: Optional[pl.DataFrame],
+        name: str,
+        engine: Optional[str] = None,
+    ) -> BacktestResult:
+        """Compute metrics for a tracking result and wrap it.
+
+        ``engine`` is the core that produced ``tracking`` (default: the
+        backtester's ``engine``).
+        """
+        # PerformanceAnalyzer expects a trades DataFrame — pass empty since
+        # weight-based strategies don't produce discrete trade records.
+        empty_trades = pl.DataFrame(
+            {
+                "ticker": [],
+                "buy_date": [],
+                "sell_date": [],
+                "buy_price": [],
+                "sell_price": [],
+                "return": [],
+            }
+        )
+
+        metrics = self.analyzer.calculate_performance_metrics(
+            portfolio_daily=tracking.portfolio_daily,
+            trades=empty_trades,
+            benchmark_data=bench_for_analyzer,
+        )
+
+        # ── Augment metrics with turnover info ──
+        metrics["Total Turnover"] = tracking.total_turnover
+        metrics["Avg Daily Turnover"] = tracking.total_turnover / max(
+            1, tracking.n_days
+        )
+        metrics["Cost (bps)"] = self.cost_bps
+
+        config = {
+            "strategy_name": name,
+            "initial_capital": self.initial_capital,
+            "cost_bps": self.cost_bps,
+            "engine": engine or self.engine,
+            "n_days": tracking.n_days,
+        }
+
+        return BacktestResult(
+            tracking=tracking,
+            metrics=metrics,
+            config=config,
+            benchmark_data=benchmark_data,
+        )
+
     @staticmethod
     def _prepare_benchmark(
         benchmark_data: Optional[pl.DataFrame],
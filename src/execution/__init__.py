@@ -3,8 +3,8 @@ Execution & Cost Modeling — Transaction cost estimation and impact analysis.
 
 Sub-modules:
     cost_model: Cost estimation (fixed, spread, square-root market impact)
-    cost_analysis: Portfolio-level cost analytics (turnover, net-of-cost returns,
-                   Sharpe vs cost sensitivity, breakeven cost)
+    cost_analysis: Portfolio-level cost analytics (per-ticker trades, turnover,
+                   net-of-cost returns, Sharpe vs cost sensitivity, breakeven cost)
 
 Convention:
     - Weights DataFrames: (date, ticker, weight) — same as position_sizing output
@@ -18,6 +18,8 @@ Reference: guidance/quant_lab.pdf — Part IV, Chapter 15 (Execution & Costs)
 from execution.cost_analysis import (
     breakeven_cost,
     compute_net_returns,
+    compute_trade_costs,
+    compute_trades,
     compute_turnover,
     sharpe_vs_cost_curve,
 )
@@ -37,7 +39,9 @@ __all__ = [
     "SqrtImpactCostModel",
     "CompositeCostModel",
     # cost_analysis
+    "compute_trades",
     "compute_turnover",
+    "compute_trade_costs",
     "compute_net_returns",
     "sharpe_vs_cost_curve",
     "breakeven_cost",
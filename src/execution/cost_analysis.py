@@ -8,7 +8,9 @@ This module connects cost models to portfolio weights and returns to answer:
     4. How does Sharpe degrade as costs increase?
 
 Key functions:
+    - compute_trades: Per-ticker trade vectors Δw (shared turnover kernel)
     - compute_turnover: Daily turnover from weight changes
+    - compute_trade_costs: Price each trade (both legs) with a cost model
     - compute_net_returns: Apply cost model to gross returns
     - sharpe_vs_cost_curve: Sweep over cost levels
     - breakeven_cost: Find cost level where Sharpe = 0
@@ -30,12 +32,89 @@ from typing import Optional
 import numpy as np
 import polars as pl
 
+from constants import DATE_COL, TICKER_COL, WEIGHT_COL
 from execution.cost_model import CostModel, FixedCostModel
 
-# ── Turnover ──────────────────────────────────────────────────────────────────
+# ── Trades & Turnover ─────────────────────────────────────────────────────────
 
 
-def compute_turnover(weights: pl.DataFrame) -> pl.DataFrame:
+def compute_trades(
+    weights: pl.DataFrame,
+    portfolio_value: Optional[float] = None,
+    date_col: str = DATE_COL,
+    ticker_col: str = TICKER_COL,
+    weight_col: str = WEIGHT_COL,
+) -> pl.DataFrame:
+    """
+    Compute per-ticker trade vectors Δw between consecutive weight dates.
+
+    This is the shared turnover kernel: ``compute_turnover`` and
+    ``PortfolioTracker`` both aggregate its output, and cost models that
+    price each trade individually (e.g. ``SqrtImpactCostModel``) consume
+    the per-trade dollar values directly.
+
+    Each date is mapped to a dense integer index, and the weights are
+    joined once against themselves shifted by one index (full outer join
+    on ``(ticker, index)``).  Tickers entering the book get ``w_prev = 0``,
+    tickers leaving get ``weight = 0`` — no per-date Python loop.
+
+    Args:
+        weights: DataFrame with columns (date, ticker, weight).
+        portfolio_value: If given, adds a ``trade_value`` column with the
+            absolute dollar value of each trade (``|Δw| × portfolio_value``).
+        date_col: Date column name.
+        ticker_col: Ticker column name.
+        weight_col: Weight column name.
+
+    Returns:
+        DataFrame with columns (date, ticker, w_prev, weight, delta_weight
+        [, trade_value]), sorted by (date, ticker).  The first date is
+        dropped (no prior weights to compare).  The date column keeps the
+        input dtype.
+    """
+    _validate_weights(weights, date_col, ticker_col, weight_col)
+
+    dates = weights.select(date_col).unique().sort(date_col).with_row_index("_date_idx")
+    n_dates = dates.height
+
+    indexed = weights.select(date_col, ticker_col, weight_col).join(
+        dates, on=date_col, how="inner"
+    )
+    curr = indexed.select(ticker_col, "_date_idx", pl.col(weight_col).cast(pl.Float64))
+    prev = indexed.select(
+        ticker_col,
+        (pl.col("_date_idx") + 1).alias("_date_idx"),
+        pl.col(weight_col).cast(pl.Float64).alias("w_prev"),
+    )
+
+    trades = (
+        curr.join(prev, on=[ticker_col, "_date_idx"], how="full", coalesce=True)
+        .filter((pl.col("_date_idx") >= 1) & (pl.col("_date_idx") < n_dates))
+        .with_columns(
+            pl.col("w_prev").fill_null(0.0),
+            pl.col(weight_col).fill_null(0.0),
+        )
+        .with_columns((pl.col(weight_col) - pl.col("w_prev")).alias("delta_weight"))
+        .join(dates, on="_date_idx", how="inner")
+        .select(date_col, ticker_col, "w_prev", weight_col, "delta_weight")
+        .sort([date_col, ticker_col])
+    )
+
+    if portfolio_value is not None:
+        trades = trades.with_columns(
+            (pl.col("delta_weight").abs() * portfolio_value).alias("trade_value")
+        )
+
+    return trades
+
+
+def compute_turnover(
+    weights: pl.DataFrame,
+    include_first_date: bool = False,
+    date_col: str = DATE_COL,
+    ticker_col: str = TICKER_COL,
+    weight_col: str = WEIGHT_COL,
+) -> pl.DataFrame:
     """
     Compute daily one-way turnover from a weights DataFrame.
 
@@ -50,10 +129,17 @@ def compute_turnover(weights: pl.DataFrame) -> pl.DataFrame:
 
     Args:
         weights: DataFrame with columns (date, ticker, weight).
+        include_first_date: If ``True``, the first date is kept with zero
+            turnover (the ``PortfolioTracker`` convention).  By default it
+            is dropped.
+        date_col: Date column name.
+        ticker_col: Ticker column name.
+        weight_col: Weight column name.
 
     Returns:
         DataFrame with columns (date, turnover).
-        First date is dropped (no prior weights to compare).
+        First date is dropped (no prior weights to compare) unless
+        ``include_first_date`` is set.
 
     Note:
         High turnover is the enemy of factor strategies.  A factor with
@@ -62,48 +148,70 @@ def compute_turnover(weights: pl.DataFrame) -> pl.DataFrame:
 
             Net Sharpe ≈ Gross Sharpe − (turnover × cost_per_trade × √252)
     """
-    _validate_weights(weights)
+    trades = compute_trades(
+        weights, date_col=date_col, ticker_col=ticker_col, weight_col=weight_col
+    )
+
+    turnover = (
+        trades.group_by(date_col)
+        .agg((pl.col("delta_weight").abs().sum() / 2.0).alias("turnover"))
+        .sort(date_col)
+    )
+
+    if include_first_date and not weights.is_empty():
+        first = weights.select(pl.col(date_col).min()).with_columns(
+            pl.lit(0.0).alias("turnover")
+        )
+        turnover = pl.concat([first, turnover])
 
-    # Get sorted dates
-    dates = weights.select("date").unique().sort("date")
-    date_list = dates["date"].to_list()
+    return turnover
 
-    if len(date_list) < 2:
-        return pl.DataFrame({"date": [], "turnover": []})
 
-    # For each consecutive pair of dates, compute turnover
-    turnover_records = []
-    for i in range(1, len(date_list)):
-        prev_date = date_list[i - 1]
-        curr_date = date_list[i]
+def compute_trade_costs(
+    trades: pl.DataFrame,
+    cost_model: CostModel,
+    portfolio_value: float = 1.0,
+    volume_col: Optional[str] = None,
+    date_col: str = DATE_COL,
+) -> pl.DataFrame:
+    """
+    Price each trade individually and aggregate costs per date.
 
-        prev_w = (
-            weights.filter(pl.col("date") == prev_date)
-            .select(["ticker", "weight"])
-            .rename({"weight": "w_prev"})
-        )
-        curr_w = (
-            weights.filter(pl.col("date") == curr_date)
-            .select(["ticker", "weight"])
-            .rename({"weight": "w_curr"})
-        )
+    Unlike ``compute_net_returns`` (which prices the day's aggregate
+    turnover as one trade), this feeds every per-ticker trade value to
+    ``cost_model.estimate_array``.  For non-linear models such as
+    ``SqrtImpactCostModel`` the two differ: splitting a day's turnover
+    across many names is cheaper than trading it as one block.
 
-        # Full outer join to handle stocks entering/leaving
-        merged = prev_w.join(curr_w, on="ticker", how="full", coalesce=True)
-        merged = merged.with_columns(
-            pl.col("w_prev").fill_null(0.0),
-            pl.col("w_curr").fill_null(0.0),
-        )
+    Convention: two-way.  Every trade is priced, buys and sells alike, so
+    the traded value is sum |Δw| — twice the one-way ``compute_turnover``
+    that ``compute_net_returns`` and ``sharpe_vs_cost_curve`` price.  With
+    a linear model such as ``FixedCostModel`` the cost here is therefore
+    2 × turnover × rate.
 
-        # One-way turnover = 0.5 * Σ|Δw|
-        delta_sum = merged.select(
-            ((pl.col("w_curr") - pl.col("w_prev")).abs().sum() / 2.0).alias("turnover")
-        )
-        turnover_records.append(
-            {"date": curr_date, "turnover": delta_sum["turnover"][0]}
-        )
+    Args:
+        trades: Output of ``compute_trades()``.
+        cost_model: A CostModel instance.
+        portfolio_value: Portfolio notional used to convert Δw to dollars.
+        volume_col: Optional column in ``trades`` with each ticker's average
+            daily dollar volume (passed as ``daily_volumes``).
+        date_col: Date column name.
+
+    Returns:
+        DataFrame with columns (date, cost) — cost as a fraction of
+        ``portfolio_value``, one row per date in ``trades``.
+    """
+    trade_values = trades["delta_weight"].abs().to_numpy() * portfolio_value
+    daily_volumes = trades[volume_col].to_numpy() if volume_col is not None else None
+    costs = cost_model.estimate_array(trade_values, daily_volumes=daily_volumes)
 
-    return pl.DataFrame(turnover_records)
+    return (
+        trades.select(date_col)
+        .with_columns(pl.Series("cost", costs / portfolio_value))
+        .group_by(date_col)
+        .agg(pl.col("cost").sum())
+        .sort(date_col)
+    )
 
 
 # ── Net-of-Cost Returns ──────────────────────────────────────────────────────
@@ -188,25 +296,33 @@ def sharpe_vs_cost_curve(
     if cost_bps_range is None:
         cost_bps_range = np.array([0, 1, 2, 3, 5, 7, 10, 15, 20, 30, 50], dtype=float)
 
+    if len(gross_returns) != len(turnover):
+        raise ValueError(
+            f"gross_returns ({len(gross_returns)}) and turnover ({len(turnover)}) "
+            f"must have the same length"
+        )
+
+    cost_bps_range = np.asarray(cost_bps_range, dtype=float)
+    if (cost_bps_range < 0).any():
+        raise ValueError(f"cost_bps must be non-negative, got {cost_bps_range.min()}")
     avg_to = float(np.mean(turnover))
 
-    results = {
+    # Fixed cost is linear in turnover, so the whole sweep is one
+    # (n_costs × n_days) matrix: net = gross − |turnover| × bps / 10_000.
+    net = (
+        np.asarray(gross_returns)[None, :]
+        - (cost_bps_range[:, None] / 10_000) * np.abs(np.asarray(turnover))[None, :]
+    )
+
+    return {
         "cost_bps": cost_bps_range,
-        "net_sharpe": np.empty(len(cost_bps_range)),
-        "net_annual_return": np.empty(len(cost_bps_range)),
+        "net_sharpe": np.array([_sharpe(row, annualization_factor) for row in net]),
+        "net_annual_return": net.mean(axis=1) * annualization_factor,
         "gross_sharpe": _sharpe(gross_returns, annualization_factor),
         "avg_daily_turnover": avg_to,
         "annual_turnover": avg_to * annualization_factor,
     }
 
-    for i, bps in enumerate(cost_bps_range):
-        model = FixedCostModel(cost_bps=bps)
-        net = compute_net_returns(gross_returns, turnover, model)
-        results["net_sharpe"][i] = _sharpe(net, annualization_factor)
-        results["net_annual_return"][i] = float(np.mean(net)) * annualization_factor
-
-    return results
-
 
 # ── Breakeven Cost ────────────────────────────────────────────────────────────
 
@@ -274,9 +390,14 @@ def _sharpe(returns: np.ndarray, annualization_factor: int = 252) -> float:
     return mu / sigma * np.sqrt(annualization_factor)
 
 
-def _validate_weights(weights: pl.DataFrame) -> None:
+def _validate_weights(
+    weights: pl.DataFrame,
+    date_col: str = DATE_COL,
+    ticker_col: str = TICKER_COL,
+    weight_col: str = WEIGHT_COL,
+) -> None:
     """Validate that weights DataFrame has the required columns."""
-    required = {"date", "ticker", "weight"}
+    required = {date_col, ticker_col, weight_col}
     missing = required - set(weights.columns)
     if missing:
         raise ValueError(
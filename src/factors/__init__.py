@@ -1,8 +1,26 @@
 # Import alphas subpackage to trigger @register_factor decorators
 import factors.alphas  # noqa: F401
-from factors.factors import get_factor_fn, list_factors, register_factor
+from factors.context import FactorContext, active_context, factor_context
+from factors.executor import compute_factors
+from factors.factors import (
+    compute_factor_incremental,
+    get_factor_expr,
+    get_factor_fn,
+    list_factors,
+    register_factor,
+)
+from factors.plan import build_factor_plan
+from factors.store import FactorStore
 
 __all__ = [
+    "FactorContext",
+    "FactorStore",
+    "active_context",
+    "factor_context",
+    "build_factor_plan",
+    "compute_factors",
+    "compute_factor_incremental",
+    "get_factor_expr",
     "get_factor_fn",
     "list_factors",
     "register_factor",
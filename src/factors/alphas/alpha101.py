@@ -1,110 +1,41 @@
-"""Alpha 101 factors — pandas-based, using composable operators.
+"""Alpha 101 factors — Polars expressions built from ``alpha.operators``.
 
-Each function receives a Polars DataFrame, converts to pandas internally,
-computes the signal using operators from ``_ops``, and returns a Polars
-DataFrame with at least a ``value`` column.  The ``@register_factor``
-wrapper handles null filtering, column selection, and preprocessing.
+Each function is an expression factor: it returns the formula as a single
+Polars expression, evaluated on OHLCV sorted by [ticker, date].  The
+``@register_factor`` wrapper handles evaluation, null filtering, column
+selection, and preprocessing, and ``factors.plan`` can compile several of
+them into one lazy query.
 
 Formula reference: https://arxiv.org/abs/1601.00991
 """
 
 from __future__ import annotations
 
-import numpy as np
 import polars as pl
 
-from constants import OHLCV_DATE_COL, TICKER_COL, VALUE_COL
-from factors.alphas.operator import delay, delta, rank, signed_power, ts_argmax, ts_corr
-
-print("Loading alpha101 module...")  # Add this at the top after imports
-
+from alpha.operators import cs_rank, delay, delta, signed_power, ts_argmax, ts_corr
 from factors.factors import register_factor
 
-print("About to register factors...")  # Add this before the first @register_factor
-
-
-def _to_pd(ohlcv: pl.DataFrame):
-    """Convert to pandas sorted by [ticker, date], return (df, grouped)."""
-    df = ohlcv.to_pandas().sort_values([TICKER_COL, OHLCV_DATE_COL])
-    return df, df.groupby(TICKER_COL)
-
 
-def _to_pl(df, date_col=OHLCV_DATE_COL):
-    """Convert pandas back to polars, keeping required columns."""
-    return pl.from_pandas(df[[date_col, TICKER_COL, VALUE_COL]])
-
-
-@register_factor("alpha001")
-def alpha001(ohlcv: pl.DataFrame) -> pl.DataFrame:
+@register_factor("alpha001", kind="expr")
+def alpha001(**kwargs) -> pl.Expr:
     """(rank(ts_argmax(signed_power(close/delay(close,1)-1, 2), 5)))"""
-    df, g = _to_pd(ohlcv)
+    ret = pl.col("close") / delay("close", 1) - 1
+    return cs_rank(ts_argmax(signed_power(ret, 2), 5))
 
-    close = df["close"]
-    ret = close / g["close"].shift(1) - 1
-    df[VALUE_COL] = rank(
-        ts_argmax(g, signed_power(ret, 2), 5),
-        df[OHLCV_DATE_COL],
-    )
-    return _to_pl(df)
-
-
-@register_factor("alpha002")
-def alpha002(ohlcv: pl.DataFrame) -> pl.DataFrame:
-    """(-1 * correlation(rank(delta(log(volume), 2)), rank(((close - open) / open)), 6))
-    # correlation(x1,y1,d1)
-        x1=rank(delta(x2,2))
-            # rank(x2.1)
-            x2.1=delta(log(volume), 2)
-                # delta(x3.1, d3)
-                x3.1=log(volume)
-                    # log(x4.1)
-                    x4.1=volume
-        y1=rank(((close-open)/open))
-            # rank(x2.2)
-            x2.2=((close - open) / open)
-                # (close - open) / open = (x3.2 - y3.2) / y3.2
-                x3.2 = close
-                y3.2 = open
-        d1=6
-    """
-    df, g = _to_pd(ohlcv)
-
-    #
-    close = df["close"]
-    open = df["open"]
-    volume = df["volume"]
-
-    #
-    x4_1 = volume
-    x3_1 = np.log(x4_1)
-    x2_1 = delta(g, x3_1, 2)
-    #
-    x2_2 = (close - open) / open
-    #
-    x1 = rank(x2_1, df[OHLCV_DATE_COL])
-    y1 = rank(x2_2, df[OHLCV_DATE_COL])
-    df[VALUE_COL] = -1 * ts_corr(g, x1, y1, 6)
-
-    #
-    return _to_pl(df)
-
-
-@register_factor("alpha003")
-def alpha003(ohlcv: pl.DataFrame) -> pl.DataFrame:
-    """(-1 * correlation(rank(open),rank(volume),10))"""
-    df, g = _to_pd(ohlcv)
 
-    #
-    open = df["open"]
-    volume = df["volume"]
+@register_factor("alpha002", kind="expr")
+def alpha002(**kwargs) -> pl.Expr:
+    """(-1 * correlation(rank(delta(log(volume), 2)), rank(((close - open) / open)), 6))"""
+    x = cs_rank(delta(pl.col("volume").log(), 2))
+    y = cs_rank((pl.col("close") - pl.col("open")) / pl.col("open"))
+    return -1 * ts_corr(x, y, 6)
 
-    #
-    x1 = rank(open, df[OHLCV_DATE_COL])
-    y1 = rank(volume, df[OHLCV_DATE_COL])
-    df[VALUE_COL] = -1 * ts_corr(g, x1, y1, 10)
 
-    #
-    return _to_pl(df)
+@register_factor("alpha003", kind="expr")
+def alpha003(**kwargs) -> pl.Expr:
+    """(-1 * correlation(rank(open),rank(volume),10))"""
+    return -1 * ts_corr(cs_rank("open"), cs_rank("volume"), 10)
 
 
 if __name__ == "__main__":
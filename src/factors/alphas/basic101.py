@@ -4,11 +4,18 @@ from __future__ import annotations
 
 import polars as pl
 
-from constants import OHLCV_DATE_COL, TICKER_COL, VALUE_COL
+from constants import TICKER_COL, VALUE_COL
+from factors.context import factor_context
 from factors.factors import register_factor
 
 
-@register_factor("bbiboll")
+def _bbiboll_lookback(boll_length: int = 11, pct_window: int = 252, **kwargs) -> int:
+    from indicators.basic_indicator import bbiboll_lookback
+
+    return bbiboll_lookback(boll_length, pct_window)
+
+
+@register_factor("bbiboll", lookback=_bbiboll_lookback)
 def _compute_bbiboll_factor(
     ohlcv: pl.DataFrame,
     boll_length: int = 11,
@@ -17,10 +24,8 @@ def _compute_bbiboll_factor(
     **kwargs,
 ) -> pl.DataFrame:
     """Raw signal: (close − BBI) / deviation."""
-    from indicators.registry import get_indicator
-
-    ohlcv_bb = get_indicator("bbiboll")(
-        ohlcv,
+    ohlcv_bb = factor_context(ohlcv).indicator(
+        "bbiboll",
         boll_length=boll_length,
         boll_multiple=boll_multiple,
         pct_window=pct_window,
@@ -30,43 +35,23 @@ def _compute_bbiboll_factor(
     )
 
 
-@register_factor("momentum")
-def _compute_momentum_factor(
-    ohlcv: pl.DataFrame, *, lookback: int = 20, **kwargs
-) -> pl.DataFrame:
+@register_factor("momentum", kind="expr", lookback=lambda lookback=20, **kw: lookback)
+def _compute_momentum_factor(*, lookback: int = 20, **kwargs) -> pl.Expr:
     """Raw signal: lookback-day log return."""
-    return ohlcv.sort([TICKER_COL, OHLCV_DATE_COL]).with_columns(
-        (pl.col("close") / pl.col("close").shift(lookback).over(TICKER_COL))
-        .log()
-        .alias(VALUE_COL)
-    )
+    return (pl.col("close") / pl.col("close").shift(lookback).over(TICKER_COL)).log()
 
 
-@register_factor("vol_ratio")
+@register_factor(
+    "vol_ratio", kind="expr", lookback=lambda long_window=20, **kw: long_window
+)
 def _compute_vol_ratio_factor(
-    ohlcv: pl.DataFrame,
     *,
     short_window: int = 5,
     long_window: int = 20,
     **kwargs,
-) -> pl.DataFrame:
+) -> pl.Expr:
     """Raw signal: short-window vol / long-window vol."""
-    return (
-        ohlcv.sort([TICKER_COL, OHLCV_DATE_COL])
-        .with_columns(
-            (pl.col("close") / pl.col("close").shift(1).over(TICKER_COL))
-            .log()
-            .alias("log_ret")
-        )
-        .with_columns(
-            pl.col("log_ret")
-            .rolling_std(window_size=short_window)
-            .over(TICKER_COL)
-            .alias("vol_short"),
-            pl.col("log_ret")
-            .rolling_std(window_size=long_window)
-            .over(TICKER_COL)
-            .alias("vol_long"),
-        )
-        .with_columns((pl.col("vol_short") / pl.col("vol_long")).alias(VALUE_COL))
-    )
+    log_ret = (pl.col("close") / pl.col("close").shift(1).over(TICKER_COL)).log()
+    vol_short = log_ret.rolling_std(window_size=short_window).over(TICKER_COL)
+    vol_long = log_ret.rolling_std(window_size=long_window).over(TICKER_COL)
+    return vol_short / vol_long
@@ -0,0 +1,66 @@
+"""pandas reference for the Alpha 101 ports — the pre-Polars
+``factors.alphas.operator`` groupby.apply operators and alpha001–003.
+
+Not registered as factors: tests use them as the golden reference for
+``alpha.operators`` / ``factors.alphas.alpha101`` and
+scripts/bench_alpha101.py times the Polars versions against them.
+
+Usage:
+    from factors.alphas import pandas_reference as ref
+
+    df, g = ref.to_pandas(ohlcv)
+    expected = ref.alpha001(df, g)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+
+def to_pandas(ohlcv: pl.DataFrame):
+    """OHLCV as a pandas frame sorted by (ticker, timestamps), and its groupby"""
+    df = ohlcv.to_pandas().sort_values(["ticker", "timestamps"])
+    return df, df.groupby("ticker")
+
+
+def delay(g, x: pd.Series, d: int) -> pd.Series:
+    return g.apply(lambda _: x.loc[_.index].shift(d), include_groups=False).droplevel(0)
+
+
+def rank(x: pd.Series, date: pd.Series) -> pd.Series:
+    return x.groupby(date).rank(pct=True)
+
+
+def rolling(g, x: pd.Series, d: int, fn) -> pd.Series:
+    return g.apply(
+        lambda _: fn(x.loc[_.index].rolling(d, min_periods=d)), include_groups=False
+    ).droplevel(0)
+
+
+def ts_corr(g, x: pd.Series, y: pd.Series, d: int) -> pd.Series:
+    return g.apply(
+        lambda _: x.loc[_.index].rolling(d, min_periods=d).corr(y.loc[_.index]),
+        include_groups=False,
+    ).droplevel(0)
+
+
+def alpha001(df: pd.DataFrame, g) -> pd.Series:
+    ret = df["close"] / g["close"].shift(1) - 1
+    x = np.sign(ret) * np.abs(ret) ** 2
+    argmax = rolling(g, x, 5, lambda r: r.apply(np.argmax, raw=True))
+    return rank(argmax, df["timestamps"])
+
+
+def alpha002(df: pd.DataFrame, g) -> pd.Series:
+    log_vol = np.log(df["volume"])
+    x = rank(log_vol - delay(g, log_vol, 2), df["timestamps"])
+    y = rank((df["close"] - df["open"]) / df["open"], df["timestamps"])
+    return -1 * ts_corr(g, x, y, 6)
+
+
+def alpha003(df: pd.DataFrame, g) -> pd.Series:
+    x = rank(df["open"], df["timestamps"])
+    y = rank(df["volume"], df["timestamps"])
+    return -1 * ts_corr(g, x, y, 10)
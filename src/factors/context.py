@@ -0,0 +1,187 @@
+"""
+Factor Context — memoized intermediates shared across factors in one run.
+
+Most factors start from the same steps: sort OHLCV by (ticker, date),
+derive (log) returns, per-ticker rolling volatilities, cross-sectional
+ranks, indicator frames.  Computed independently, 20 factors sort and
+shift the same data 20 times.  A ``FactorContext`` computes each
+intermediate once and hands the cached result to every later caller.
+
+The context is bound to one OHLCV frame (by identity) and activated with
+``with``; factor functions look it up with ``factor_context(ohlcv)``, so
+their signatures stay ``fn(ohlcv, **kw)`` and they still work standalone
+(they then get a private, throwaway context)::
+
+    with FactorContext(ohlcv):
+        mom = get_factor_fn("momentum")(ohlcv)
+        vol = get_factor_fn("vol_ratio")(ohlcv)   # reuses sort + log_ret
+
+    @register_factor("my_factor")
+    def compute_my_factor(ohlcv, **kw):
+        ctx = factor_context(ohlcv)
+        return ctx.sorted.with_columns(
+            (ctx.log_return() / ctx.rolling_std("log_return", 20)).alias("value")
+        )
+
+All series returned by the context are aligned with ``ctx.sorted``.
+The memo is thread-safe: factors computed on a thread pool (see
+``factors.executor``) still compute each intermediate once.
+
+Usage:
+    from factors import FactorContext, factor_context
+"""
+
+from __future__ import annotations
+
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, TypeVar
+
+import polars as pl
+
+from constants import OHLCV_DATE_COL, TICKER_COL
+
+T = TypeVar("T")
+
+_ACTIVE: ContextVar[FactorContext | None] = ContextVar("factor_context", default=None)
+
+
+class FactorContext:
+    """Memo table for one OHLCV frame.
+
+    Args:
+        ohlcv: Raw OHLCV frame the cached intermediates derive from.
+        ohlcv_date_col: Date column of ``ohlcv``.
+        ticker_col: Ticker column of ``ohlcv``.
+    """
+
+    def __init__(
+        self,
+        ohlcv: pl.DataFrame,
+        ohlcv_date_col: str = OHLCV_DATE_COL,
+        ticker_col: str = TICKER_COL,
+    ):
+        self.ohlcv = ohlcv
+        self.date_col = ohlcv_date_col
+        self.ticker_col = ticker_col
+        self._memo: dict[Hashable, Any] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._tokens: list = []
+
+    # ── activation ────────────────────────────────────────────────────
+
+    def __enter__(self) -> FactorContext:
+        # re-entrant: build_factor_pipeline re-enters the run's context
+        self._tokens.append(_ACTIVE.set(self))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _ACTIVE.reset(self._tokens.pop())
+
+    # ── generic memo ──────────────────────────────────────────────────
+
+    def cached(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return ``compute()``, evaluated at most once per ``key``."""
+        if key in self._memo:
+            return self._memo[key]
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        # per-key lock: other threads wait for this key only
+        with key_lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+        return self._memo[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._memo
+
+    # ── shared intermediates ──────────────────────────────────────────
+
+    @property
+    def sorted(self) -> pl.DataFrame:
+        """OHLCV sorted by (ticker, date)."""
+        return self.cached(
+            "sorted", lambda: self.ohlcv.sort([self.ticker_col, self.date_col])
+        )
+
+    def column(self, key: Hashable, expr: pl.Expr) -> pl.Series:
+        """``expr`` evaluated once on ``sorted``, cached under ``key``."""
+        return self.cached(
+            ("column", key),
+            lambda: self.sorted.select(expr.alias(str(key))).to_series(),
+        )
+
+    def simple_return(self, price_col: str = "close") -> pl.Series:
+        """close / previous close − 1 per ticker."""
+        price = pl.col(price_col)
+        return self.column(
+            f"return_{price_col}",
+            price / price.shift(1).over(self.ticker_col) - 1,
+        )
+
+    def log_return(self, price_col: str = "close") -> pl.Series:
+        """log(close / previous close) per ticker."""
+        price = pl.col(price_col)
+        return self.column(
+            f"log_return_{price_col}",
+            (price / price.shift(1).over(self.ticker_col)).log(),
+        )
+
+    def rolling_std(self, source: str, window: int) -> pl.Series:
+        """Per-ticker rolling std of an OHLCV column or a cached series.
+
+        ``source`` is either an OHLCV column or ``"log_return"`` /
+        ``"return"`` (of close).
+        """
+        values = {
+            "log_return": self.log_return,
+            "return": self.simple_return,
+        }.get(source)
+        series = values() if values else self.sorted[source]
+        return self.cached(
+            ("rolling_std", source, window),
+            lambda: self.sorted.select(self.ticker_col)
+            .with_columns(series.alias("_v"))
+            .select(
+                pl.col("_v")
+                .rolling_std(window_size=window)
+                .over(self.ticker_col)
+                .alias(f"{source}_std_{window}")
+            )
+            .to_series(),
+        )
+
+    def cs_rank(self, col: str) -> pl.Series:
+        """Cross-sectional percentile rank of an OHLCV column per date."""
+        from alpha.operators import cs_rank
+
+        return self.column(f"cs_rank_{col}", cs_rank(col, by=self.date_col))
+
+    def indicator(self, name: str, **params) -> pl.DataFrame:
+        """Registered indicator frame, computed once per (name, params)."""
+        from indicators.registry import get_indicator
+
+        key = ("indicator", name, tuple(sorted(params.items())))
+        return self.cached(key, lambda: get_indicator(name)(self.sorted, **params))
+
+
+def active_context() -> FactorContext | None:
+    """The context entered by the innermost ``with FactorContext(...)``."""
+    return _ACTIVE.get()
+
+
+def factor_context(
+    ohlcv: pl.DataFrame,
+    ohlcv_date_col: str = OHLCV_DATE_COL,
+    ticker_col: str = TICKER_COL,
+) -> FactorContext:
+    """The active context if it wraps ``ohlcv``, else a private one."""
+    ctx = _ACTIVE.get()
+    if (
+        ctx is not None
+        and ctx.ohlcv is ohlcv
+        and (ctx.date_col, ctx.ticker_col) == (ohlcv_date_col, ticker_col)
+    ):
+        return ctx
+    return FactorContext(ohlcv, ohlcv_date_col, ticker_col)
@@ -0,0 +1,205 @@
+"""
+Factor Executor — compute many factors concurrently, with per-factor timing.
+
+``build_factor_pipeline`` used to compute factors one after another, so a
+20-factor zoo took the sum of all factor times.  ``compute_factors`` runs
+them on the backend chosen by an ``indicators.base.ExecutionConfig``:
+
+    - ``"serial"`` (default): one after another, in the caller's thread.
+    - ``"thread"``: a thread pool.  Polars-native factors (expression
+      factors, Polars indicators) release the GIL inside Polars, as does
+      TA-Lib.  All threads share the active ``FactorContext``.
+    - ``"process"``: a spawned process pool for GIL-bound (pandas / Python
+      loop) factors.  OHLCV is written once to an Arrow IPC file that every
+      worker memory-maps instead of receiving a pickled copy; results come
+      back as Arrow IPC.  Factors must be registered at import time of the
+      module that defines them, since workers re-import that module.
+
+With enough workers, wall time approaches that of the slowest factor::
+
+    from indicators.base import ExecutionConfig
+
+    factors, seconds = compute_factors(
+        ohlcv, names, execution=ExecutionConfig("thread", n_workers=8)
+    )
+    # seconds: {"momentum": 0.012, "bbiboll": 0.41, ...}
+
+Usage:
+    from factors.executor import compute_factors
+"""
+
+from __future__ import annotations
+
+import contextvars
+import importlib
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from constants import DATE_COL, OHLCV_DATE_COL, TICKER_COL, VALUE_COL
+from factors.context import factor_context
+from factors.factors import get_factor_fn
+
+if TYPE_CHECKING:
+    from indicators.base import ExecutionConfig
+    from portfolio.alpha_config import FactorConfig
+
+
+def compute_factors(
+    ohlcv: pl.DataFrame,
+    factor_names: list[str],
+    factor_configs: dict[str, FactorConfig] | None = None,
+    *,
+    execution: ExecutionConfig | None = None,
+    raw: bool = False,
+    **kwargs,
+) -> tuple[list[pl.DataFrame], dict[str, float]]:
+    """Compute registered factors, optionally in parallel.
+
+    Args:
+        ohlcv: Raw OHLCV DataFrame.
+        factor_names: Registered factor names.
+        factor_configs: Optional ``FactorConfig`` per (lowercase) factor
+            name, passed to each factor as ``factor_config``.
+        execution: Backend (``serial`` / ``thread`` / ``process``) and
+            ``n_workers``; ``chunk_size`` is ignored.  Default: serial.
+        raw: If True, skip the per-factor preprocessing and return each
+            raw signal as ``(date, ticker, value)``, invalid values kept
+            (see ``raw_factor``).
+        **kwargs: Passed to every factor.
+
+    Returns:
+        ``(factors, seconds)`` — the factor DataFrames in the order of
+        ``factor_names`` and the wall time of each factor, in seconds.
+
+    Raises:
+        KeyError: If a factor is not registered.
+    """
+    factor_configs = factor_configs or {}
+    tasks = [(name, factor_configs.get(name.lower())) for name in factor_names]
+    for name, _ in tasks:
+        get_factor_fn(name)
+
+    backend = execution.backend if execution is not None else "serial"
+    n_workers = min(
+        len(tasks), (execution.n_workers if execution else None) or os.cpu_count() or 1
+    )
+
+    with factor_context(ohlcv):
+        if backend == "serial" or n_workers <= 1:
+            results = [_timed(ohlcv, name, fc, raw, kwargs) for name, fc in tasks]
+        elif backend == "thread":
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                # copy_context: worker threads see the active FactorContext
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        _timed,
+                        ohlcv,
+                        name,
+                        fc,
+                        raw,
+                        kwargs,
+                    )
+                    for name, fc in tasks
+                ]
+                results = [f.result() for f in futures]
+        else:
+            results = _compute_in_processes(ohlcv, tasks, n_workers, raw, kwargs)
+
+    factors = [frame for frame, _ in results]
+    seconds = {name.lower(): elapsed for (name, _), (_, elapsed) in zip(tasks, results)}
+    return factors, seconds
+
+
+def raw_factor(
+    ohlcv: pl.DataFrame,
+    name: str,
+    factor_config: FactorConfig | None = None,
+    *,
+    ohlcv_date_col: str = OHLCV_DATE_COL,
+    **kwargs,
+) -> pl.DataFrame:
+    """Factor ``name`` before preprocessing, as ``(date, ticker, value)``.
+
+    Null / NaN / Inf values are kept.  Factors registered with
+    ``raw=False`` preprocess themselves, so theirs are the final values.
+    """
+    factor_fn = get_factor_fn(name)
+    raw_fn = getattr(factor_fn, "__wrapped__", None)
+    if raw_fn is None:
+        return factor_fn(
+            ohlcv, ohlcv_date_col=ohlcv_date_col, factor_config=factor_config, **kwargs
+        )
+    return raw_fn(ohlcv, **kwargs).select(
+        pl.col(ohlcv_date_col).alias(DATE_COL), TICKER_COL, VALUE_COL
+    )
+
+
+def _timed(
+    ohlcv: pl.DataFrame,
+    name: str,
+    factor_config: FactorConfig | None,
+    raw: bool,
+    kwargs: dict,
+) -> tuple[pl.DataFrame, float]:
+    start = time.perf_counter()
+    if raw:
+        frame = raw_factor(ohlcv, name, factor_config, **kwargs)
+    else:
+        frame = get_factor_fn(name)(ohlcv, factor_config=factor_config, **kwargs)
+    return frame, time.perf_counter() - start
+
+
+def _compute_in_processes(
+    ohlcv: pl.DataFrame,
+    tasks: list[tuple[str, FactorConfig | None]],
+    n_workers: int,
+    raw: bool,
+    kwargs: dict,
+) -> list[tuple[pl.DataFrame, float]]:
+    """Process-pool backend: workers memory-map OHLCV from an IPC file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ohlcv.arrow")
+        ohlcv.write_ipc(path)
+        # spawn, not fork: forking a process with live Polars threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _run_in_worker,
+                    path,
+                    get_factor_fn(name).__module__,
+                    name,
+                    fc,
+                    raw,
+                    kwargs,
+                )
+                for name, fc in tasks
+            ]
+            outputs = [f.result() for f in futures]
+    return [(pl.read_ipc(io.BytesIO(payload)), elapsed) for payload, elapsed in outputs]
+
+
+def _run_in_worker(
+    path: str,
+    module: str,
+    name: str,
+    factor_config: FactorConfig | None,
+    raw: bool,
+    kwargs: dict,
+) -> tuple[bytes, float]:
+    """Process-pool worker: register the factor, compute it, return IPC bytes."""
+    importlib.import_module(module)
+    ohlcv = pl.read_ipc(path, memory_map=True)
+    frame, elapsed = _timed(ohlcv, name, factor_config, raw, kwargs)
+    buf = io.BytesIO()
+    frame.write_ipc(buf)
+    return buf.getvalue(), elapsed
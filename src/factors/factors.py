@@ -20,8 +20,25 @@ Set ``raw=False`` if the function handles post-processing itself::
     @register_factor("custom", raw=False)
     def custom(ohlcv, *, factor_config=None, **kw): ...
 
+Expression factors return a ``pl.Expr`` for the raw signal instead of a
+frame, evaluated on OHLCV sorted by (ticker, date).  They behave like any
+other factor through ``get_factor_fn``, and ``factors.plan`` can compile
+many of them, with their preprocessing, into one lazy query::
+
+    @register_factor("momentum", kind="expr")
+    def momentum(*, lookback=20, **kw) -> pl.Expr:
+        return (pl.col("close") / pl.col("close").shift(lookback).over("ticker")).log()
+
+Declare ``lookback`` (rows of history per ticker behind one value, an int
+or a function of the factor kwargs) to let ``compute_factor_incremental``
+cache the raw signal and recompute only newly appended bars::
+
+    @register_factor("momentum", lookback=lambda lookback=20, **_: lookback)
+    def compute_momentum(ohlcv, *, lookback=20, **kw): ...
+
 Usage:
     from factors import register_factor, list_factors, get_factor_fn
+    from factors import compute_factor_incremental
 
 Reference: guidance/quant_lab.pdf — Part III
 """
@@ -29,19 +46,49 @@ Reference: guidance/quant_lab.pdf — Part III
 from __future__ import annotations
 
 from functools import wraps
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Union
 
 import polars as pl
 
 from alpha.preprocessing import preprocess_factor
 from constants import DATE_COL, OHLCV_DATE_COL, TICKER_COL, VALUE_COL
+from factors.context import factor_context
 
 if TYPE_CHECKING:
+    from indicators.cache import IndicatorCache
     from portfolio.alpha_config import FactorConfig
 
 # ── Registry ──────────────────────────────────────────────────────────────────
 
 _FACTOR_REGISTRY: dict[str, Callable[..., pl.DataFrame]] = {}
+_FACTOR_LOOKBACK: dict[str, Union[int, Callable[..., int]]] = {}
+_FACTOR_EXPRS: dict[str, Callable[..., pl.Expr]] = {}
+
+
+def _postprocess(
+    raw: pl.DataFrame,
+    ohlcv_date_col: str,
+    factor_config: FactorConfig | None,
+) -> pl.DataFrame:
+    """Filter, select ``(date, ticker, value)`` and ``preprocess_factor``."""
+    from portfolio.alpha_config import FactorConfig as _FC
+
+    fc = factor_config or _FC()
+    clean = raw.filter(
+        pl.col(VALUE_COL).is_not_null()
+        & pl.col(VALUE_COL).is_not_nan()
+        & pl.col(VALUE_COL).is_finite()
+    ).select(
+        pl.col(ohlcv_date_col).alias(DATE_COL),
+        pl.col(TICKER_COL),
+        pl.col(VALUE_COL),
+    )
+    return preprocess_factor(
+        clean,
+        winsorize_pct=fc.winsorize_pct,
+        method=fc.normalize_method,
+        neutralize=fc.neutralize,
+    )
 
 
 def _make_wrapper(
@@ -66,38 +113,32 @@ def _make_wrapper(
         factor_config: FactorConfig | None = None,
         **kwargs,
     ) -> pl.DataFrame:
-        from portfolio.alpha_config import FactorConfig as _FC
-
-        fc = factor_config or _FC()
-
         # Let the raw function compute the signal
         raw = fn(ohlcv, **kwargs)
 
         # Standard post-processing
-        clean = raw.filter(
-            pl.col(VALUE_COL).is_not_null()
-            & pl.col(VALUE_COL).is_not_nan()
-            & pl.col(VALUE_COL).is_finite()
-        ).select(
-            pl.col(ohlcv_date_col).alias(DATE_COL),
-            pl.col(TICKER_COL),
-            pl.col(VALUE_COL),
-        )
-        return preprocess_factor(
-            clean,
-            winsorize_pct=fc.winsorize_pct,
-            method=fc.normalize_method,
-            neutralize=fc.neutralize,
-        )
+        return _postprocess(raw, ohlcv_date_col, factor_config)
 
     return wrapper
 
 
+def _expr_frame_fn(fn: Callable[..., pl.Expr]) -> Callable[..., pl.DataFrame]:
+    """Raw frame function of an expression factor."""
+
+    @wraps(fn)
+    def raw_fn(ohlcv: pl.DataFrame, **kwargs) -> pl.DataFrame:
+        return factor_context(ohlcv).sorted.with_columns(fn(**kwargs).alias(VALUE_COL))
+
+    return raw_fn
+
+
 def register_factor(
     name: str,
     fn: Callable[..., pl.DataFrame] | None = None,
     *,
     raw: bool = True,
+    lookback: Union[int, Callable[..., int], None] = None,
+    kind: str = "frame",
 ):
     """Register a factor computation function.
 
@@ -118,23 +159,70 @@ def register_factor(
             with standard post-processing (filter + select + preprocess).
             Set ``False`` to register a function that handles its own
             post-processing.
+        lookback: Rows of history per ticker needed to reproduce one raw
+            value — an int, or a function of the factor kwargs.  Enables
+            incremental updates in ``compute_factor_incremental`` (only
+            for ``raw=True`` factors).
+        kind: ``"frame"`` — ``fn(ohlcv, **kw) -> DataFrame`` with a
+            ``value`` column; ``"expr"`` — ``fn(**kw) -> pl.Expr`` for the
+            raw signal on OHLCV sorted by (ticker, date).  Expression
+            factors always get the standard post-processing.
     """
+    if kind not in ("frame", "expr"):
+        raise ValueError(f"Unknown factor kind '{kind}'. Use 'frame' or 'expr'.")
+    if kind == "expr" and not raw:
+        raise ValueError("Expression factors always use standard post-processing.")
     if fn is not None:
         # Direct call — register as-is (backward compat with tests)
         _FACTOR_REGISTRY[name.lower()] = fn
+        _FACTOR_EXPRS.pop(name.lower(), None)
         return fn
 
     def decorator(fn: Callable[..., pl.DataFrame]):
-        wrapped = _make_wrapper(fn) if raw else fn
+        if kind == "expr":
+            _FACTOR_EXPRS[name.lower()] = fn
+            wrapped = _make_wrapper(_expr_frame_fn(fn))
+        else:
+            wrapped = _make_wrapper(fn) if raw else fn
+            _FACTOR_EXPRS.pop(name.lower(), None)
         _FACTOR_REGISTRY[name.lower()] = wrapped
+        if raw and lookback is not None:
+            _FACTOR_LOOKBACK[name.lower()] = lookback
         return wrapped
 
     return decorator
 
 
-def list_factors() -> list[str]:
-    """Return names of all registered factors."""
-    return sorted(_FACTOR_REGISTRY.keys())
+def list_factors(kind: str | None = None) -> list[str]:
+    """Return names of all registered factors (optionally of one kind)."""
+    if kind is None:
+        return sorted(_FACTOR_REGISTRY.keys())
+    exprs = set(_FACTOR_EXPRS)
+    return sorted(n for n in _FACTOR_REGISTRY if (n in exprs) == (kind == "expr"))
+
+
+def get_factor_expr(name: str, **kwargs) -> pl.Expr:
+    """Raw-signal expression of a ``kind="expr"`` factor.
+
+    Evaluate it on OHLCV sorted by (ticker, date).
+
+    Raises:
+        KeyError: If the factor is not registered.
+        ValueError: If the factor is not an expression factor.
+    """
+    get_factor_fn(name)
+    key = name.lower()
+    if key not in _FACTOR_EXPRS:
+        raise ValueError(f"Factor '{name}' is not an expression factor.")
+    return _FACTOR_EXPRS[key](**kwargs)
+
+
+def factor_lookback(name: str, **kwargs) -> int | None:
+    """Declared ``lookback`` of a factor for these kwargs (None if undeclared)."""
+    lookback = _FACTOR_LOOKBACK.get(name.lower())
+    if callable(lookback):
+        return int(lookback(**kwargs))
+    return lookback
 
 
 def get_factor_fn(name: str) -> Callable[..., pl.DataFrame]:
@@ -157,3 +245,43 @@ def get_factor_fn(name: str) -> Callable[..., pl.DataFrame]:
             f"Use register_factor() to add custom factors."
         )
     return _FACTOR_REGISTRY[key]
+
+
+def compute_factor_incremental(
+    name: str,
+    ohlcv: pl.DataFrame,
+    cache: IndicatorCache,
+    *,
+    ohlcv_date_col: str = OHLCV_DATE_COL,
+    factor_config: FactorConfig | None = None,
+    **kwargs,
+) -> pl.DataFrame:
+    """Compute a factor, caching its raw signal across calls.
+
+    The raw ``(date, ticker, value)`` signal is stored in ``cache`` under
+    ``factor_{name}`` and the kwargs.  When ``ohlcv`` only gained new bars
+    since the cached call and the factor declared a ``lookback``, just the
+    new bars (plus ``lookback`` rows of context per ticker) are recomputed.
+    Post-processing is cross-sectional per date and always runs on the
+    full signal, so the result equals ``get_factor_fn(name)(ohlcv, ...)``.
+
+    Raises:
+        KeyError: If the factor is not registered.
+        ValueError: If the factor was not registered with ``raw=True``.
+    """
+    wrapped = get_factor_fn(name)
+    fn = getattr(wrapped, "__wrapped__", None)
+    if fn is None:
+        raise ValueError(
+            f"Factor '{name}' handles its own post-processing; "
+            f"incremental computation needs a raw=True factor."
+        )
+    lookback = factor_lookback(name, **kwargs)
+
+    def compute(df: pl.DataFrame) -> pl.DataFrame:
+        return fn(df, **kwargs).select(ohlcv_date_col, TICKER_COL, VALUE_COL)
+
+    raw = cache.get_or_compute(
+        f"factor_{name.lower()}", ohlcv, compute, params=kwargs, lookback=lookback
+    )
+    return _postprocess(raw, ohlcv_date_col, factor_config)
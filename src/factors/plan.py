@@ -0,0 +1,119 @@
+"""
+Factor Plan — compile several factors and their preprocessing into one lazy query.
+
+Computing factors one by one runs a separate sort / filter / select /
+winsorize / normalize pass per factor, then joins the results.  For
+expression factors (``kind="expr"``) all of that can be expressed as
+columns of a single ``LazyFrame``: every raw signal is evaluated on the
+shared (ticker, date)-sorted OHLCV, preprocessed with ``preprocess_columns``
+side by side, and Polars optimises and runs the whole graph at once::
+
+    plan = build_factor_plan(ohlcv, ["momentum", "vol_ratio", "alpha001"])
+    composite = combine_columns(plan, ["momentum", "vol_ratio", "alpha001"],
+                                [1 / 3] * 3).collect()
+
+The plan is wide: ``(date, ticker, <factor_1>, ..., <factor_k>)``, one
+column per factor, null where the factor has no valid value.  Frame
+factors (e.g. TA-Lib based ones) are computed eagerly and joined into
+the plan, so any registered factor can be part of it.  Each column equals
+``get_factor_fn(name)(ohlcv, factor_config=fc)`` on its non-null rows.
+
+Usage:
+    from factors.plan import build_factor_plan
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from alpha.preprocessing import preprocess_columns
+from constants import DATE_COL, OHLCV_DATE_COL, TICKER_COL, VALUE_COL
+from factors.context import factor_context
+from factors.factors import get_factor_expr, get_factor_fn, list_factors
+
+if TYPE_CHECKING:
+    from portfolio.alpha_config import FactorConfig
+
+
+def build_factor_plan(
+    ohlcv: pl.DataFrame,
+    factor_names: list[str],
+    factor_configs: dict[str, FactorConfig] | None = None,
+    *,
+    ohlcv_date_col: str = OHLCV_DATE_COL,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Lazy wide frame of preprocessed factors.
+
+    Args:
+        ohlcv: Raw OHLCV DataFrame.
+        factor_names: Registered factor names (one output column each).
+        factor_configs: Optional ``FactorConfig`` per (lowercase) factor
+            name; missing factors use the defaults.  ``direction == -1``
+            negates the preprocessed column.
+        ohlcv_date_col: Date column in ``ohlcv``.
+        **kwargs: Passed to every factor.
+
+    Returns:
+        LazyFrame with columns ``(date, ticker, *factor_names)``.
+
+    Raises:
+        KeyError: If a factor is not registered.
+        ValueError: On duplicate factor names, or if a config asks for
+            sector neutralization (no sectors are available here).
+    """
+    from portfolio.alpha_config import FactorConfig as _FC
+
+    names = [name.lower() for name in factor_names]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate factor names in {factor_names}.")
+    factor_configs = factor_configs or {}
+    expr_factors = set(list_factors(kind="expr"))
+
+    ctx = factor_context(ohlcv, ohlcv_date_col)
+    plan = ctx.sorted.lazy()
+    raw_exprs: list[pl.Expr] = []
+    processed: set[str] = set()
+    for name in names:
+        fc = factor_configs.get(name) or _FC()
+        if "sector" in fc.neutralize:
+            raise ValueError("sectors DataFrame required for sector neutralization.")
+        if name in expr_factors:
+            raw_exprs.append(get_factor_expr(name, **kwargs).alias(name))
+            continue
+        factor_fn = get_factor_fn(name)
+        raw_fn = getattr(factor_fn, "__wrapped__", None)
+        if raw_fn is None:
+            # raw=False: the factor preprocesses itself
+            frame = factor_fn(
+                ohlcv, ohlcv_date_col=ohlcv_date_col, factor_config=fc, **kwargs
+            ).rename({DATE_COL: ohlcv_date_col})
+            processed.add(name)
+        else:
+            frame = raw_fn(ohlcv, **kwargs)
+        plan = plan.join(
+            frame.lazy().select(
+                ohlcv_date_col, TICKER_COL, pl.col(VALUE_COL).alias(name)
+            ),
+            on=[ohlcv_date_col, TICKER_COL],
+            how="left",
+        )
+
+    plan = plan.with_columns(raw_exprs)
+    configs = {name: factor_configs.get(name) or _FC() for name in names}
+    raw_names = [name for name in names if name not in processed]
+    plan = preprocess_columns(
+        plan,
+        raw_names,
+        winsorize_pct={n: configs[n].winsorize_pct for n in raw_names},
+        method={n: configs[n].normalize_method for n in raw_names},
+        date_col=ohlcv_date_col,
+    )
+
+    return plan.select(
+        pl.col(ohlcv_date_col).alias(DATE_COL),
+        pl.col(TICKER_COL),
+        *(-pl.col(n) if configs[n].direction == -1 else pl.col(n) for n in names),
+    )
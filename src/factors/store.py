@@ -0,0 +1,288 @@
+"""
+Factor Store — persisted, versioned factor values.
+
+Notebooks and walk-forward folds used to recompute every factor from
+OHLCV.  A ``FactorStore`` keeps the preprocessed ``(date, ticker, value)``
+frames on disk instead, one versioned table per factor:
+
+    - The version is a hash of the factor function's source, its params
+      and its ``FactorConfig``, so editing the code or changing a setting
+      starts a new version instead of serving stale values.
+    - ``update`` appends only dates newer than the stored ones (computed
+      with ``lookback`` rows of warm-up per ticker when the factor declares
+      one).  Preprocessing is cross-sectional per date, so appended dates
+      match a full recompute.  If the stored history of the OHLCV changed
+      (e.g. a split adjustment), the version is rebuilt from scratch.
+    - ``load`` reads a date slice; each update writes one Parquet part,
+      so date filters skip whole files via Parquet statistics.
+
+layout:
+    {root}/factors/{name}/{version}/part-00000.parquet, part-00001.parquet, ...
+    {root}/factors/{name}/{version}/watermark.parquet  (last OHLCV timestamp)
+    {root}/factors/{name}/{version}/meta.json          (params, fingerprint)
+
+Usage:
+    from factors.store import FactorStore
+
+    store = FactorStore(cache_dir)
+    store.update(ohlcv, "momentum", lookback=20)       # after the data update
+    mom = store.load("momentum", start=fold_start, end=fold_end, lookback=20)
+
+    factor_fn = store.get_factor_fn("momentum")        # drop-in for get_factor_fn
+    mom = factor_fn(ohlcv, lookback=20)
+
+Command line (after ``scripts/incremental_update/data_update.sh``):
+    python src/factors/store.py update --factors momentum vol_ratio --start 2023-01-01
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING, Any, Callable
+
+import polars as pl
+
+from constants import DATE_COL, OHLCV_DATE_COL, TICKER_COL
+from factors.factors import factor_lookback, get_factor_fn
+
+if TYPE_CHECKING:
+    from portfolio.alpha_config import FactorConfig
+
+
+class FactorStore:
+    """Parquet store of preprocessed factor values.
+
+    Args:
+        cache_dir: Root directory; tables go under ``{cache_dir}/factors``.
+        ohlcv_date_col: Date column of the OHLCV input.
+        ticker_col: Ticker column of the OHLCV input.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ohlcv_date_col: str = OHLCV_DATE_COL,
+        ticker_col: str = TICKER_COL,
+    ):
+        from indicators.cache import IndicatorCache
+
+        self.root = os.path.join(cache_dir, "factors")
+        self.ohlcv_date_col = ohlcv_date_col
+        self.ticker_col = ticker_col
+        # same OHLCV fingerprint as the indicator cache
+        self._fingerprint = IndicatorCache(
+            cache_dir, ticker_col=ticker_col, date_col=ohlcv_date_col
+        ).fingerprint
+
+    # ── versions ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def source_hash(name: str) -> str:
+        """Hash of the source of the function behind factor ``name``."""
+        fn = inspect.unwrap(get_factor_fn(name))
+        try:
+            source = inspect.getsource(fn).encode()
+        except (OSError, TypeError):
+            source = fn.__code__.co_code
+        return hashlib.sha256(source).hexdigest()[:16]
+
+    def version(
+        self, name: str, factor_config: FactorConfig | None = None, **params
+    ) -> str:
+        """Version key: factor source hash + params + ``FactorConfig``."""
+        payload = json.dumps(
+            {
+                "name": name.lower(),
+                "source": self.source_hash(name),
+                "params": params,
+                "factor_config": self._config_dict(factor_config),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _config_dict(factor_config: FactorConfig | None) -> dict:
+        from portfolio.alpha_config import FactorConfig as _FC
+
+        return dataclasses.asdict(factor_config or _FC())
+
+    def _dir(self, name: str, version: str) -> str:
+        return os.path.join(self.root, name.lower(), version)
+
+    def _read_meta(self, path: str) -> dict | None:
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    # ── read ──────────────────────────────────────────────────────────
+
+    def load(
+        self,
+        name: str,
+        factor_config: FactorConfig | None = None,
+        start: Any = None,
+        end: Any = None,
+        **params,
+    ) -> pl.DataFrame | None:
+        """Stored ``(date, ticker, value)`` rows with start <= date <= end.
+
+        Returns None if this factor version was never computed.
+        """
+        path = self._dir(name, self.version(name, factor_config, **params))
+        if self._read_meta(path) is None:
+            return None
+        scan = self._scan(path)
+        if start is not None:
+            scan = scan.filter(pl.col(DATE_COL) >= start)
+        if end is not None:
+            scan = scan.filter(pl.col(DATE_COL) <= end)
+        return scan.sort(DATE_COL, self.ticker_col).collect()
+
+    @staticmethod
+    def _scan(path: str) -> pl.LazyFrame:
+        return pl.scan_parquet(os.path.join(path, "part-*.parquet"))
+
+    # ── write ─────────────────────────────────────────────────────────
+
+    def update(
+        self,
+        ohlcv: pl.DataFrame,
+        name: str,
+        factor_config: FactorConfig | None = None,
+        **params,
+    ) -> pl.DataFrame:
+        """Compute and store the dates of ``ohlcv`` not stored yet.
+
+        Returns:
+            The newly stored rows (empty if the store was up to date).
+        """
+        version = self.version(name, factor_config, **params)
+        path = self._dir(name, version)
+        meta = self._read_meta(path)
+        factor_fn = get_factor_fn(name)
+        ts = pl.col(self.ohlcv_date_col)
+
+        def compute(frame: pl.DataFrame) -> pl.DataFrame:
+            return factor_fn(frame, factor_config=factor_config, **params)
+
+        if meta is not None:
+            watermark = pl.read_parquet(os.path.join(path, "watermark.parquet"))
+            last = watermark[self.ohlcv_date_col][0]
+            prefix = ohlcv.filter(ts <= last)
+            if self._fingerprint(prefix) == meta["fingerprint"]:
+                new_rows = ohlcv.filter(ts > last)
+                if new_rows.is_empty():
+                    return self._scan(path).head(0).collect()
+                fresh = self._compute_new(
+                    name, prefix, new_rows, compute, **params
+                ).filter(pl.col(DATE_COL) > last)
+                return self._write(path, meta, ohlcv, fresh)
+            # stored history no longer matches the OHLCV: rebuild
+            shutil.rmtree(path)
+
+        meta = {
+            "name": name.lower(),
+            "version": version,
+            "source": self.source_hash(name),
+            "params": params,
+            "factor_config": self._config_dict(factor_config),
+            "parts": 0,
+        }
+        return self._write(path, meta, ohlcv, compute(ohlcv))
+
+    def get_or_compute(
+        self,
+        name: str,
+        ohlcv: pl.DataFrame,
+        factor_config: FactorConfig | None = None,
+        **params,
+    ) -> pl.DataFrame:
+        """``get_factor_fn(name)(ohlcv, ...)``, served from the store.
+
+        Updates the store first, so ``ohlcv`` must be the full history the
+        store tracks; use ``load(start=..., end=...)`` for date slices.
+        """
+        self.update(ohlcv, name, factor_config, **params)
+        return self.load(name, factor_config, **params)
+
+    def get_factor_fn(self, name: str) -> Callable[..., pl.DataFrame]:
+        """Store-backed drop-in for ``factors.get_factor_fn(name)``."""
+        get_factor_fn(name)
+
+        def factor_fn(
+            ohlcv: pl.DataFrame,
+            *,
+            factor_config: FactorConfig | None = None,
+            **params,
+        ) -> pl.DataFrame:
+            return self.get_or_compute(name, ohlcv, factor_config, **params)
+
+        return factor_fn
+
+    def _compute_new(
+        self,
+        name: str,
+        prefix: pl.DataFrame,
+        new_rows: pl.DataFrame,
+        compute: Callable[[pl.DataFrame], pl.DataFrame],
+        **params,
+    ) -> pl.DataFrame:
+        """Factor on the new rows, warmed up with ``lookback`` rows per ticker."""
+        lookback = factor_lookback(name, **params)
+        if lookback is None:
+            return compute(pl.concat([prefix, new_rows], how="vertical_relaxed"))
+        context = (
+            prefix.sort(self.ticker_col, self.ohlcv_date_col)
+            .group_by(self.ticker_col, maintain_order=True)
+            .tail(lookback)
+            .filter(pl.col(self.ticker_col).is_in(new_rows[self.ticker_col].implode()))
+            .select(new_rows.columns)
+        )
+        return compute(pl.concat([context, new_rows], how="vertical_relaxed"))
+
+    def _write(
+        self, path: str, meta: dict, ohlcv: pl.DataFrame, fresh: pl.DataFrame
+    ) -> pl.DataFrame:
+        os.makedirs(path, exist_ok=True)
+        fresh = fresh.sort(DATE_COL, self.ticker_col)
+        fresh.write_parquet(os.path.join(path, f"part-{meta['parts']:05d}.parquet"))
+        ohlcv.select(pl.col(self.ohlcv_date_col).max()).write_parquet(
+            os.path.join(path, "watermark.parquet")
+        )
+        meta = {**meta, "parts": meta["parts"] + 1}
+        meta["fingerprint"] = self._fingerprint(ohlcv)
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, default=str)
+        return fresh
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="factor store")
+    parser.add_argument("command", choices=["update"])
+    parser.add_argument(
+        "--factors", nargs="+", default=["bbiboll", "vol_ratio"], help="Factor names"
+    )
+    parser.add_argument("--start", default="2023-01-01", help="OHLCV start date")
+    parser.add_argument("--root", default=None, help="Store root (default: cache_dir)")
+    args = parser.parse_args()
+
+    import factors.alphas.basic101  # noqa: F401
+    from config import cache_dir
+    from data.loader.data_loader import stock_load_process
+
+    store = FactorStore(args.root or cache_dir)
+    ohlcv = stock_load_process(start_date=args.start).collect()
+    for factor_name in args.factors:
+        added = store.update(ohlcv, factor_name)
+        print(f"{factor_name}: {added.height} rows added")
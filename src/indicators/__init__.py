@@ -1,2 +1,3 @@
 # Import all indicators to register them
 from .basic_indicator import *
+from .expr_indicator import *
@@ -1,11 +1,46 @@
 # indicators/base.py
-from typing import Callable
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Literal, Optional
 
+import numpy as np
 import polars as pl
 
 
+@dataclass(frozen=True)
+class ExecutionConfig:
+    """
+    How apply_grouped runs a per-ticker indicator function.
+
+    Attributes:
+        backend: "serial" (Polars map_groups, default), "thread" (thread pool
+            over ticker shards; TA-Lib releases the GIL) or "process"
+            (process pool over ticker shards, frames shipped as Arrow IPC)
+        n_workers: pool size (default: os.cpu_count())
+        chunk_size: tickers per shard (default: spread tickers over ~4
+            shards per worker)
+    """
+
+    backend: Literal["serial", "thread", "process"] = "serial"
+    n_workers: Optional[int] = None
+    chunk_size: Optional[int] = None
+
+    def __post_init__(self):
+        if self.backend not in ("serial", "thread", "process"):
+            raise ValueError(
+                f"Unknown backend '{self.backend}'. "
+                "Use 'serial', 'thread' or 'process'."
+            )
+
+
 def apply_grouped(
-    df: pl.DataFrame, func: Callable[[pl.DataFrame, dict], pl.DataFrame], **params
+    df: pl.DataFrame,
+    func: Callable[[pl.DataFrame, dict], pl.DataFrame],
+    execution: Optional[ExecutionConfig] = None,
+    **params,
 ) -> pl.DataFrame:
     """
     ohlcv_data schema
@@ -24,9 +59,110 @@ def apply_grouped(
         ('split_ratio', Float64)
     ])
 
+    execution selects a parallel backend; the parallel backends return
+    tickers in sorted order. For the process backend func must be
+    picklable (registered indicators are).
     """
-    return (
-        df.sort(["ticker", "timestamps"])
-        .group_by("ticker")
-        .map_groups(lambda g: func(g, **params))
+    if execution is None or execution.backend == "serial":
+        return (
+            df.sort(["ticker", "timestamps"])
+            .group_by("ticker")
+            .map_groups(lambda g: func(g, **params))
+        )
+
+    groups = df.sort(["ticker", "timestamps"]).partition_by(
+        "ticker", maintain_order=True
     )
+    if not groups:
+        return func(df, **params)
+
+    n_workers = execution.n_workers or os.cpu_count() or 1
+    chunk_size = execution.chunk_size or max(1, -(-len(groups) // (n_workers * 4)))
+    shards = [groups[i : i + chunk_size] for i in range(0, len(groups), chunk_size)]
+
+    if execution.backend == "thread":
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            results = list(pool.map(lambda s: _run_shard(func, s, params), shards))
+    else:
+        payloads = [_to_ipc(pl.concat(shard)) for shard in shards]
+        # spawn, not fork: forking a process with live Polars threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = [
+                pl.read_ipc(io.BytesIO(out))
+                for out in pool.map(
+                    _run_shard_ipc,
+                    [func] * len(payloads),
+                    payloads,
+                    [params] * len(payloads),
+                )
+            ]
+
+    return pl.concat(results)
+
+
+def _run_shard(func: Callable, groups: List[pl.DataFrame], params: dict):
+    """Run func on each ticker frame of a shard."""
+    return pl.concat([func(g, **params) for g in groups])
+
+
+def _run_shard_ipc(func: Callable, payload: bytes, params: dict) -> bytes:
+    """Process-pool worker: IPC bytes in, IPC bytes out."""
+    shard = pl.read_ipc(io.BytesIO(payload))
+    groups = shard.partition_by("ticker", maintain_order=True)
+    return _to_ipc(_run_shard(func, groups, params))
+
+
+def _to_ipc(df: pl.DataFrame) -> bytes:
+    buf = io.BytesIO()
+    df.write_ipc(buf)
+    return buf.getvalue()
+
+
+def ts_rank(
+    values: np.ndarray,
+    window: int,
+    min_periods: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """
+    Rolling rank: number of values in the trailing window that are <= the
+    current value (the current value counts itself).
+
+    The window at row i is values[max(0, i - window + 1) : i + 1]. Rows with
+    fewer than min_periods values in their window are NaN. NaN never counts
+    as <= anything, so a NaN current value ranks 0.
+
+    Vectorised over a sliding-window view, processed chunk_size rows at a
+    time so memory stays at O(chunk_size * window).
+
+    Args:
+        values: 1-D series for a single ticker, in time order
+        window: trailing window length
+        min_periods: minimum window fill before a rank is emitted
+            (default: window)
+        chunk_size: rows compared per block
+
+    Returns:
+        float64 array of ranks, same length as values
+    """
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    if min_periods is None:
+        min_periods = window
+    out = np.full(n, np.nan)
+    if n == 0 or window <= 0:
+        return out
+
+    # Left-pad with NaN so every row sees a full-length window
+    padded = np.concatenate([np.full(window - 1, np.nan), x])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+
+    for lo in range(0, n, chunk_size):
+        hi = min(lo + chunk_size, n)
+        out[lo:hi] = (windows[lo:hi] <= x[lo:hi, None]).sum(axis=1)
+
+    # Warm-up: window length at row i is min(i + 1, window)
+    out[np.minimum(np.arange(n) + 1, window) < min_periods] = np.nan
+    return out
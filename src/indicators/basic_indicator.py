@@ -2,10 +2,27 @@ import numpy as np
 import polars as pl
 import talib
 
+from .base import ts_rank
 from .registry import register
 
 
-@register("obv", grouped=True)
+def bbiboll_lookback(boll_length: int = 11, pct_window: int = 252) -> int:
+    """
+    rows of history before a bar that its bbiboll values depend on:
+    dev_pct ranks pct_window devs, each dev spans boll_length BBIs and the
+    slowest BBI average spans 24 closes
+    """
+    return pct_window + boll_length + 22
+
+
+def refresh_longterm_rank(df: pl.DataFrame) -> pl.DataFrame:
+    """rebuild the all-history dev rank after bars are appended"""
+    return df.with_columns(
+        pl.col("dev").rank("ordinal").over("ticker").alias("longterm_dev_pct_rank")
+    )
+
+
+@register("obv", grouped=True, lookback=1, cumulative=("obv",))
 def calculate_obv(df: pl.DataFrame) -> pl.DataFrame:
     close = df["close"].cast(pl.Float64).to_numpy()
     volume = df["volume"].cast(pl.Float64).to_numpy().astype("float64")
@@ -13,7 +30,14 @@ def calculate_obv(df: pl.DataFrame) -> pl.DataFrame:
     return df.with_columns(pl.Series("obv", obv))
 
 
-@register("bbiboll", grouped=True)
+@register(
+    "bbiboll",
+    grouped=True,
+    lookback=lambda boll_length=11, pct_window=252, **_: bbiboll_lookback(
+        boll_length, pct_window
+    ),
+    refresh=refresh_longterm_rank,
+)
 def calculate_bbiboll(
     df: pl.DataFrame,
     boll_length: int = 11,
@@ -64,20 +88,8 @@ def calculate_bbiboll(
 
     min_periods = min(50, pct_window // 3)
 
-    dev_ranks = []
-    rank_ends = []
     dev_values = result.select("dev").to_numpy().flatten()
-
-    for i in range(len(dev_values)):
-        start_idx = max(0, i - pct_window + 1) if i >= min_periods else 0
-        window_values = dev_values[start_idx : i + 1]
-
-        if len(window_values) >= min_periods:
-            # calculate rank in window
-            rank = np.sum(window_values <= dev_values[i])
-            dev_ranks.append(rank)
-        else:
-            dev_ranks.append(np.nan)
+    dev_ranks = ts_rank(dev_values, pct_window, min_periods=min_periods)
 
     result = result.with_columns(
         [
@@ -0,0 +1,243 @@
+# indicators/cache.py
+"""
+Parquet cache for indicator frames.
+
+Entries are keyed by (indicator name, params) and validated against a
+fingerprint of the OHLCV input (row count, min/max timestamp, content
+hash), so changing a parameter or the data never serves a stale frame.
+Parquet keeps dtypes (including tz-aware timestamps) exactly, with no
+date parsing on load.
+
+When new dates are appended to the OHLCV and the cached prefix is
+unchanged, get_or_compute() recomputes only the new rows, using the last
+`lookback` rows per ticker as warm-up context. Running-total columns
+(e.g. OBV) are re-anchored onto the cached values, and columns that depend
+on the whole history (e.g. an all-time rank) can be rebuilt by a refresh
+hook over the combined frame.
+
+layout:
+    {cache_dir}/indicators/{name}/{params_key}.parquet
+    {cache_dir}/indicators/{name}/{params_key}.json   (fingerprint, params)
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+import polars as pl
+
+
+class IndicatorCache:
+    """
+    Args:
+        cache_dir: root directory; entries go under {cache_dir}/indicators
+        ticker_col: ticker column of the OHLCV frame
+        date_col: timestamp column of the OHLCV frame
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ticker_col: str = "ticker",
+        date_col: str = "timestamps",
+    ):
+        self.root = os.path.join(cache_dir, "indicators")
+        self.ticker_col = ticker_col
+        self.date_col = date_col
+
+    # ── keys ──────────────────────────────────────────────────────────
+
+    def fingerprint(self, ohlcv: pl.DataFrame) -> Dict[str, Any]:
+        """row count, timestamp range and an order-independent content hash"""
+        if ohlcv.is_empty():
+            return {"rows": 0, "min_ts": None, "max_ts": None, "hash": "0"}
+        row_hashes = ohlcv.hash_rows(seed=0).to_numpy()
+        return {
+            "rows": ohlcv.height,
+            "min_ts": str(ohlcv[self.date_col].min()),
+            "max_ts": str(ohlcv[self.date_col].max()),
+            # row hashes are only stable within a Polars version
+            "hash": f"{pl.__version__}:{int(row_hashes.sum(dtype=np.uint64))}",
+        }
+
+    @staticmethod
+    def params_key(name: str, params: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"name": name, "params": params}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def _paths(self, name: str, params: Dict[str, Any]) -> tuple[str, str]:
+        base = os.path.join(self.root, name, self.params_key(name, params))
+        return f"{base}.parquet", f"{base}.json"
+
+    def _read_meta(self, name: str, params: Dict[str, Any]) -> Optional[dict]:
+        data_path, meta_path = self._paths(name, params)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    # ── load / save ───────────────────────────────────────────────────
+
+    def load(
+        self, name: str, params: Dict[str, Any], ohlcv: pl.DataFrame
+    ) -> Optional[pl.DataFrame]:
+        """cached frame if it was computed from exactly this OHLCV, else None"""
+        meta = self._read_meta(name, params)
+        if meta is None or meta["fingerprint"] != self.fingerprint(ohlcv):
+            return None
+        return pl.read_parquet(self._paths(name, params)[0])
+
+    def save(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        ohlcv: pl.DataFrame,
+        result: pl.DataFrame,
+    ) -> str:
+        """write result and its fingerprint; returns the parquet path"""
+        data_path, meta_path = self._paths(name, params)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        result.write_parquet(data_path)
+        meta = {
+            "name": name,
+            "params": params,
+            "fingerprint": self.fingerprint(ohlcv),
+        }
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2, default=str)
+        return data_path
+
+    # ── get or compute ────────────────────────────────────────────────
+
+    def get_or_compute(
+        self,
+        name: str,
+        ohlcv: pl.DataFrame,
+        compute: Callable[[pl.DataFrame], pl.DataFrame],
+        params: Optional[Dict[str, Any]] = None,
+        lookback: Optional[int] = None,
+        cumulative: Sequence[str] = (),
+        refresh: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+    ) -> pl.DataFrame:
+        """
+        return the cached frame, extend it incrementally, or compute it
+
+        Args:
+            name: indicator name (cache namespace)
+            ohlcv: full OHLCV input
+            compute: ohlcv -> indicator frame (one row per input row)
+            params: parameters that affect the result (part of the key)
+            lookback: rows of history per ticker the indicator needs to
+                reproduce a row. If given and the cache covers an unchanged
+                prefix of ohlcv, only rows after the cached max timestamp
+                are computed. None disables incremental updates.
+            cumulative: running-total columns; appended values are shifted
+                so each ticker continues from its cached last value
+            refresh: applied to the combined (cached + appended) frame,
+                sorted by ticker and timestamp, to rebuild columns that
+                depend on the full history
+        """
+        params = params or {}
+        meta = self._read_meta(name, params)
+        fingerprint = self.fingerprint(ohlcv)
+
+        if meta is not None and meta["fingerprint"] == fingerprint:
+            return pl.read_parquet(self._paths(name, params)[0])
+
+        if meta is not None and lookback is not None:
+            appended = self._append(
+                name, params, ohlcv, compute, meta, lookback, cumulative, refresh
+            )
+            if appended is not None:
+                return appended
+
+        result = compute(ohlcv)
+        self.save(name, params, ohlcv, result)
+        return result
+
+    def _append(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        ohlcv: pl.DataFrame,
+        compute: Callable[[pl.DataFrame], pl.DataFrame],
+        meta: dict,
+        lookback: int,
+        cumulative: Sequence[str] = (),
+        refresh: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+    ) -> Optional[pl.DataFrame]:
+        """extend the cached frame with new dates; None if the prefix changed"""
+        cached = pl.read_parquet(self._paths(name, params)[0])
+        if cached.is_empty():
+            return None
+        cached_max = cached[self.date_col].max()
+        ts = pl.col(self.date_col)
+
+        prefix = ohlcv.filter(ts <= cached_max)
+        if self.fingerprint(prefix) != meta["fingerprint"]:
+            return None
+        new_rows = ohlcv.filter(ts > cached_max)
+        if new_rows.is_empty():
+            return None
+
+        keys = [self.ticker_col, self.date_col]
+        # running totals need at least the last cached row as an anchor
+        context_rows = max(lookback, 1) if cumulative else lookback
+        context = (
+            prefix.sort(keys)
+            .group_by(self.ticker_col, maintain_order=True)
+            .tail(context_rows)
+            .filter(pl.col(self.ticker_col).is_in(new_rows[self.ticker_col].implode()))
+        )
+        recomputed = compute(pl.concat([context, new_rows], how="vertical_relaxed"))
+        fresh = recomputed.filter(ts > cached_max).select(cached.columns)
+
+        if cumulative:
+            fresh = self._reanchor(cached, recomputed, fresh, list(cumulative))
+
+        result = pl.concat([cached, fresh], how="vertical_relaxed")
+        if refresh is not None:
+            result = refresh(result.sort(keys))
+        self.save(name, params, ohlcv, result)
+        return result
+
+    def _reanchor(
+        self,
+        cached: pl.DataFrame,
+        recomputed: pl.DataFrame,
+        fresh: pl.DataFrame,
+        columns: list,
+    ) -> pl.DataFrame:
+        """shift running totals so they continue from the cached values"""
+        keys = [self.ticker_col, self.date_col]
+        # last context row per ticker, as cached vs. as recomputed
+        anchor_ts = (
+            recomputed.filter(pl.col(self.date_col) <= cached[self.date_col].max())
+            .group_by(self.ticker_col)
+            .agg(pl.col(self.date_col).max())
+        )
+        offsets = (
+            anchor_ts.join(cached.select(keys + columns), on=keys, how="left")
+            .join(recomputed.select(keys + columns), on=keys, how="left", suffix="_new")
+            .select(
+                self.ticker_col,
+                *[
+                    (pl.col(c) - pl.col(f"{c}_new")).alias(f"{c}_offset")
+                    for c in columns
+                ],
+            )
+        )
+        return (
+            fresh.join(offsets, on=self.ticker_col, how="left")
+            .with_columns(
+                [
+                    (pl.col(c) + pl.col(f"{c}_offset").fill_null(0)).alias(c)
+                    for c in columns
+                ]
+            )
+            .select(fresh.columns)
+        )
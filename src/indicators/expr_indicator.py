@@ -0,0 +1,94 @@
+"""
+Indicators as native Polars expressions.
+
+Each function returns {column: expr} for a single ticker's time series;
+the registry windows them per ticker, so they run inside Polars' engine and
+compose into lazy query plans:
+
+    lf = pl.scan_parquet("ohlcv.parquet")
+    lf = get_indicator("bbiboll_expr")(lf, boll_length=11)
+
+They mirror the TA-Lib versions in basic_indicator.py; warm-up rows are
+null here where TA-Lib returns NaN.
+"""
+
+from typing import Dict
+
+import numpy as np
+import polars as pl
+
+from .base import ts_rank
+from .basic_indicator import bbiboll_lookback
+from .registry import register
+
+
+@register("obv_expr", kind="expr", lookback=1, cumulative=("obv",))
+def obv_expr() -> Dict[str, pl.Expr]:
+    """
+    On-balance volume: running sum of volume signed by the close change
+    (the first bar adds its full volume, as TA-Lib does).
+    """
+    direction = pl.col("close").cast(pl.Float64).diff().sign().fill_null(1.0)
+    return {"obv": (direction * pl.col("volume").cast(pl.Float64)).cum_sum()}
+
+
+@register(
+    "bbiboll_expr",
+    kind="expr",
+    lookback=lambda boll_length=11, pct_window=252, **_: bbiboll_lookback(
+        boll_length, pct_window
+    ),
+    refresh=lambda df: df.with_columns(
+        pl.col("dev")
+        .fill_null(np.nan)
+        .rank("ordinal")
+        .over("ticker")
+        .alias("longterm_dev_pct_rank")
+    ),
+)
+def bbiboll_expr(
+    boll_length: int = 11,
+    boll_multiple: int = 6,
+    pct_window: int = 252,
+) -> Dict[str, pl.Expr]:
+    """
+    Expression version of calculate_bbiboll.
+
+    Args:
+        boll_length: rolling_window of dev(std)
+        boll_multiple: multipler of dev
+        pct_window: trailing window of the dev_pct rank
+
+    dev_pct is the one column computed outside Polars: it calls the NumPy
+    ts_rank through map_batches (once per ticker, as the registry windows
+    it).  ``rolling_rank`` is missing at the polars>=1.32 floor and is still
+    unstable, and it ranks null rows as null and counts warm-up in non-null
+    values, where ts_rank ranks them 0 and counts rows; ``rolling_map``
+    would call back into Python once per row.
+    """
+    close = pl.col("close").cast(pl.Float64)
+    bbi = (
+        close.rolling_mean(3)
+        + close.rolling_mean(6)
+        + close.rolling_mean(12)
+        + close.rolling_mean(24)
+    ) / 4
+
+    # TA-Lib STDDEV is the population std
+    dev = bbi.rolling_std(boll_length, ddof=0) * boll_multiple
+
+    min_periods = min(50, pct_window // 3)
+    dev_pct = dev.map_batches(
+        lambda s: pl.Series(ts_rank(s.to_numpy(), pct_window, min_periods=min_periods)),
+        return_dtype=pl.Float64,
+    )
+
+    return {
+        "bbi": bbi,
+        "dev": dev,
+        "upr": bbi + dev,
+        "dwn": bbi - dev,
+        "dev_pct": dev_pct,
+        # TA-Lib's NaN warm-up ranks above every value; keep that ordering
+        "longterm_dev_pct_rank": dev.fill_null(np.nan).rank("ordinal"),
+    }
@@ -1,35 +1,191 @@
 # indicators/registry.py
-from typing import Callable, Dict
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import polars as pl
 
-from .base import apply_grouped
+from .base import ExecutionConfig, apply_grouped
+from .cache import IndicatorCache
 
 _INDICATORS: Dict[str, Callable] = {}
+_RAW_INDICATORS: Dict[str, Callable] = {}
+_KINDS: Dict[str, str] = {}
+_GROUPED: Dict[str, bool] = {}
+_INCREMENTAL: Dict[str, "IncrementalSpec"] = {}
+_EXECUTION = ExecutionConfig()
 
 
-def register(name: str, grouped: bool = True):
+@dataclass(frozen=True)
+class IncrementalSpec:
+    """what an indicator declared for incremental recomputation"""
+
+    lookback: Union[int, Callable[..., int]]
+    cumulative: Tuple[str, ...] = ()
+    refresh: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None
+
+    def resolve_lookback(self, **params) -> int:
+        if callable(self.lookback):
+            return int(self.lookback(**params))
+        return int(self.lookback)
+
+
+def register(
+    name: str,
+    grouped: bool = True,
+    kind: str = "frame",
+    lookback: Union[int, Callable[..., int], None] = None,
+    cumulative: Sequence[str] = (),
+    refresh: Optional[Callable[[pl.DataFrame], pl.DataFrame]] = None,
+):
     """
     register for indicators
     grouped=True group by ticker
+
+    lookback / cumulative / refresh declare how compute_incremental() may
+    extend a cached result when new bars arrive:
+        lookback: rows of history per ticker needed to reproduce one output
+            row; an int or a function of the indicator params
+        cumulative: running-total output columns (re-anchored on append)
+        refresh: rebuilds full-history columns on the combined frame
+
+    kind="frame": func(df, **params) -> DataFrame, run per ticker group.
+    The returned wrapper also accepts execution=ExecutionConfig(...) to
+    override the registry-wide default set by set_execution().
+
+    kind="expr": func(**params) -> {column: pl.Expr}, written for a single
+    ticker's time series. The expressions are windowed with
+    .over("ticker", order_by="timestamps") and evaluated inside Polars, so
+    the wrapper accepts a DataFrame or a LazyFrame (returned as the same
+    type) and composes into a lazy query plan. Use get_indicator_exprs()
+    to embed them in your own select / with_columns.
     """
+    if kind not in ("frame", "expr"):
+        raise ValueError(f"Unknown indicator kind '{kind}'. Use 'frame' or 'expr'.")
 
     def decorator(func: Callable):
-        def wrapper(df: pl.DataFrame, **params) -> pl.DataFrame:
-            if grouped:
-                return apply_grouped(df, func, **params)
-            else:
-                return func(df, **params)
+        if kind == "expr":
+
+            def wrapper(df, execution: Optional[ExecutionConfig] = None, **params):
+                # execution is accepted for signature parity; Polars
+                # parallelises expression evaluation itself
+                return df.with_columns(_windowed_exprs(func, grouped, **params))
+
+        else:
 
+            def wrapper(
+                df: pl.DataFrame,
+                execution: Optional[ExecutionConfig] = None,
+                **params,
+            ) -> pl.DataFrame:
+                if grouped:
+                    return apply_grouped(
+                        df,
+                        partial(_call_raw, name),
+                        execution=execution or _EXECUTION,
+                        **params,
+                    )
+                else:
+                    return func(df, **params)
+
+        _RAW_INDICATORS[name] = func
         _INDICATORS[name] = wrapper
+        _KINDS[name] = kind
+        _GROUPED[name] = grouped
+        if lookback is not None:
+            _INCREMENTAL[name] = IncrementalSpec(lookback, tuple(cumulative), refresh)
         return wrapper
 
     return decorator
 
 
+def _windowed_exprs(func: Callable, grouped: bool, **params) -> List[pl.Expr]:
+    """Evaluate an expr indicator and window each output per ticker."""
+    exprs = []
+    for col, expr in func(**params).items():
+        if grouped:
+            expr = expr.over("ticker", order_by="timestamps")
+        exprs.append(expr.alias(col))
+    return exprs
+
+
+def get_indicator_exprs(name: str, **params) -> List[pl.Expr]:
+    """
+    expressions of a kind="expr" indicator, ready for
+    df.with_columns(...) / lf.with_columns(...)
+    """
+    if _KINDS.get(name) != "expr":
+        raise ValueError(f"Indicator '{name}' is not an expression indicator.")
+    return _windowed_exprs(_RAW_INDICATORS[name], _GROUPED[name], **params)
+
+
+def _call_raw(name: str, df: pl.DataFrame, **params) -> pl.DataFrame:
+    """
+    Call a registered function by name. Module-level so it pickles into
+    process-pool workers, which may need to import the indicators first.
+    """
+    if name not in _RAW_INDICATORS:
+        import importlib
+
+        importlib.import_module(__package__)
+    return _RAW_INDICATORS[name](df, **params)
+
+
+def set_execution(
+    backend: str = "serial",
+    n_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> ExecutionConfig:
+    """
+    set the default execution backend for grouped indicators
+
+    Returns the previous config so callers can restore it.
+    """
+    global _EXECUTION
+    previous = _EXECUTION
+    _EXECUTION = ExecutionConfig(
+        backend=backend, n_workers=n_workers, chunk_size=chunk_size
+    )
+    return previous
+
+
+def get_execution() -> ExecutionConfig:
+    return _EXECUTION
+
+
+def compute_incremental(
+    name: str,
+    ohlcv: pl.DataFrame,
+    cache: IndicatorCache,
+    execution: Optional[ExecutionConfig] = None,
+    **params,
+) -> pl.DataFrame:
+    """
+    compute an indicator through the cache
+
+    If the cache holds this indicator/params for an unchanged prefix of
+    ohlcv, only the new bars (plus the declared lookback per ticker) are
+    recomputed and appended. Indicators without a declared lookback are
+    recomputed in full on any data change.
+    """
+    func = get_indicator(name)
+    spec = _INCREMENTAL.get(name)
+    return cache.get_or_compute(
+        name,
+        ohlcv,
+        lambda df: func(df, execution=execution, **params),
+        params=params,
+        lookback=spec.resolve_lookback(**params) if spec else None,
+        cumulative=spec.cumulative if spec else (),
+        refresh=spec.refresh if spec else None,
+    )
+
+
 def get_indicator(name: str) -> Callable:
     return _INDICATORS[name]
 
 
-def list_indicators():
-    return list(_INDICATORS.keys())
+def list_indicators(kind: Optional[str] = None):
+    if kind is None:
+        return list(_INDICATORS.keys())
+    return [name for name, k in _KINDS.items() if k == kind]
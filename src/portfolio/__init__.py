@@ -20,6 +20,7 @@ Usage:
 
 from portfolio.alpha_config import AlphaConfig, FactorConfig
 from portfolio.pipeline import (
+    SizingMethods,
     build_factor_pipeline,
     build_sizing_methods,
     compute_daily_returns,
@@ -36,6 +37,7 @@ from portfolio.walk_forward_runner import (
 __all__ = [
     "AlphaConfig",
     "FactorConfig",
+    "SizingMethods",
     "build_factor_pipeline",
     "build_sizing_methods",
     "compute_daily_returns",
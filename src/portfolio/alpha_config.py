@@ -45,7 +45,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from constants import TRADING_DAYS_PER_YEAR
 
@@ -132,6 +132,12 @@ class AlphaConfig:
     # ── Combination risk aversion (for mean-variance method) ──────────
     risk_aversion: float = 1.0
 
+    # ── Per-date combination weights (IC-based methods) ───────────────
+    # None: one weight vector fitted on the whole IC history (look-ahead).
+    # "expanding" / N: weights per date from the ICs known at that date.
+    combination_window: Optional[Union[int, Literal["expanding"]]] = None
+    combination_min_periods: int = 20
+
     # ── Metadata ──────────────────────────────────────────────────────
     name: str = "AlphaPipeline"
 
@@ -213,6 +219,8 @@ class AlphaConfig:
             "cost_bps": self.cost_bps,
             "annualization": self.annualization,
             "risk_aversion": self.risk_aversion,
+            "combination_window": self.combination_window,
+            "combination_min_periods": self.combination_min_periods,
             "name": self.name,
         }
         return d
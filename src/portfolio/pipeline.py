@@ -31,10 +31,21 @@ Reference: guidance/quant_lab.pdf — Part III–IV
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, Mapping
+from typing import TYPE_CHECKING
+
 import numpy as np
 import polars as pl
 
-from alpha.combination import combine_factors
+from alpha.combination import (
+    align_factors,
+    combine_columns,
+    combine_factors,
+    compute_combination_weights,
+    rolling_combination_weights,
+)
+from alpha.preprocessing import preprocess_columns
+from alpha.spearman import cross_sectional_spearman
 from constants import (
     DATE_COL,
     OHLCV_DATE_COL,
@@ -44,9 +55,14 @@ from constants import (
     VALUE_COL,
     WEIGHT_COL,
 )
+from factors.context import FactorContext, factor_context
+from factors.executor import compute_factors
 from factors.factors import get_factor_fn, list_factors, register_factor
 from portfolio.alpha_config import AlphaConfig, FactorConfig
 
+if TYPE_CHECKING:
+    from indicators.base import ExecutionConfig
+
 # ── Stage 1: Daily Returns ────────────────────────────────────────────────────
 
 
@@ -67,14 +83,13 @@ def compute_daily_returns(
     Returns:
         DataFrame with columns (date, ticker, daily_return).
         The date column is renamed to the standard ``DATE_COL`` convention.
+
+    Inside an active ``FactorContext`` for ``ohlcv`` the sort and the
+    returns are shared with the factors.
     """
+    ctx = factor_context(ohlcv, ohlcv_date_col, ticker_col)
     return (
-        ohlcv.sort([ticker_col, ohlcv_date_col])
-        .with_columns(
-            (pl.col(price_col) / pl.col(price_col).shift(1).over(ticker_col) - 1).alias(
-                RETURN_COL
-            )
-        )
+        ctx.sorted.with_columns(ctx.simple_return(price_col).alias(RETURN_COL))
         .filter(pl.col(RETURN_COL).is_not_null() & pl.col(RETURN_COL).is_finite())
         .select(
             [
@@ -126,6 +141,9 @@ def build_factor_pipeline(
     combination_method: str = "equal_weight",
     config: AlphaConfig | None = None,
     next_day_returns: pl.DataFrame | None = None,
+    engine: str = "eager",
+    execution: ExecutionConfig | None = None,
+    timings: dict[str, float] | None = None,
     **kwargs,
 ) -> pl.DataFrame:
     """Build a composite factor signal from OHLCV data.
@@ -141,10 +159,30 @@ def build_factor_pipeline(
             preprocessing params are passed through.
         next_day_returns: Next-day returns DataFrame (date, ticker,
             next_day_return).  Required for IC-based combination methods.
+        engine: ``"eager"`` computes and preprocesses each factor
+            separately, then joins them; ``"wide"`` computes the raw
+            factors, aligns them once into a (date, ticker, f_1..f_k)
+            frame and preprocesses and combines all columns side by side
+            (``alpha.preprocessing.preprocess_columns``); ``"lazy"``
+            compiles all factors, their preprocessing and (for equal
+            weight) the combination into one Polars query via
+            ``factors.plan``.  All give the same composite.
+        execution: ``ExecutionConfig`` for the eager and wide engines —
+            compute factors on a thread or process pool (see
+            ``factors.executor``).  Default: serial.
+        timings: Optional dict, filled with the wall time in seconds of
+            each factor (eager and wide engines).
 
     Returns:
         Composite factor DataFrame with columns (date, ticker, value).
+
+    All factors run inside one ``FactorContext`` (the caller's, if one is
+    active for ``ohlcv``), so the sorted frame, returns, rolling vols and
+    indicator frames are computed once and shared between them.
     """
+    if engine not in ("eager", "wide", "lazy"):
+        raise ValueError(f"Unknown engine '{engine}'. Use 'eager', 'wide' or 'lazy'.")
+
     if config is not None:
         factor_names = config.factor_names
         combination_method = config.combination_method
@@ -152,15 +190,53 @@ def build_factor_pipeline(
     if factor_names is None:
         factor_names = ["bbiboll", "vol_ratio"]
 
-    factors = []
-    for name in factor_names:
-        factor_fn = get_factor_fn(name)
-        fc = config.get_factor_config(name.lower()) if config else None
-        factor_df = factor_fn(ohlcv, factor_config=fc, **kwargs)
-        # Apply direction: negate factor values when direction == -1
-        if fc is not None and fc.direction == -1:
-            factor_df = factor_df.with_columns(-pl.col(VALUE_COL))
-        factors.append(factor_df)
+    if engine == "lazy":
+        return _build_factor_plan_composite(
+            ohlcv,
+            factor_names,
+            combination_method,
+            config,
+            next_day_returns,
+            **kwargs,
+        )
+
+    factor_configs = None
+    if config is not None:
+        factor_configs = {
+            name.lower(): config.get_factor_config(name.lower())
+            for name in factor_names
+        }
+
+    factors, seconds = compute_factors(
+        ohlcv,
+        factor_names,
+        factor_configs,
+        execution=execution,
+        raw=engine == "wide",
+        **kwargs,
+    )
+    if timings is not None:
+        timings.update(seconds)
+
+    if engine == "wide":
+        return _build_wide_composite(
+            factors,
+            factor_names,
+            combination_method,
+            config,
+            next_day_returns,
+        )
+
+    # Apply direction: negate factor values when direction == -1
+    if factor_configs is not None:
+        factors = [
+            (
+                factor_df.with_columns(-pl.col(VALUE_COL))
+                if factor_configs[name.lower()].direction == -1
+                else factor_df
+            )
+            for name, factor_df in zip(factor_names, factors)
+        ]
 
     if len(factors) == 1:
         return factors[0]
@@ -168,7 +244,7 @@ def build_factor_pipeline(
     # ── IC-based combination: compute IC series per factor ──
     ic_series_list = None
     if combination_method != "equal_weight":
-        ic_series_list = _compute_ic_series_list(factors, next_day_returns, config)
+        ic_series_list = _compute_ic_series_list(factors, next_day_returns)
 
     risk_aversion = config.risk_aversion if config else 1.0
 
@@ -177,18 +253,129 @@ def build_factor_pipeline(
         method=combination_method,
         ic_series_list=ic_series_list,
         risk_aversion=risk_aversion,
+        ic_window=config.combination_window if config else None,
+        min_periods=config.combination_min_periods if config else 20,
     )
 
 
+def _build_factor_plan_composite(
+    ohlcv: pl.DataFrame,
+    factor_names: list[str],
+    combination_method: str,
+    config: AlphaConfig | None,
+    next_day_returns: pl.DataFrame | None,
+    **kwargs,
+) -> pl.DataFrame:
+    """``build_factor_pipeline(engine="lazy")``: one plan for all factors."""
+    from factors.plan import build_factor_plan
+
+    names = [name.lower() for name in factor_names]
+    with factor_context(ohlcv):
+        plan = build_factor_plan(
+            ohlcv,
+            names,
+            config.factor_configs if config else None,
+            **kwargs,
+        )
+
+    return _combine_wide(plan, names, combination_method, config, next_day_returns)
+
+
+def _build_wide_composite(
+    raw_factors: list[pl.DataFrame],
+    factor_names: list[str],
+    combination_method: str,
+    config: AlphaConfig | None,
+    next_day_returns: pl.DataFrame | None,
+) -> pl.DataFrame:
+    """``build_factor_pipeline(engine="wide")``: one wide frame for all factors."""
+    names = [name.lower() for name in factor_names]
+    configs = {
+        name: config.get_factor_config(name) if config else FactorConfig()
+        for name in names
+    }
+
+    # align the raw signals once: (date, ticker, f_1, ..., f_k)
+    wide = align_factors(raw_factors, names)
+    # factors registered with raw=False come back preprocessed already
+    raw_names = [name for name in names if hasattr(get_factor_fn(name), "__wrapped__")]
+    wide = preprocess_columns(
+        wide,
+        raw_names,
+        winsorize_pct={n: configs[n].winsorize_pct for n in raw_names},
+        method={n: configs[n].normalize_method for n in raw_names},
+        neutralize={n: configs[n].neutralize for n in raw_names},
+    ).with_columns(-pl.col(name) for name in names if configs[name].direction == -1)
+    return _combine_wide(wide, names, combination_method, config, next_day_returns)
+
+
+def _combine_wide(
+    wide: pl.DataFrame | pl.LazyFrame,
+    names: list[str],
+    combination_method: str,
+    config: AlphaConfig | None,
+    next_day_returns: pl.DataFrame | None,
+) -> pl.DataFrame:
+    """Composite of the factor columns ``names`` of a wide frame."""
+    wide = wide.lazy()
+    if len(names) == 1:
+        return (
+            wide.select(DATE_COL, TICKER_COL, pl.col(names[0]).alias(VALUE_COL))
+            .drop_nulls(VALUE_COL)
+            .collect()
+        )
+
+    if combination_method == "equal_weight":
+        weights = compute_combination_weights("equal_weight", len(names), None, 1.0)
+        return combine_columns(wide, names, weights).collect()
+
+    # IC weights need the factor values first: collect once, then combine
+    frame = wide.collect()
+    ic_series_list = _wide_ic_series_list(frame, names, next_day_returns)
+    risk_aversion = config.risk_aversion if config else 1.0
+    if config is not None and config.combination_window is not None:
+        weights = rolling_combination_weights(
+            ic_series_list,
+            method=combination_method,
+            window=config.combination_window,
+            min_periods=config.combination_min_periods,
+            risk_aversion=risk_aversion,
+            dates=frame[DATE_COL].unique(),
+            names=names,
+        )
+    else:
+        weights = compute_combination_weights(
+            method=combination_method,
+            k=len(names),
+            ic_series_list=ic_series_list,
+            risk_aversion=risk_aversion,
+        )
+    return combine_columns(frame, names, weights)
+
+
 def _compute_ic_series_list(
     factors: list[pl.DataFrame],
     next_day_returns: pl.DataFrame | None,
-    config: AlphaConfig | None,
 ) -> list[pl.DataFrame]:
     """Compute IC time series for each factor (needed for non-equal-weight combination).
 
     IC_t = rank_corr(factor_t, next_day_return_t) across tickers.
     """
+    names = [f"factor_{i}" for i in range(len(factors))]
+    return _wide_ic_series_list(align_factors(factors, names), names, next_day_returns)
+
+
+def _wide_ic_series_list(
+    wide: pl.DataFrame,
+    names: list[str],
+    next_day_returns: pl.DataFrame | None,
+) -> list[pl.DataFrame]:
+    """IC time series of the factor columns ``names`` of a wide frame.
+
+    The returns are joined once and ranked once for all factors; each IC is
+    computed over the tickers where both the factor and the return are valid
+    (``alpha.spearman.cross_sectional_spearman``).
+    """
     if next_day_returns is None:
         raise ValueError(
             "IC-based combination methods (ic_weight, mean_variance, risk_parity) "
@@ -196,29 +383,23 @@ def _compute_ic_series_list(
             "build_factor_pipeline(next_day_returns=...)."
         )
 
-    ic_series_list = []
-    for factor_df in factors:
-        # Join factor values with next-day returns on (date, ticker)
-        merged = factor_df.join(
-            next_day_returns,
-            on=[DATE_COL, TICKER_COL],
-            how="inner",
-        )
+    # Join factor values with next-day returns on (date, ticker)
+    merged = wide.join(
+        next_day_returns.select(DATE_COL, TICKER_COL, "next_day_return"),
+        on=[DATE_COL, TICKER_COL],
+        how="inner",
+    )
 
-        # Compute rank correlation per date
-        ic_per_date = (
-            merged.group_by(DATE_COL)
-            .agg(
-                pl.corr(
-                    pl.col(VALUE_COL).rank(), pl.col("next_day_return").rank()
-                ).alias("ic")
-            )
-            .sort(DATE_COL)
-            .filter(pl.col("ic").is_not_null() & pl.col("ic").is_finite())
+    # Compute rank correlation per date, for every factor at once
+    per_date = cross_sectional_spearman(
+        merged, "next_day_return", names, date_col=DATE_COL
+    )
+    return [
+        per_date.select(DATE_COL, pl.col(name).alias("ic")).filter(
+            pl.col("ic").is_not_null() & pl.col("ic").is_finite()
         )
-        ic_series_list.append(ic_per_date)
-
-    return ic_series_list
+        for name in names
+    ]
 
 
 # ── Stage 4: Portfolio Weights ────────────────────────────────────────────────
@@ -236,8 +417,8 @@ def build_sizing_methods(
     kelly_max_leverage: float = 3.0,
     vol_window: int = 20,
     config: AlphaConfig | None = None,
-) -> dict[str, pl.DataFrame]:
-    """Build all 4 sizing method weight DataFrames.
+) -> SizingMethods:
+    """Build the 4 sizing method weight DataFrames, lazily.
 
     Args:
         composite: Factor signal DataFrame (date, ticker, value).
@@ -252,7 +433,9 @@ def build_sizing_methods(
         vol_window: Window for realized volatility estimation.
 
     Returns:
-        Dict mapping method name → weight DataFrame (date, ticker, weight).
+        ``SizingMethods`` mapping method name → weight DataFrame (date,
+        ticker, weight).  Each method is computed on first access, and the
+        realized volatility behind Inverse-Vol / Vol-Target is shared.
     """
     from risk.position_sizing import (
         compute_realized_volatility,
@@ -272,31 +455,70 @@ def build_sizing_methods(
         kelly_max_leverage = config.kelly_max_leverage
         vol_window = config.vol_window
 
-    vol_estimates = compute_realized_volatility(ohlcv, window=vol_window)
-    returns_for_kelly = daily_returns.rename({RETURN_COL: "return"})
+    # One private context shared by all methods (the caller's, if active):
+    # realized vols are computed at most once, on first use
+    ctx = factor_context(ohlcv)
+
+    def vol_estimates() -> pl.DataFrame:
+        with ctx:
+            return compute_realized_volatility(ohlcv, window=vol_window)
+
+    return SizingMethods(
+        {
+            "Equal-Weight": lambda: size_equal_weight(
+                composite, n_long=n_long, n_short=n_short
+            ),
+            "Inverse-Vol": lambda: size_inverse_volatility(
+                composite, vol_estimates(), n_long=n_long, n_short=n_short
+            ),
+            f"Vol-Target ({target_vol:.0%})": lambda: size_volatility_target(
+                composite,
+                vol_estimates(),
+                target_vol=target_vol,
+                n_long=n_long,
+                n_short=n_short,
+            ),
+            "Signal-Weighted": lambda: size_signal_weighted(
+                composite,
+                daily_returns.rename({RETURN_COL: "return"}),
+                n_long=n_long,
+                n_short=n_short,
+                lookback=kelly_lookback,
+                max_position=kelly_max_position,
+                max_leverage=kelly_max_leverage,
+            ),
+        }
+    )
 
-    return {
-        "Equal-Weight": size_equal_weight(composite, n_long=n_long, n_short=n_short),
-        "Inverse-Vol": size_inverse_volatility(
-            composite, vol_estimates, n_long=n_long, n_short=n_short
-        ),
-        f"Vol-Target ({target_vol:.0%})": size_volatility_target(
-            composite,
-            vol_estimates,
-            target_vol=target_vol,
-            n_long=n_long,
-            n_short=n_short,
-        ),
-        "Signal-Weighted": size_signal_weighted(
-            composite,
-            returns_for_kelly,
-            n_long=n_long,
-            n_short=n_short,
-            lookback=kelly_lookback,
-            max_position=kelly_max_position,
-            max_leverage=kelly_max_leverage,
-        ),
-    }
+
+class SizingMethods(Mapping[str, pl.DataFrame]):
+    """Read-only mapping of sizing method name → weights, built on first access.
+
+    ``run_alpha_pipeline`` needs one method per run; the others are never
+    computed unless looked up (or iterated over, e.g. ``.items()``).
+    """
+
+    def __init__(self, builders: dict[str, Callable[[], pl.DataFrame]]):
+        self._builders = builders
+        self._weights: dict[str, pl.DataFrame] = {}
+
+    def __getitem__(self, name: str) -> pl.DataFrame:
+        if name not in self._weights:
+            self._weights[name] = self._builders[name]()
+        return self._weights[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._builders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def computed(self) -> list[str]:
+        """Names of the methods built so far."""
+        return list(self._weights)
 
 
 # ── Stage 5: Rebalancing ─────────────────────────────────────────────────────
@@ -450,9 +672,11 @@ def run_alpha_pipeline(
     Returns:
         Dict with keys:
             - composite: Composite factor DataFrame
+            - factor_timings: Wall time in seconds per factor
             - daily_returns: Daily return DataFrame
             - next_day_returns: Next-day return DataFrame
-            - sizing_methods: Dict of all 4 sizing method weights
+            - sizing_methods: ``SizingMethods`` of all 4 sizing method
+              weights (only the selected one is computed unless accessed)
             - weights: Selected weight DataFrame (after resampling)
             - portfolio_returns: Portfolio return DataFrame (date, port_return)
             - returns_array: 1-D numpy array of portfolio returns
@@ -475,24 +699,28 @@ def run_alpha_pipeline(
             annualization=annualization,
         )
 
-    # --- Stage 1-2: Returns ---
-    daily_returns = compute_daily_returns(ohlcv)
-    next_day_returns = compute_next_day_returns(daily_returns)
-
-    # --- Stage 3: Factor ---
-    composite = build_factor_pipeline(
-        ohlcv,
-        config=config,
-        next_day_returns=next_day_returns,
-    )
+    # Share sorted OHLCV / returns / indicator frames across stages 1-4
+    with FactorContext(ohlcv):
+        # --- Stage 1-2: Returns ---
+        daily_returns = compute_daily_returns(ohlcv)
+        next_day_returns = compute_next_day_returns(daily_returns)
+
+        # --- Stage 3: Factor ---
+        factor_timings: dict[str, float] = {}
+        composite = build_factor_pipeline(
+            ohlcv,
+            config=config,
+            next_day_returns=next_day_returns,
+            timings=factor_timings,
+        )
 
-    # --- Stage 4: Sizing ---
-    sizing_methods = build_sizing_methods(
-        composite,
-        ohlcv,
-        daily_returns,
-        config=config,
-    )
+        # --- Stage 4: Sizing (lazy; reuses the sorted OHLCV) ---
+        sizing_methods = build_sizing_methods(
+            composite,
+            ohlcv,
+            daily_returns,
+            config=config,
+        )
 
     if config.sizing_method not in sizing_methods:
         available = ", ".join(sorted(sizing_methods.keys()))
@@ -516,6 +744,7 @@ def run_alpha_pipeline(
 
     return {
         "composite": composite,
+        "factor_timings": factor_timings,
         "daily_returns": daily_returns,
         "next_day_returns": next_day_returns,
         "sizing_methods": sizing_methods,
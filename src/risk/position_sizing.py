@@ -399,32 +399,22 @@ def compute_realized_volatility(
     Returns:
         DataFrame with columns (date, ticker, volatility).
         Volatility is daily standard deviation of log returns.
+
+    Inside an active ``FactorContext`` for ``ohlcv`` the result is computed
+    once per window and shared, as are the sort and log returns.
     """
-    vol_df = (
-        ohlcv.sort(["ticker", "timestamps"])
-        .with_columns(
-            (pl.col("close") / pl.col("close").shift(1).over("ticker"))
-            .log()
-            .alias("log_ret")
-        )
-        .with_columns(
-            pl.col("log_ret")
-            .rolling_std(window_size=window)
-            .over("ticker")
-            .alias("volatility")
-        )
-        .filter(pl.col("volatility").is_not_null() & pl.col("volatility").is_finite())
-        .select(
-            [
-                pl.col("timestamps").alias("date"),
-                pl.col("ticker"),
-                pl.col("volatility"),
-            ]
-        )
+    from factors.context import factor_context
+
+    ctx = factor_context(ohlcv)
+    return ctx.cached(
+        ("realized_volatility", window),
+        lambda: ctx.sorted.select(
+            pl.col("timestamps").alias("date"),
+            pl.col("ticker"),
+            ctx.rolling_std("log_return", window).alias("volatility"),
+        ).filter(pl.col("volatility").is_not_null() & pl.col("volatility").is_finite()),
     )
 
-    return vol_df
-
 
 # ── Internal ──────────────────────────────────────────────────────────────────
 
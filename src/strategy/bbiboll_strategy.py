@@ -7,10 +7,13 @@ import os
 import random
 from typing import Any, Dict, List
 
+import numpy as np
 import polars as pl
 
 from backtest.strategy_base import StrategyBase
+from backtest.trade_scan import scan_trades, segment_bounds, trades_to_signals
 from data.loader.data_loader import TimestampGenerator
+from indicators.basic_indicator import bbiboll_lookback, refresh_longterm_rank
 from indicators.registry import get_indicator
 
 
@@ -54,6 +57,13 @@ class BBIBOLLStrategy(StrategyBase):
 
         self.timestamp_gen = TimestampGenerator()
 
+    def cache_params(self) -> Dict[str, Any]:
+        """indicator cache key: only the params calculate_indicators uses"""
+        return {
+            "boll_length": self.config["boll_length"],
+            "boll_multiple": self.config["boll_multiple"],
+        }
+
     def calculate_indicators(self, cached: bool = False) -> pl.DataFrame:
         """
         calculate indicators
@@ -66,15 +76,25 @@ class BBIBOLLStrategy(StrategyBase):
         """
 
         if cached:
-            cached_indicators = self.load_cached_indicators()
-            if cached_indicators is not None:
-                return cached_indicators
+            # appended dates only recompute their BBIBOLL warm-up window
+            return self.cached_indicators(
+                self._compute_indicators,
+                lookback=bbiboll_lookback(self.config["boll_length"]),
+                refresh=refresh_longterm_rank,
+            )
+
+        indicators = self._compute_indicators(self.ohlcv_data)
+        self.save_indicators_cache(indicators)
 
+        return indicators
+
+    def _compute_indicators(self, ohlcv: pl.DataFrame) -> pl.DataFrame:
+        """bbiboll and turnover of the given ohlcv rows"""
         print("calculate indicators...")
         # compute bbiboll
         func = get_indicator("bbiboll")
         indicators = func(
-            self.ohlcv_data,
+            ohlcv,
             boll_length=self.config["boll_length"],
             boll_multiple=self.config["boll_multiple"],
         )
@@ -82,14 +102,10 @@ class BBIBOLLStrategy(StrategyBase):
         print("✅ indicators calculation completed")
 
         # add turnover
-        indicators = indicators.with_columns(
+        return indicators.with_columns(
             (pl.col("volume") * pl.col("close")).alias("turnover")
         )
 
-        self.save_indicators_cache(indicators)
-
-        return indicators
-
     def generate_signals(self, indicators: pl.DataFrame) -> pl.DataFrame:
         """
         Generate trading signals based on BBIBOLL indicators
@@ -133,80 +149,42 @@ class BBIBOLLStrategy(StrategyBase):
             .alias("meets_buy_condition")
         )
 
-        # Initialize signal list
-        all_signals = []
-
-        # Process by ticker group
-        for ticker in examined_tickers:
-            ticker_data = data_with_condition.filter(pl.col("ticker") == ticker).sort(
-                "timestamps"
-            )
+        # Path-dependent hold / stop state machine over contiguous
+        # per-ticker arrays (rows are already sorted by ticker, timestamps)
+        close = data_with_condition["close"].cast(pl.Float64).to_numpy()
+        opens = data_with_condition["open"].cast(pl.Float64).to_numpy()
+        dev_pct = data_with_condition["dev_pct"].cast(pl.Float64).to_numpy()
+        max_dev_pct = self.config["max_dev_pct"]
+        loss_threshold = self.config["loss_threshold"]
+        profit_threshold = self.config["profit_threshold"]
+
+        def exit_rule(entry: int, lo: int, hi: int) -> np.ndarray:
+            # Return based on buy day close price
+            daily_return = opens[lo:hi] / close[entry] - 1
+            # Condition 1: Loss exceeds threshold AND buy condition no longer met
+            stop_loss = (daily_return < loss_threshold) & (dev_pct[lo:hi] > max_dev_pct)
+            # Condition 2: Profit exceeds threshold
+            take_profit = daily_return > profit_threshold
+            return stop_loss | take_profit
+
+        entries, exits = scan_trades(
+            data_with_condition["meets_buy_condition"].to_numpy(),
+            exit_rule,
+            segment_bounds(data_with_condition["ticker"]),
+        )
 
-            if ticker_data.is_empty():
-                continue
-
-            ticker_signals = []
-            is_holding = False
-            buy_price = None
-            buy_date = None
-
-            # Iterate each trading day
-            for row in ticker_data.iter_rows(named=True):
-                current_date = row["timestamps"]
-                current_close = row["close"]
-                current_open = row["open"]
-                meets_condition = row["meets_buy_condition"]
-                current_dev_pct = row["dev_pct"]
-
-                if not is_holding and meets_condition:
-                    # Generate buy signal
-                    ticker_signals.append(
-                        {"ticker": ticker, "timestamps": current_date, "signal": 1}
-                    )
-                    is_holding = True
-                    buy_price = current_close
-                    buy_date = current_date
-
-                elif is_holding and buy_price is not None:
-                    # Calculate return (based on buy day close price)
-                    daily_return = (current_open / buy_price) - 1
-
-                    # Sell condition check
-                    sell_condition = (
-                        # Condition 1: Loss exceeds threshold AND buy condition no longer met
-                        (
-                            daily_return < self.config["loss_threshold"]
-                            and current_dev_pct > self.config["max_dev_pct"]
-                        )
-                        or
-                        # Condition 2: Profit exceeds threshold
-                        (daily_return > self.config["profit_threshold"])
-                    )
-
-                    if sell_condition:
-                        # Generate sell signal
-                        ticker_signals.append(
-                            {"ticker": ticker, "timestamps": current_date, "signal": -1}
-                        )
-                        is_holding = False
-                        buy_price = None
-                        buy_date = None
-
-            all_signals.extend(ticker_signals)
-
-        if not all_signals:
+        if len(entries) == 0:
             print("No trading signals generated")
             return pl.DataFrame()
 
         # reformat
         signals_df = (
-            pl.DataFrame(all_signals)
+            trades_to_signals(data_with_condition, entries, exits)
             .with_columns(
                 pl.col("timestamps").dt.cast_time_unit(
                     "ns"
                 )  # Unify to nanosecond precision
             )
-            .sort(["ticker", "timestamps"])
             .rename({"timestamps": "signal_date"})
         )
 
@@ -356,6 +334,80 @@ class BBIBOLLStrategy(StrategyBase):
 
         return selected
 
+    @staticmethod
+    def _expand_holding_periods(
+        trades: pl.DataFrame, prices: pl.DataFrame
+    ) -> pl.DataFrame:
+        """
+        One row per (trade, held price bar): the bars of the trade's ticker
+        with buy_date <= timestamps <= sell_date
+
+        Args:
+            trades: DataFrame with columns: trade_id, ticker, buy_date, sell_date
+            prices: DataFrame with columns: ticker, timestamps, close
+
+        Returns:
+            DataFrame with columns (trade_id, ticker, timestamps, close),
+            sorted by trade_id and timestamps
+        """
+        # Expand holding periods via row-index intervals: locate each trade's
+        # first / last price row inside [buy_date, sell_date] with as-of joins
+        # on the sorted price table, then materialise only the held rows
+        # (memory scales with position-days, not price-rows × trades)
+        prices = prices.sort(["ticker", "timestamps"]).with_row_index(name="price_row")
+        price_rows = prices.select(["ticker", "timestamps", "price_row"]).sort(
+            "timestamps"
+        )
+
+        date_dtype = prices.schema["timestamps"]
+        intervals = (
+            trades.select(
+                "trade_id",
+                "ticker",
+                pl.col("buy_date").cast(date_dtype),
+                pl.col("sell_date").cast(date_dtype),
+            )
+            .drop_nulls(["buy_date", "sell_date"])
+            .sort("buy_date")
+            .join_asof(
+                price_rows.rename({"price_row": "first_row"}),
+                left_on="buy_date",
+                right_on="timestamps",
+                by="ticker",
+                strategy="forward",
+                check_sortedness=False,
+            )
+            .drop("timestamps")
+            .sort("sell_date")
+            .join_asof(
+                price_rows.rename({"price_row": "last_row"}),
+                left_on="sell_date",
+                right_on="timestamps",
+                by="ticker",
+                strategy="backward",
+                check_sortedness=False,
+            )
+            .drop("timestamps")
+            .filter(pl.col("first_row") <= pl.col("last_row"))
+        )
+
+        first_row = intervals["first_row"].to_numpy().astype(np.int64)
+        n_held = intervals["last_row"].to_numpy().astype(np.int64) - first_row + 1
+        held_start = np.repeat(np.cumsum(n_held) - n_held, n_held)
+        held_rows = np.repeat(first_row, n_held) + np.arange(n_held.sum()) - held_start
+
+        trade_ids = np.repeat(intervals["trade_id"].to_numpy(), n_held)
+        return (
+            prices[held_rows]
+            .select(
+                pl.Series("trade_id", trade_ids, dtype=pl.UInt32),
+                "ticker",
+                "timestamps",
+                "close",
+            )
+            .sort(["trade_id", "timestamps"])
+        )
+
     def _calculate_daily_portfolio(
         self, trades: pl.DataFrame, prices: pl.DataFrame
     ) -> pl.DataFrame:
@@ -386,16 +438,7 @@ class BBIBOLLStrategy(StrategyBase):
         # Assign trade_id for join
         trades = trades.with_row_index(name="trade_id")
 
-        # Expand holding periods: keep only prices within each trade's date range
-        expanded = (
-            prices.join(trades, on="ticker", how="inner")
-            .filter(
-                (pl.col("timestamps") >= pl.col("buy_date"))
-                & (pl.col("timestamps") <= pl.col("sell_date"))
-            )
-            .select(["trade_id", "ticker", "timestamps", "close"])
-            .sort(["trade_id", "timestamps"])
-        )
+        expanded = self._expand_holding_periods(trades, prices)
 
         if expanded.is_empty():
             return pl.DataFrame(
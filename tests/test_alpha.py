@@ -1,5 +1,6 @@
 """
-Tests for src/alpha/ — preprocessing (winsorize, normalize, neutralize) and combination.
+Tests for src/alpha/ — preprocessing (winsorize, normalize, neutralize), combination
+and the FactorAnalyzer IC engine.
 """
 
 from __future__ import annotations
@@ -10,6 +11,7 @@ import pytest
 
 from alpha.combination import combine_factors
 from alpha.preprocessing import (
+    preprocess_columns,
     preprocess_factor,
     rank_normalize,
     sector_neutralize,
@@ -161,6 +163,92 @@ class TestPreprocessFactor:
         # All TICK_00 rows should be gone
         assert result.filter(pl.col("ticker") == "TICK_00").height == 0
 
+    @pytest.mark.parametrize("method", ["zscore", "rank"])
+    @pytest.mark.parametrize("winsorize_pct", [0.0, 0.1])
+    @pytest.mark.parametrize("neutralize", [None, ["sector"]])
+    def test_fused_matches_steps(
+        self, factor_df_with_outliers, sector_df, method, winsorize_pct, neutralize
+    ):
+        """The single-plan pipeline equals the step-by-step functions."""
+        from polars.testing import assert_frame_equal
+
+        raw = factor_df_with_outliers.with_columns(
+            pl.when(pl.int_range(pl.len()) % 17 == 0)
+            .then(float("inf"))
+            .otherwise(pl.col("value"))
+            .alias("value")
+        )
+        # one ticker without a sector
+        sectors = sector_df.filter(pl.col("ticker") != "TICK_09")
+
+        expected = raw.filter(pl.col("value").is_finite())
+        if winsorize_pct > 0:
+            expected = winsorize(expected, pct=winsorize_pct)
+        normalize = zscore_normalize if method == "zscore" else rank_normalize
+        expected = normalize(expected)
+        if neutralize:
+            expected = sector_neutralize(expected, sectors)
+
+        result = preprocess_factor(
+            raw,
+            sectors=sectors,
+            winsorize_pct=winsorize_pct,
+            method=method,
+            neutralize=neutralize,
+        )
+        assert_frame_equal(result, expected, check_exact=False)
+
+
+class TestPreprocessColumns:
+    """Wide-format preprocessing of many factor columns at once."""
+
+    @pytest.fixture
+    def wide(self, factor_df_with_outliers, rng):
+        n = factor_df_with_outliers.height
+        b = rng.standard_normal(n)
+        b[rng.random(n) < 0.1] = np.nan
+        c = rng.standard_t(3, n)
+        c[::13] = np.inf
+        return factor_df_with_outliers.rename({"value": "a"}).with_columns(
+            pl.Series("b", b), pl.Series("c", c)
+        )
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_columns_match_preprocess_factor(self, wide, sector_df, lazy):
+        from polars.testing import assert_frame_equal
+
+        settings = {
+            "a": dict(winsorize_pct=0.05, method="zscore", neutralize=["sector"]),
+            "b": dict(winsorize_pct=0.0, method="rank", neutralize=["sector"]),
+            "c": dict(winsorize_pct=0.01, method="zscore", neutralize=[]),
+        }
+        result = preprocess_columns(
+            wide.lazy() if lazy else wide,
+            list(settings),
+            sectors=sector_df,
+            **{
+                key: {col: s[key] for col, s in settings.items()}
+                for key in ("winsorize_pct", "method", "neutralize")
+            },
+        )
+        if lazy:
+            result = result.collect()
+        assert result.columns == wide.columns
+        for col, kwargs in settings.items():
+            expected = preprocess_factor(
+                wide.select("date", "ticker", pl.col(col).alias("value")),
+                sectors=sector_df,
+                **kwargs,
+            )
+            got = result.select("date", "ticker", pl.col(col).alias("value"))
+            assert_frame_equal(got.drop_nulls(), expected, check_exact=False)
+
+    def test_errors(self, wide):
+        with pytest.raises(ValueError, match="Unknown method"):
+            preprocess_columns(wide, ["a", "b"], method={"b": "bad"})
+        with pytest.raises(ValueError, match="sectors DataFrame required"):
+            preprocess_columns(wide, ["a"], neutralize=["sector"])
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  Factor Combination
@@ -218,3 +306,719 @@ class TestCombineFactors:
     def test_empty_raises(self):
         with pytest.raises(ValueError, match="At least one"):
             combine_factors([])
+
+    def test_outer_union_missing_handling(self, factor_df):
+        """how="outer" keeps tickers missing from one factor."""
+        partial = factor_df.filter(pl.col("ticker") != "TICK_00").with_columns(
+            pl.col("value") * 3
+        )
+        inner = combine_factors([factor_df, partial])
+        assert "TICK_00" not in inner["ticker"].to_list()
+
+        def tick_00(composite):
+            return composite.filter(pl.col("ticker") == "TICK_00").sort("date")["value"]
+
+        expected = factor_df.filter(pl.col("ticker") == "TICK_00").sort("date")["value"]
+        skip = combine_factors([factor_df, partial], how="outer")
+        zero = combine_factors([factor_df, partial], how="outer", missing="zero")
+        assert skip.height == zero.height == factor_df.height
+        np.testing.assert_allclose(tick_00(skip), expected)
+        np.testing.assert_allclose(tick_00(zero), 0.5 * expected)
+        # missing handling per factor: only the partial factor is zero-filled
+        mixed = combine_factors(
+            [factor_df, partial], how="outer", missing=["skip", "zero"]
+        )
+        np.testing.assert_allclose(tick_00(mixed), 0.5 * expected)
+        # rows with every factor present match the inner composite
+        assert (
+            skip.join(inner, on=["date", "ticker"])
+            .select((pl.col("value") - pl.col("value_right")).abs().max())
+            .item()
+            < 1e-12
+        )
+
+    def test_invalid_how_and_missing_raise(self, factor_df):
+        with pytest.raises(ValueError, match="Unknown how"):
+            combine_factors([factor_df, factor_df], how="left")
+        with pytest.raises(ValueError, match="missing"):
+            combine_factors([factor_df, factor_df], how="outer", missing="mean")
+
+
+class TestAlignFactors:
+    """Wide alignment of long factor frames."""
+
+    def test_shared_keys_and_union(self, factor_df):
+        from alpha.combination import align_factors
+
+        doubled = factor_df.with_columns(pl.col("value") * 2)
+        wide = align_factors([factor_df, doubled], ["a", "b"])
+        assert wide.columns == ["date", "ticker", "a", "b"]
+        assert wide["b"].equals((wide["a"] * 2).alias("b"))
+
+        partial = doubled.filter(pl.col("ticker") != "TICK_00").sample(
+            fraction=1.0, shuffle=True, seed=0
+        )
+        wide = align_factors([partial, factor_df], ["b", "a"]).sort("date", "ticker")
+        assert wide.height == factor_df.height
+        assert wide.filter(pl.col("b").is_null())["ticker"].unique().to_list() == [
+            "TICK_00"
+        ]
+        valid = wide.drop_nulls()
+        np.testing.assert_allclose(valid["b"], valid["a"] * 2)
+
+    def test_name_errors(self, factor_df):
+        from alpha.combination import align_factors
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            align_factors([factor_df, factor_df], ["a", "a"])
+        with pytest.raises(ValueError, match="names"):
+            align_factors([factor_df], ["a", "b"])
+
+
+class TestRollingCombination:
+    """Per-date IC weights without look-ahead."""
+
+    @pytest.fixture
+    def ic_list(self, rng, trading_dates) -> list:
+        ics = rng.normal([0.05, 0.02, -0.01], [0.05, 0.03, 0.04], (252, 3))
+        dates = pl.Series("date", list(trading_dates))
+        return [pl.DataFrame({"date": dates, "ic": ics[:, k]}) for k in range(3)]
+
+    @pytest.mark.parametrize("window", [None, 20])
+    def test_moments_match_numpy(self, rng, window):
+        from alpha.combination import ICMoments
+
+        ics = rng.standard_normal((100, 4))
+        ics[10, 2] = np.nan  # skipped
+        moments = ICMoments(4, window=window)
+        history = []
+        for x in ics:
+            moments.update(x)
+            if not np.isnan(x).any():
+                history.append(x)
+            seen = np.array(history[-window:] if window else history)
+            if len(seen) > 1:
+                np.testing.assert_allclose(moments.mean, seen.mean(axis=0))
+                np.testing.assert_allclose(moments.cov, np.cov(seen, rowvar=False))
+        assert moments.n == (window or 99)
+
+    @pytest.mark.parametrize("method", ["ic_weight", "mean_variance", "risk_parity"])
+    def test_expanding_matches_static_on_known_history(self, ic_list, method):
+        from alpha.combination import (
+            compute_combination_weights,
+            rolling_combination_weights,
+        )
+
+        weights = rolling_combination_weights(ic_list, method, min_periods=20)
+        assert weights.columns == ["date", "factor_0", "factor_1", "factor_2"]
+        assert weights.height == 252
+        np.testing.assert_allclose(weights.drop("date").sum_horizontal(), 1.0)
+        # before min_periods ICs are known: equal weight
+        np.testing.assert_allclose(weights.drop("date").row(19), [1 / 3] * 3)
+        # at date t, the weights are fitted on the ICs dated before t
+        for t in (20, 100, 251):
+            static = compute_combination_weights(
+                method, 3, [ic.head(t) for ic in ic_list], 1.0
+            )
+            np.testing.assert_allclose(weights.drop("date").row(t), static)
+
+    def test_no_look_ahead(self, ic_list):
+        from alpha.combination import rolling_combination_weights
+
+        shocked = [
+            ic.with_columns(
+                pl.when(pl.int_range(pl.len()) >= 150)
+                .then(pl.col("ic") * -10)
+                .otherwise(pl.col("ic"))
+            )
+            for ic in ic_list
+        ]
+        for window in ("expanding", 40):
+            base = rolling_combination_weights(ic_list, window=window, horizon=5)
+            moved = rolling_combination_weights(shocked, window=window, horizon=5)
+            # an IC dated 150 is known from date 155 on
+            assert base.head(155).equals(moved.head(155))
+            assert not base.row(155) == moved.row(155)
+
+    def test_combine_factors_with_ic_window(self, factor_df, ic_list):
+        from alpha.combination import rolling_combination_weights
+
+        factor_b = factor_df.with_columns(pl.col("value") * 2 + 1)
+        composite = combine_factors(
+            [factor_df, factor_b],
+            method="ic_weight",
+            ic_series_list=ic_list[:2],
+            ic_window=60,
+            min_periods=10,
+        )
+        weights = rolling_combination_weights(
+            ic_list[:2], window=60, min_periods=10, dates=factor_df["date"].unique()
+        )
+        expected = (
+            factor_df.join(weights, on="date")
+            .with_columns(
+                pl.col("value") * pl.col("factor_0")
+                + (pl.col("value") * 2 + 1) * pl.col("factor_1")
+            )
+            .select("date", "ticker", "value")
+        )
+        assert composite.height == factor_df.height
+        assert (
+            composite.join(expected, on=["date", "ticker"])
+            .select((pl.col("value") - pl.col("value_right")).abs().max())
+            .item()
+            < 1e-12
+        )
+
+    def test_invalid_window_raises(self, ic_list):
+        from alpha.combination import ICMoments, rolling_combination_weights
+
+        with pytest.raises(ValueError, match="window"):
+            rolling_combination_weights(ic_list, window="rolling")
+        with pytest.raises(ValueError, match="window"):
+            ICMoments(3, window=1)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Orthogonalization
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def exposed_factors(factor_df, rng):
+    """A base factor and a second one loading on it, with missing stocks."""
+    n = factor_df.height
+    other = rng.standard_normal(n)
+    new = 0.8 * factor_df["value"].to_numpy() - 0.5 * other + rng.standard_normal(n)
+    return (
+        factor_df.with_columns(pl.Series("value", new)).filter(
+            pl.Series(rng.random(n) > 0.1)
+        ),
+        [
+            factor_df.filter(pl.Series(rng.random(n) > 0.1)),
+            factor_df.with_columns(pl.Series("value", other)),
+        ],
+    )
+
+
+def _lstsq_residuals(factor, others, ridge=0.0):
+    """One regression per date, with an intercept."""
+    merged = factor
+    for i, o in enumerate(others):
+        merged = merged.join(
+            o.rename({"value": f"x{i}"}), on=["date", "ticker"], how="inner"
+        )
+    parts = []
+    for _, g in merged.sort("date", "ticker").group_by("date", maintain_order=True):
+        x = np.column_stack(
+            [np.ones(g.height)] + [g[f"x{i}"] for i in range(len(others))]
+        )
+        penalty = ridge * np.eye(x.shape[1])
+        penalty[0, 0] = 0.0
+        beta = np.linalg.solve(x.T @ x + penalty, x.T @ g["value"].to_numpy())
+        parts.append(g.select("date", "ticker", value=g["value"] - x @ beta))
+    return pl.concat(parts)
+
+
+class TestOrthogonalize:
+    """Batched per-date cross-sectional residualization."""
+
+    @pytest.mark.parametrize("ridge", [0.0, 2.0])
+    def test_matches_per_date_lstsq(self, exposed_factors, ridge):
+        from alpha.orthogonalization import orthogonalize
+
+        factor, others = exposed_factors
+        result = orthogonalize(factor, others, ridge=ridge)
+        expected = _lstsq_residuals(factor, others, ridge=ridge)
+        assert result.select("date", "ticker").equals(expected.select("date", "ticker"))
+        np.testing.assert_allclose(result["value"], expected["value"], atol=1e-10)
+
+    def test_residual_uncorrelated_with_regressors(self, exposed_factors):
+        from alpha.orthogonalization import orthogonalize
+
+        factor, others = exposed_factors
+        merged = orthogonalize(factor, others).join(
+            others[0].rename({"value": "x"}), on=["date", "ticker"]
+        )
+        per_date = merged.group_by("date").agg(pl.corr("value", "x"))["value"]
+        np.testing.assert_allclose(per_date, 0.0, atol=1e-10)
+
+    def test_thin_dates_dropped(self, exposed_factors):
+        from alpha.orthogonalization import orthogonalize
+
+        factor, others = exposed_factors
+        result = orthogonalize(factor, others, min_observations=11)
+        assert result.is_empty()
+
+    def test_collinear_regressors(self, factor_df, exposed_factors):
+        from alpha.orthogonalization import orthogonalize
+
+        factor, _ = exposed_factors
+        result = orthogonalize(factor, [factor_df, factor_df])
+        expected = _lstsq_residuals(factor, [factor_df])
+        np.testing.assert_allclose(result["value"], expected["value"], atol=1e-8)
+
+    def test_combine_factors_orthogonalize(self, exposed_factors):
+        from alpha.orthogonalization import orthogonalize
+
+        factor, others = exposed_factors
+        base = others[0]
+        composite = combine_factors([base, factor], orthogonalize=True)
+        expected = combine_factors([base, orthogonalize(factor, [base])])
+        assert composite.equals(expected)
+        assert not composite.equals(combine_factors([base, factor]))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Spearman Kernel
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class TestSpearmanKernel:
+    """Shared cross-sectional rank / rank-correlation kernel."""
+
+    def test_average_ranks_ties_and_nan(self, rng):
+        from scipy.stats import rankdata
+
+        from alpha.spearman import average_ranks
+
+        values = rng.integers(0, 4, (6, 3, 25)).astype(float)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        values[0, 0] = np.nan
+        np.testing.assert_allclose(
+            average_ranks(values), rankdata(values, axis=-1, nan_policy="omit")
+        )
+
+    def test_spearman_matches_scipy_on_joint_valid(self, rng):
+        from scipy.stats import spearmanr
+
+        from alpha.spearman import spearman
+
+        x = rng.standard_normal((5, 40))
+        y = rng.integers(0, 6, (5, 40)).astype(float)
+        x[0, :5] = np.nan
+        y[1, 10:12] = np.nan
+        y[4, :36] = np.nan
+        ic = spearman(x, y, min_observations=5)
+        for d in range(4):
+            ok = ~np.isnan(x[d]) & ~np.isnan(y[d])
+            assert ic[d] == pytest.approx(spearmanr(x[d, ok], y[d, ok]).statistic)
+        assert np.isnan(ic[4])
+
+    def test_long_frame_matches_polars(self, factor_df, forward_returns_df):
+        from alpha.spearman import cross_sectional_ranks, cross_sectional_spearman
+
+        merged = factor_df.join(forward_returns_df, on=["date", "ticker"]).sample(
+            fraction=1.0, shuffle=True, seed=0
+        )
+        ic = cross_sectional_spearman(
+            merged, "value", ["forward_return_5d"], min_observations=10
+        )
+        expected = _reference_ic(factor_df, forward_returns_df, 5, 0)
+        assert ic["date"].is_sorted()
+        assert ic.height == factor_df["date"].n_unique()
+        # dates with a missing return fall below min_observations=10
+        complete = ic.drop_nulls().join(expected, on="date")
+        assert complete.height < ic.height
+        np.testing.assert_allclose(
+            complete["forward_return_5d"], complete["ic"], atol=1e-12
+        )
+
+        ranked = cross_sectional_ranks(merged, "forward_return_5d")
+        reference = merged.with_columns(
+            pl.col("forward_return_5d")
+            .fill_nan(None)
+            .rank()
+            .over("date")
+            .cast(pl.Float64)
+            .alias("rank"),
+            pl.col("forward_return_5d").fill_nan(None).count().over("date").alias("n"),
+        )
+        assert ranked["rank"].equals(reference["rank"])
+        np.testing.assert_array_equal(ranked["n"], reference["n"])
+
+    def test_unsorted_datetime_dates(self, factor_df, forward_returns_df):
+        """Datetime dates take the search_sorted date-code path; rows in
+        (ticker, date) order are not grouped by date."""
+        from alpha.spearman import (
+            _blocks,
+            cross_sectional_ranks,
+            cross_sectional_spearman,
+            spearman,
+        )
+
+        merged = (
+            factor_df.join(forward_returns_df, on=["date", "ticker"])
+            .with_columns(pl.col("date").cast(pl.Datetime("us")))
+            .sort("ticker", "date")
+        )
+        col = "forward_return_5d"
+        expected = (
+            merged.filter(pl.col(col).is_finite())
+            .group_by("date")
+            .agg(pl.corr(pl.col("value").rank(), pl.col(col).rank()).alias("ic"))
+            .sort("date")
+        )
+
+        ic = cross_sectional_spearman(merged, "value", [col])
+        assert ic["date"].equals(expected["date"])
+        np.testing.assert_allclose(ic[col], expected["ic"], atol=1e-12)
+
+        (x, y), _, _ = _blocks(merged, ["value", col], "date")
+        np.testing.assert_allclose(spearman(x, y), expected["ic"], atol=1e-12)
+
+        ranked = cross_sectional_ranks(merged, col)
+        reference = merged.with_columns(
+            pl.col(col).fill_nan(None).rank().over("date").cast(pl.Float64)
+        )
+        assert ranked["rank"].equals(reference[col].alias("rank"))
+
+    def test_turnover_matches_rank_over(self, factor_df, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        # coarse signal: many ties
+        signal = factor_df.with_columns(pl.col("value").round(0))
+        expected = (
+            signal.with_columns(
+                (
+                    (pl.col("value").rank().over("date") - 1)
+                    / (pl.col("value").count().over("date") - 1)
+                    * 2
+                    - 1
+                ).alias("w")
+            )
+            .sort("ticker", "date")
+            .with_columns((pl.col("w") - pl.col("w").shift(1).over("ticker")).abs())
+            .drop_nulls("w")
+            .group_by("date")
+            .agg(pl.col("w").mean().alias("turnover"))
+            .sort("date")
+        )
+        turnover = FactorAnalyzer(signal, forward_returns_df).turnover()
+        np.testing.assert_allclose(turnover["turnover"], expected["turnover"])
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Factor Analyzer
+# ══════════════════════════════════════════════════════════════════════════════
+
+HORIZONS = [1, 5, 10]
+
+
+@pytest.fixture
+def forward_returns_df(factor_df, rng):
+    """Forward returns correlated with the signal, with missing stocks."""
+    n = factor_df.height
+    returns = factor_df.select("date", "ticker")
+    for h in HORIZONS:
+        noise = rng.standard_normal(n) * np.sqrt(h)
+        values = 0.3 * factor_df["value"].to_numpy() + noise
+        values[rng.random(n) < 0.05] = np.nan
+        returns = returns.with_columns(pl.Series(f"forward_return_{h}d", values))
+    return returns
+
+
+def _reference_ic(signal, returns, horizon, min_observations):
+    """The original one-horizon-at-a-time IC series."""
+    col = f"forward_return_{horizon}d"
+    return (
+        signal.join(returns, on=["date", "ticker"])
+        .filter(pl.col("value").is_finite() & pl.col(col).is_finite())
+        .with_columns(
+            pl.col("value").rank().over("date").alias("sr"),
+            pl.col(col).rank().over("date").alias("rr"),
+            pl.len().over("date").alias("n"),
+        )
+        .filter(pl.col("n") >= min_observations)
+        .group_by("date")
+        .agg(pl.corr("sr", "rr").alias("ic"))
+        .sort("date")
+    )
+
+
+class TestFactorAnalyzerIC:
+    """Batched multi-horizon IC engine."""
+
+    def test_matches_single_horizon_reference(self, factor_df, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df, min_observations=8)
+        batched = analyzer.ic_series_by_horizon(HORIZONS)
+        for h in HORIZONS:
+            expected = _reference_ic(factor_df, forward_returns_df, h, 8)
+            assert batched[h].equals(expected)
+            assert analyzer.ic_series(h).equals(expected)
+
+    def test_results_memoized(self, factor_df, forward_returns_df, monkeypatch):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df, min_observations=5)
+        calls = []
+        compute = analyzer._compute_ic
+        monkeypatch.setattr(
+            analyzer, "_compute_ic", lambda hs: calls.append(hs) or compute(hs)
+        )
+
+        decay = analyzer.ic_decay(horizons=[1, 5, 10, 20])
+        assert decay["horizon"].to_list() == HORIZONS
+        analyzer.summary(horizon=5, print_output=False)
+        analyzer.ir(10)
+        assert calls == [HORIZONS]
+        assert analyzer.ic_stats(5)["mean_ic"] > 0
+
+    def test_unsorted_datetime_dates(self, factor_df, forward_returns_df):
+        """Factor output: Datetime dates, rows in (ticker, date) order."""
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        signal, returns = (
+            df.with_columns(pl.col("date").cast(pl.Datetime("us"))).sort(
+                "ticker", "date"
+            )
+            for df in (factor_df, forward_returns_df)
+        )
+        analyzer = FactorAnalyzer(signal, returns, min_observations=8)
+        decay = analyzer.ic_decay(horizons=HORIZONS)
+        for h, mean_ic in zip(decay["horizon"], decay["mean_ic"]):
+            expected = _reference_ic(signal, returns, h, 8)
+            ic = analyzer.ic_series(h)
+            assert ic["date"].equals(expected["date"])
+            np.testing.assert_allclose(ic["ic"], expected["ic"], atol=1e-12)
+            assert mean_ic == pytest.approx(expected["ic"].mean())
+
+    def test_unknown_horizon_raises(self, factor_df, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        with pytest.raises(ValueError, match="forward_return_3d"):
+            FactorAnalyzer(factor_df, forward_returns_df).ic_series(3)
+
+
+class TestFactorAnalyzerQuantiles:
+    """Per-date quantile portfolio returns and their derived views."""
+
+    def test_matrix_matches_per_date_reference(self, factor_df, forward_returns_df):
+        from polars.testing import assert_frame_equal
+
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df)
+        for h in HORIZONS:
+            col = f"forward_return_{h}d"
+            expected = (
+                factor_df.join(forward_returns_df, on=["date", "ticker"])
+                .with_columns(
+                    (
+                        (pl.col("value").rank().over("date") - 1)
+                        * 5
+                        // pl.len().over("date")
+                        + 1
+                    ).alias("quantile"),
+                    pl.col(col).fill_nan(None),
+                )
+                .group_by("date")
+                .agg(
+                    [
+                        pl.col(col)
+                        .filter(pl.col("quantile") == q)
+                        .mean()
+                        .alias(f"q{q}")
+                        for q in range(1, 6)
+                    ]
+                )
+                .sort("date")
+            )
+            matrix = analyzer.quantile_return_matrix(h, n_quantiles=5)
+            assert_frame_equal(matrix, expected, check_exact=False)
+
+    def test_derived_views(self, factor_df, forward_returns_df):
+        from polars.testing import assert_series_equal
+
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df)
+        matrix = analyzer.quantile_return_matrix(1, n_quantiles=5)
+        spread = analyzer.quantile_spread(1, n_quantiles=5)
+        assert_series_equal(
+            spread["spread"], (matrix["q5"] - matrix["q1"]).alias("spread")
+        )
+        # the signal predicts returns: top quantile beats bottom on average
+        assert spread["spread"].mean() > 0
+
+        cumulative = analyzer.quantile_cumulative_returns(1, n_quantiles=5)
+        growth = (1 + matrix["q5"].fill_null(0.0)).cum_prod() - 1
+        assert np.allclose(cumulative["q5"].to_numpy(), growth.to_numpy())
+
+        monotonicity = analyzer.quantile_monotonicity(1, n_quantiles=5)
+        values = monotonicity["monotonicity"].drop_nans().drop_nulls()
+        assert values.min() >= -1 and values.max() <= 1
+        assert values.mean() > 0
+
+    def test_pooled_returns_and_memo(self, factor_df, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df)
+        pooled = analyzer.quantile_returns(horizon=5, n_quantiles=5)
+        assert pooled["quantile"].to_list() == [1, 2, 3, 4, 5]
+
+        assigned = analyzer.quantile_assignments(5).join(
+            forward_returns_df, on=["date", "ticker"]
+        )
+        expected = (
+            assigned.filter(pl.col("forward_return_5d").is_finite())
+            .group_by("quantile")
+            .agg(pl.col("forward_return_5d").mean(), pl.len())
+            .sort("quantile")
+        )
+        assert np.allclose(pooled["mean_return"], expected["forward_return_5d"])
+        assert pooled["n_observations"].to_list() == expected["len"].to_list()
+        # every horizon comes from one aggregation per n_quantiles
+        analyzer.quantile_spread(10, n_quantiles=5)
+        assert list(analyzer._quantile_cache) == [5]
+
+        with pytest.raises(ValueError, match="forward_return_3d"):
+            analyzer.quantile_returns(horizon=3)
+
+    def test_unsorted_datetime_dates(self, factor_df, forward_returns_df):
+        """Factor output (Datetime dates, (ticker, date) order) gives the
+        same metrics as a Date frame grouped by date."""
+        from polars.testing import assert_frame_equal
+
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        signal, returns = (
+            df.with_columns(pl.col("date").cast(pl.Datetime("us"))).sort(
+                "ticker", "date"
+            )
+            for df in (factor_df, forward_returns_df)
+        )
+        analyzer = FactorAnalyzer(signal, returns)
+        expected = FactorAnalyzer(factor_df.sort("date"), forward_returns_df)
+
+        def as_date(df: pl.DataFrame) -> pl.DataFrame:
+            return df.with_columns(pl.col("date").cast(pl.Date))
+
+        assert_frame_equal(as_date(analyzer.turnover()), expected.turnover())
+        for view in ("quantile_return_matrix", "quantile_spread"):
+            assert_frame_equal(
+                as_date(getattr(analyzer, view)(5)),
+                getattr(expected, view)(5),
+                check_exact=False,
+            )
+        assert_frame_equal(
+            as_date(analyzer.quantile_turnover(5)), expected.quantile_turnover(5)
+        )
+        assert_frame_equal(
+            analyzer.quantile_returns(5),
+            expected.quantile_returns(5),
+            check_exact=False,
+        )
+
+    def test_turnover(self, factor_df, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+
+        analyzer = FactorAnalyzer(factor_df, forward_returns_df)
+        turnover = analyzer.quantile_turnover(n_quantiles=5)
+        assert turnover.height == factor_df["date"].n_unique() - 1
+        values = turnover.drop("date").to_numpy()
+        assert ((values >= 0) & (values <= 1)).all()
+        # a random signal reshuffles most names each day
+        assert values.mean() > 0.5
+
+        # a constant ranking never changes quantile
+        frozen = factor_df.with_columns(
+            pl.col("ticker").str.slice(-2).cast(pl.Float64).alias("value")
+        )
+        stable = FactorAnalyzer(frozen, forward_returns_df).quantile_turnover(5)
+        assert (stable.drop("date").to_numpy() == 0).all()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  Factor Panel
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def panel_factors(factor_df, rng):
+    """Three factors on the same grid: a base, a noisy copy, and noise."""
+    n = factor_df.height
+    noisy = factor_df["value"].to_numpy() + rng.standard_normal(n)
+    noisy[rng.random(n) < 0.1] = np.nan
+    return {
+        "base": factor_df,
+        "noisy": factor_df.with_columns(pl.Series("value", noisy)),
+        "noise": factor_df.with_columns(pl.Series("value", rng.standard_normal(n))),
+    }
+
+
+class TestFactorPanel:
+    """Multi-factor IC matrix and factor rank correlations."""
+
+    def test_ic_matches_factor_analyzer(self, panel_factors, forward_returns_df):
+        from alpha.factor_analyzer import FactorAnalyzer
+        from alpha.factor_panel import FactorPanel
+
+        panel = FactorPanel(panel_factors, forward_returns_df, min_observations=8)
+        for name, signal in panel_factors.items():
+            analyzer = FactorAnalyzer(signal, forward_returns_df, min_observations=8)
+            for h in HORIZONS:
+                expected = analyzer.ic_series(h)
+                result = panel.ic_series(name, h)
+                assert result["date"].equals(expected["date"])
+                np.testing.assert_allclose(result["ic"], expected["ic"], atol=1e-12)
+                assert panel.ic_summary().filter(
+                    (pl.col("factor") == name) & (pl.col("horizon") == h)
+                )["mean_ic"][0] == pytest.approx(analyzer.ic_stats(h)["mean_ic"])
+
+    def test_ic_matrix_shape(self, panel_factors, forward_returns_df):
+        from alpha.factor_panel import FactorPanel
+
+        matrix = FactorPanel(
+            panel_factors, forward_returns_df, min_observations=8
+        ).ic_matrix()
+        assert matrix["factor"].to_list() == list(panel_factors)
+        assert matrix.columns == ["factor", "ic_1d", "ic_5d", "ic_10d"]
+
+    def test_factor_correlation(self, panel_factors, forward_returns_df):
+        from alpha.factor_panel import FactorPanel
+
+        panel = FactorPanel(panel_factors, forward_returns_df, min_observations=8)
+        corr = panel.factor_correlation()
+        matrix = corr.drop("factor").to_numpy()
+        np.testing.assert_allclose(matrix, matrix.T)
+        np.testing.assert_allclose(np.diag(matrix), 1.0)
+        # base vs its noisy copy: each ranked over its own valid stocks,
+        # correlated over the stocks where both are valid
+        ranked = [
+            f.filter(pl.col("value").is_not_nan()).with_columns(
+                pl.col("value").rank().over("date").alias(name)
+            )
+            for name, f in panel_factors.items()
+        ]
+        expected = (
+            panel.dates.to_frame()
+            .join(
+                ranked[0]
+                .join(ranked[1], on=["date", "ticker"])
+                .group_by("date")
+                .agg(pl.corr("base", "noisy").alias("corr"), pl.len().alias("n"))
+                .filter(pl.col("n") >= 8),
+                on="date",
+                how="left",
+            )["corr"]
+            .to_numpy()
+        )
+        series = panel.factor_correlation_series("base", "noisy")
+        np.testing.assert_allclose(series["corr"], expected, atol=1e-12)
+        assert matrix[0, 1] == pytest.approx(np.nanmean(expected))
+        assert abs(matrix[0, 2]) < 0.3
+
+        pairs = panel.factor_correlation_series()
+        assert pairs.height == 3 * len(panel.dates)
+        assert pairs.filter(
+            (pl.col("factor_a") == "base") & (pl.col("factor_b") == "noisy")
+        )["corr"].equals(series["corr"])
+
+    def test_unknown_horizon_raises(self, panel_factors, forward_returns_df):
+        from alpha.factor_panel import FactorPanel
+
+        with pytest.raises(ValueError, match=r"\[3\]"):
+            FactorPanel(panel_factors, forward_returns_df, horizons=[3])
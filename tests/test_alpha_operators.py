@@ -0,0 +1,227 @@
+"""
+Tests for src/alpha/operators.py — Polars Alpha 101 operators and the
+alpha001–003 ports, checked against the original pandas implementations.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from alpha import operators as op
+from factors.alphas import pandas_reference as ref
+
+N_BARS = 80
+TICKERS = [f"T{i:02d}" for i in range(12)]
+
+
+@pytest.fixture
+def ohlcv(rng: np.random.Generator) -> pl.DataFrame:
+    """Random OHLCV in shuffled row order, with volume ties across tickers."""
+    start = dt.datetime(2024, 1, 2)
+    n = N_BARS * len(TICKERS)
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.02, (len(TICKERS), N_BARS)), 1))
+    return pl.DataFrame(
+        {
+            "ticker": np.repeat(TICKERS, N_BARS),
+            "timestamps": [start + dt.timedelta(days=i) for i in range(N_BARS)]
+            * len(TICKERS),
+            "open": close.ravel() * np.exp(rng.normal(0, 0.01, n)),
+            "close": close.ravel(),
+            "volume": rng.integers(1, 40, n) * 1_000,
+        }
+    ).sample(fraction=1.0, shuffle=True, seed=3)
+
+
+def _assert_matches(result: pl.Series, expected: pd.Series, atol: float = 1e-12):
+    """Same missing mask and equal values elsewhere.
+
+    null, NaN and ±inf all count as missing: on constant windows pandas and
+    Polars disagree on 0/0 vs x/0 for correlations, and the factor wrapper
+    drops every non-finite value anyway.
+    """
+    got = result.cast(pl.Float64).fill_null(np.nan).to_numpy()
+    want = expected.to_numpy(dtype=np.float64)
+    finite = np.isfinite(want)
+    np.testing.assert_array_equal(np.isfinite(got), finite)
+    np.testing.assert_allclose(got[finite], want[finite], rtol=1e-9, atol=atol)
+
+
+# ── operators ─────────────────────────────────────────────────────────────────
+
+
+class TestTimeSeriesOperators:
+    """ts_* operators vs. pandas rolling per ticker."""
+
+    @pytest.fixture
+    def frame(self, ohlcv):
+        return ohlcv.sort(["ticker", "timestamps"])
+
+    @pytest.mark.parametrize(
+        "name,pd_fn",
+        [
+            ("ts_sum", lambda r: r.sum()),
+            ("ts_min", lambda r: r.min()),
+            ("ts_max", lambda r: r.max()),
+            ("ts_stddev", lambda r: r.std()),
+            ("ts_product", lambda r: r.apply(np.prod, raw=True)),
+            ("ts_argmax", lambda r: r.apply(np.argmax, raw=True)),
+            ("ts_argmin", lambda r: r.apply(np.argmin, raw=True)),
+        ],
+    )
+    def test_rolling_matches_pandas(self, frame, name, pd_fn):
+        ret = pl.col("close") / op.delay("close", 1) - 1
+        result = frame.select(getattr(op, name)(ret.round(3), 5).alias("x"))["x"]
+        df, g = ref.to_pandas(frame)
+        x = (df["close"] / g["close"].shift(1) - 1).round(3)
+        _assert_matches(result, ref.rolling(g, x, 5, pd_fn))
+
+    def test_ts_rank_averages_ties(self, frame):
+        from scipy.stats import rankdata
+
+        result = frame.select(op.ts_rank(pl.col("volume") // 5000, 7).alias("x"))["x"]
+        df, g = ref.to_pandas(frame)
+        expected = ref.rolling(
+            g, df["volume"] // 5000, 7, lambda r: r.apply(lambda a: rankdata(a)[-1])
+        )
+        _assert_matches(result, expected)
+
+    def test_decay_linear(self, frame):
+        result = frame.select(op.decay_linear("close", 4).alias("x"))["x"]
+        df, g = ref.to_pandas(frame)
+        weights = np.arange(1, 5) / 10
+        expected = ref.rolling(g, df["close"], 4, lambda r: r.apply(weights.dot))
+        _assert_matches(result, expected, atol=1e-9)
+
+    def test_corr_and_cov(self, frame):
+        result = frame.select(
+            op.ts_corr("open", "volume", 6).alias("corr"),
+            op.ts_cov("open", "volume", 6).alias("cov"),
+        )
+        df, g = ref.to_pandas(frame)
+        _assert_matches(result["corr"], ref.ts_corr(g, df["open"], df["volume"], 6))
+        expected_cov = g.apply(
+            lambda _: df["open"].loc[_.index].rolling(6).cov(df["volume"].loc[_.index]),
+            include_groups=False,
+        ).droplevel(0)
+        _assert_matches(result["cov"], expected_cov, atol=1e-6)
+
+    def test_delay_and_delta_stay_within_ticker(self, frame):
+        result = frame.select(
+            op.delay("close", 2).alias("lag"), op.delta("close", 2).alias("diff")
+        )
+        first_rows = (
+            frame.with_row_index().group_by("ticker").agg(pl.col("index").head(2))
+        )
+        idx = [i for rows in first_rows["index"] for i in rows]
+        assert result["lag"][idx].is_null().all()
+        valid = result.filter(pl.col("lag").is_not_null())
+        assert valid.height == frame.height - 2 * len(TICKERS)
+
+
+class TestCrossSectionalOperators:
+    """cs_* operators per date."""
+
+    def test_cs_rank_matches_pandas_pct_rank(self, ohlcv):
+        frame = ohlcv.with_columns(
+            pl.when(pl.col("volume") < 5_000)
+            .then(float("nan"))
+            .otherwise(pl.col("volume").cast(pl.Float64))
+            .alias("volume")
+        )
+        result = frame.select(op.cs_rank("volume").alias("x"))["x"]
+        df = frame.to_pandas()
+        _assert_matches(result, ref.rank(df["volume"], df["timestamps"]))
+
+    def test_cs_scale_and_zscore(self, ohlcv):
+        result = ohlcv.select(
+            "timestamps",
+            op.cs_scale("open", a=2.0).alias("scaled"),
+            op.cs_zscore("open").alias("z"),
+        )
+        by_date = result.group_by("timestamps").agg(
+            pl.col("scaled").abs().sum(),
+            pl.col("z").mean().alias("z_mean"),
+            pl.col("z").std().alias("z_std"),
+        )
+        np.testing.assert_allclose(by_date["scaled"], 2.0)
+        np.testing.assert_allclose(by_date["z_mean"], 0.0, atol=1e-12)
+        np.testing.assert_allclose(by_date["z_std"], 1.0)
+
+    def test_signed_power(self):
+        x = pl.Series([-2.0, 0.0, 3.0])
+        result = pl.select(op.signed_power(pl.lit(x), 2)).to_series()
+        assert result.to_list() == [-4.0, 0.0, 9.0]
+
+
+class TestOperatorNesting:
+    """Native windows on element-wise inputs; nested operators materialise."""
+
+    @staticmethod
+    def _is_native(expr: pl.Expr) -> bool:
+        return "AnonymousFunction" not in expr.meta.serialize(format="json")
+
+    def test_single_level_operators_are_native(self):
+        log_volume = pl.col("volume").log()
+        assert self._is_native(op.ts_sum("close", 5))
+        assert self._is_native(op.ts_rank(log_volume, 5))
+        assert self._is_native(op.ts_corr("open", log_volume, 6))
+        assert self._is_native(op.cs_rank(pl.col("close") - pl.col("open")))
+
+    def test_nested_operators_materialise(self):
+        assert not self._is_native(op.cs_rank(op.delta("close", 1)))
+        assert not self._is_native(op.ts_sum(op.delay("close", 1), 5))
+
+    def test_nested_matches_stepwise(self, ohlcv):
+        """Nesting equals applying each operator to a materialised column."""
+        from polars.testing import assert_frame_equal
+
+        nested = ohlcv.select(
+            op.cs_rank(op.ts_argmax("close", 5)).alias("cs_ts"),
+            op.ts_sum(op.cs_rank("volume"), 4).alias("ts_cs"),
+        )
+        stepwise = ohlcv.with_columns(
+            op.ts_argmax("close", 5).alias("argmax"),
+            op.cs_rank("volume").alias("rank"),
+        ).select(
+            op.cs_rank("argmax").alias("cs_ts"),
+            op.ts_sum("rank", 4).alias("ts_cs"),
+        )
+        assert_frame_equal(nested, stepwise)
+
+
+# ── alpha ports ──────────────────────────────────────────────────────────────
+
+
+class TestAlpha101Golden:
+    """alpha001–003 reproduce the original pandas implementations."""
+
+    @pytest.mark.parametrize(
+        "name,reference",
+        [
+            ("alpha001", ref.alpha001),
+            ("alpha002", ref.alpha002),
+            ("alpha003", ref.alpha003),
+        ],
+    )
+    def test_matches_pandas(self, ohlcv, name, reference):
+        from factors import get_factor_fn
+
+        raw = get_factor_fn(name).__wrapped__(ohlcv)
+        df, g = ref.to_pandas(ohlcv)
+        expected = reference(df, g)
+        _assert_matches(raw["value"], expected)
+        assert raw.select("ticker", "timestamps").equals(
+            pl.from_pandas(df[["ticker", "timestamps"]])
+        )
+
+    def test_registered_wrapper_output(self, ohlcv):
+        from factors import get_factor_fn
+
+        factor = get_factor_fn("alpha001")(ohlcv)
+        assert factor.columns == ["date", "ticker", "value"]
+        assert factor["value"].is_finite().all()
@@ -4,7 +4,10 @@ Tests for Phase 6 — Backtest Refactor.
 Covers:
     - PortfolioTracker: equity curve, turnover, position counts, cost deduction
     - WeightBacktester: run(), run_from_pipeline(), compare(), export()
+    - DensePortfolioTracker: dense NumPy core matches PortfolioTracker
+    - trade_scan: event-driven entry / exit kernel matches row iteration
     - ResultExporter: export_legacy_results() with/without benchmark
+    - BBIBOLL strategy: incremental indicator cache, holding-period expansion
     - Bug fixes: trade_rules 3-tuple type hint, dead imports removed
 
 All tests are fast unit tests using small synthetic data.
@@ -271,6 +274,207 @@ class TestWeightBacktester:
             assert any("config" in f for f in files)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# DensePortfolioTracker tests
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture
+def ragged_weights(dates, rng) -> pl.DataFrame:
+    """Random long-short weights with tickers dropping in and out."""
+    rows = []
+    for d in dates:
+        for t in TICKERS + ["NVDA"]:  # NVDA has no returns at all
+            if rng.random() < 0.75:
+                rows.append({"date": d, "ticker": t, "weight": rng.normal(0, 0.3)})
+    return pl.DataFrame(rows).with_columns(pl.col("date").cast(pl.Date))
+
+
+class TestDensePortfolioTracker:
+
+    @pytest.mark.parametrize("cost_bps", [0.0, 25.0])
+    def test_matches_polars_tracker(self, ragged_weights, returns_df, cost_bps):
+        from polars.testing import assert_frame_equal
+
+        from backtest.dense_tracker import DensePortfolioTracker
+        from backtest.portfolio_tracker import PortfolioTracker
+
+        expected = PortfolioTracker(cost_bps=cost_bps).run(ragged_weights, returns_df)
+        result = DensePortfolioTracker(cost_bps=cost_bps).run(
+            ragged_weights, returns_df
+        )
+
+        assert_frame_equal(
+            result.portfolio_daily, expected.portfolio_daily, check_exact=False
+        )
+        assert_frame_equal(result.turnover, expected.turnover, check_exact=False)
+        assert_frame_equal(result.position_count, expected.position_count)
+        assert result.n_days == expected.n_days
+        assert result.total_turnover == pytest.approx(expected.total_turnover)
+
+    def test_returns_panel_cached(self, weights_df, returns_df):
+        from backtest.dense_tracker import DensePortfolioTracker
+
+        tracker = DensePortfolioTracker()
+        tracker.run(weights_df, returns_df)
+        panel = tracker.returns_panel(returns_df)
+        tracker.run(weights_df, returns_df)
+        assert tracker.returns_panel(returns_df) is panel
+        # A different frame object rebuilds the panel
+        assert tracker.returns_panel(returns_df.clone()) is not panel
+
+    def test_panel_shape(self, returns_df):
+        from backtest.dense_tracker import DensePanel
+
+        panel = DensePanel.from_long(returns_df, "next_day_return")
+        assert panel.values.shape == (N_DAYS, len(TICKERS))
+        assert panel.values.dtype == np.float64
+        assert panel.present.all()
+
+    def test_empty_input(self):
+        from backtest.dense_tracker import DensePortfolioTracker
+
+        empty_w = pl.DataFrame({"date": [], "ticker": [], "weight": []})
+        empty_r = pl.DataFrame({"date": [], "ticker": [], "next_day_return": []})
+        result = DensePortfolioTracker().run(empty_w, empty_r)
+        assert result.n_days == 0
+
+    def test_backtester_dense_engine(self, ragged_weights, returns_df):
+        from backtest.weight_backtester import WeightBacktester
+
+        polars_res = WeightBacktester(cost_bps=5.0).run(ragged_weights, returns_df)
+        dense_res = WeightBacktester(cost_bps=5.0, engine="dense").run(
+            ragged_weights, returns_df
+        )
+        assert dense_res.config["engine"] == "dense"
+        assert dense_res.sharpe == pytest.approx(polars_res.sharpe)
+        assert dense_res.total_return == pytest.approx(polars_res.total_return)
+
+    @pytest.mark.parametrize("cost_bps", [0.0, 25.0])
+    def test_run_batch_matches_run(
+        self, ragged_weights, weights_df, returns_df, cost_bps
+    ):
+        from polars.testing import assert_frame_equal
+
+        from backtest.dense_tracker import DensePortfolioTracker
+        from backtest.portfolio_tracker import PortfolioTracker
+
+        # Every-other-day rebalance: dates missing from one strategy only
+        sparse = ragged_weights.filter(pl.col("date").rank("dense") % 2 == 1)
+        grid = {"ragged": ragged_weights, "ew": weights_df, "sparse": sparse}
+
+        batch = DensePortfolioTracker(cost_bps=cost_bps).run_batch(grid, returns_df)
+        assert list(batch) == list(grid)
+        for name, w in grid.items():
+            expected = PortfolioTracker(cost_bps=cost_bps).run(w, returns_df)
+            got = batch[name]
+            assert_frame_equal(
+                got.portfolio_daily, expected.portfolio_daily, check_exact=False
+            )
+            assert_frame_equal(got.turnover, expected.turnover, check_exact=False)
+            assert_frame_equal(got.position_count, expected.position_count)
+            assert got.total_turnover == pytest.approx(expected.total_turnover)
+
+    def test_run_batch_empty_member(self, weights_df, returns_df):
+        from backtest.dense_tracker import DensePortfolioTracker
+
+        batch = DensePortfolioTracker().run_batch(
+            {"ew": weights_df, "none": weights_df.clear()}, returns_df
+        )
+        assert batch["ew"].n_days == N_DAYS
+        assert batch["none"].n_days == 0
+
+    def test_backtester_run_many(self, ragged_weights, weights_df, returns_df):
+        from backtest.weight_backtester import WeightBacktester
+
+        bt = WeightBacktester(cost_bps=5.0)
+        results = bt.run_many({"ew": weights_df, "ragged": ragged_weights}, returns_df)
+        single = bt.run(ragged_weights, returns_df, name="ragged")
+
+        assert results["ragged"].config["strategy_name"] == "ragged"
+        # run_many always simulates on the dense batch core
+        assert results["ragged"].config["engine"] == "dense"
+        assert single.config["engine"] == "polars"
+        assert results["ragged"].sharpe == pytest.approx(single.sharpe)
+        assert len(bt.compare(results)) == 2
+
+    def test_unknown_engine_raises(self):
+        from backtest.weight_backtester import WeightBacktester
+
+        with pytest.raises(ValueError, match="Unknown engine"):
+            WeightBacktester(engine="gpu")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Trade scan kernel tests
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+def _reference_scan(entry, exit_rule, segments):
+    """Row-by-row state machine the kernel must reproduce."""
+    entries, exits = [], []
+    for start, stop in segments:
+        holding = None
+        for i in range(start, stop):
+            if holding is None and entry[i]:
+                holding = i
+                entries.append(i)
+            elif holding is not None and exit_rule(holding, i, i + 1)[0]:
+                exits.append(i)
+                holding = None
+        if holding is not None:
+            exits.append(-1)
+    return entries, exits
+
+
+class TestTradeScan:
+
+    def test_segment_bounds(self):
+        from backtest.trade_scan import segment_bounds
+
+        bounds = segment_bounds(pl.Series(["A", "A", "B", "C", "C", "C"]))
+        assert bounds.tolist() == [[0, 2], [2, 3], [3, 6]]
+        assert segment_bounds(pl.Series([], dtype=pl.String)).shape == (0, 2)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_row_by_row_reference(self, seed):
+        from backtest.trade_scan import scan_trades, segment_bounds
+
+        rng = np.random.default_rng(seed)
+        keys = pl.Series(np.repeat(["A", "B", "C", "D"], [150, 1, 300, 40]))
+        n = len(keys)
+        entry = rng.random(n) < 0.1
+        price = rng.lognormal(0, 0.05, n)
+
+        def exit_rule(i, lo, hi):
+            ret = price[lo:hi] / price[i] - 1
+            return (ret > 0.08) | (ret < -0.08)
+
+        segments = segment_bounds(keys)
+        entries, exits = scan_trades(entry, exit_rule, segments, min_window=2)
+        ref_entries, ref_exits = _reference_scan(entry, exit_rule, segments)
+        assert entries.tolist() == ref_entries
+        assert exits.tolist() == ref_exits
+
+    def test_exit_bar_does_not_reenter(self):
+        from backtest.trade_scan import scan_trades
+
+        entry = np.array([True, True, True, False])
+        always = lambda i, lo, hi: np.ones(hi - lo, dtype=bool)  # noqa: E731
+        entries, exits = scan_trades(entry, always, np.array([[0, 4]]))
+        assert entries.tolist() == [0, 2]
+        assert exits.tolist() == [1, 3]
+
+    def test_trades_to_signals(self):
+        from backtest.trade_scan import trades_to_signals
+
+        frame = pl.DataFrame(
+            {"ticker": ["A", "A", "A", "B"], "timestamps": [1, 2, 3, 1]}
+        )
+        signals = trades_to_signals(frame, np.array([0, 3]), np.array([2, -1]))
+        assert signals.rows() == [("A", 1, 1), ("A", 3, -1), ("B", 1, 1)]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # ResultExporter tests
 # ══════════════════════════════════════════════════════════════════════════════
@@ -363,6 +567,177 @@ class TestResultExporter:
             assert any("config" in f for f in files)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# BBIBOLL strategy
+# ══════════════════════════════════════════════════════════════════════════════
+
+N_BARS = 400
+
+
+@pytest.fixture
+def strategy_ohlcv(rng) -> pl.DataFrame:
+    """Random-walk daily OHLCV, N_BARS per ticker (ticker, timestamps, ...)."""
+    start = dt.datetime(2022, 1, 3)
+    frames = []
+    for ticker in TICKERS:
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, N_BARS)))
+        frames.append(
+            pl.DataFrame(
+                {
+                    "ticker": ticker,
+                    "timestamps": [start + dt.timedelta(days=i) for i in range(N_BARS)],
+                    "open": close,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": rng.integers(1_000, 100_000, N_BARS),
+                }
+            )
+        )
+    return pl.concat(frames)
+
+
+class TestStrategyIndicatorCache:
+
+    def test_appended_dates_reuse_cached_prefix(self, tmp_path, strategy_ohlcv):
+        """A run on appended dates recomputes only the BBIBOLL warm-up window."""
+        from polars.testing import assert_frame_equal
+
+        from indicators.basic_indicator import bbiboll_lookback
+        from indicators.cache import IndicatorCache
+        from strategy.bbiboll_strategy import BBIBOLLStrategy
+
+        cutoff = strategy_ohlcv["timestamps"].unique().sort()[300]
+        head = strategy_ohlcv.filter(pl.col("timestamps") <= cutoff)
+        strategy = BBIBOLLStrategy()
+        strategy.indicator_cache = IndicatorCache(str(tmp_path))
+        strategy.set_data(head)
+        strategy.calculate_indicators(cached=True)
+
+        seen_rows = []
+        compute = strategy._compute_indicators
+        strategy._compute_indicators = lambda df: (
+            seen_rows.append(df.height) or compute(df)
+        )
+        strategy.set_data(strategy_ohlcv)
+        result = strategy.calculate_indicators(cached=True)
+
+        new_rows = strategy_ohlcv.height - head.height
+        lookback = bbiboll_lookback(strategy.config["boll_length"])
+        assert seen_rows == [new_rows + lookback * len(TICKERS)]
+
+        keys = ["ticker", "timestamps"]
+        assert_frame_equal(
+            result.sort(keys), compute(strategy_ohlcv).sort(keys), check_exact=False
+        )
+        # the extended entry is now an exact hit
+        strategy.calculate_indicators(cached=True)
+        assert len(seen_rows) == 1
+
+
+def _reference_expansion(trades: pl.DataFrame, prices: pl.DataFrame) -> pl.DataFrame:
+    """The original per-ticker cross join of prices × trades, then filter."""
+    return (
+        prices.join(trades, on="ticker", how="inner")
+        .filter(
+            (pl.col("timestamps") >= pl.col("buy_date"))
+            & (pl.col("timestamps") <= pl.col("sell_date"))
+        )
+        .select(["trade_id", "ticker", "timestamps", "close"])
+        .sort(["trade_id", "timestamps"])
+    )
+
+
+class TestHoldingPeriodExpansion:
+
+    @pytest.fixture
+    def gapped_prices(self, rng) -> pl.DataFrame:
+        """Daily bars with random missing days, a different calendar per ticker."""
+        start = dt.datetime(2024, 1, 1)
+        frames = []
+        for ticker in TICKERS:
+            days = np.flatnonzero(rng.random(60) < 0.7)
+            frames.append(
+                pl.DataFrame(
+                    {
+                        "ticker": ticker,
+                        "timestamps": [start + dt.timedelta(days=int(d)) for d in days],
+                        "close": 100 + rng.standard_normal(len(days)).cumsum(),
+                    }
+                )
+            )
+        # shuffled, as trade_rules may pass them
+        return pl.concat(frames).sample(fraction=1.0, shuffle=True, seed=SEED)
+
+    def _compare(self, trades: pl.DataFrame, prices: pl.DataFrame) -> pl.DataFrame:
+        from polars.testing import assert_frame_equal
+
+        from strategy.bbiboll_strategy import BBIBOLLStrategy
+
+        trades = trades.with_row_index(name="trade_id")
+        result = BBIBOLLStrategy._expand_holding_periods(trades, prices)
+        assert_frame_equal(result, _reference_expansion(trades, prices))
+        return result
+
+    def test_edge_cases_match_cross_join(self, gapped_prices):
+        """Gaps, out-of-range / between-bar dates and same-bar trades."""
+        bars = gapped_prices.filter(pl.col("ticker") == "AAPL")["timestamps"].sort()
+        bar, next_bar = bars[10], bars[11]
+        between = bar + (next_bar - bar) / 2
+        day = dt.timedelta(days=1)
+        trades = pl.DataFrame(
+            {
+                "ticker": ["AAPL"] * 7 + ["MSFT", "MSFT", "GOOG", "NONE"],
+                "buy_date": [
+                    bars[0] - 10 * day,  # buy before the bars bar
+                    bars[5],
+                    bar,  # buy and sell on the same bar
+                    between,  # buy between bars
+                    between,  # buy and sell inside one gap: no bars
+                    bars[-5],
+                    bars[3],
+                    bars[2],
+                    bars[20] + dt.timedelta(hours=12),
+                    bars[-1] + 10 * day,  # buy after the last bar
+                    bars[0],  # ticker without prices
+                ],
+                "sell_date": [
+                    bars[4],
+                    between,  # sell between bars
+                    bar,
+                    bars[30],
+                    between + dt.timedelta(minutes=1),
+                    bars[-1] + 10 * day,  # sell after the last bar
+                    None,  # still open: not expanded
+                    bars[30],
+                    bars[35],
+                    bars[-1] + 20 * day,
+                    bars[10],
+                ],
+            }
+        )
+        result = self._compare(trades, gapped_prices)
+        held = result.group_by("trade_id").len().sort("trade_id")
+        assert held.filter(pl.col("trade_id") == 2)["len"].to_list() == [1]
+        assert not set(held["trade_id"].to_list()) & {4, 6, 9, 10}
+
+    def test_random_overlapping_trades_match_cross_join(self, gapped_prices, rng):
+        """Several overlapping trades per ticker, dates anywhere in the range."""
+        start = dt.datetime(2023, 12, 20)
+        n = 200
+        buy_offset = rng.uniform(0, 75, n)
+        sell_offset = buy_offset + rng.uniform(0, 20, n)
+        trades = pl.DataFrame(
+            {
+                "ticker": rng.choice(TICKERS, n),
+                "buy_date": [start + dt.timedelta(days=float(d)) for d in buy_offset],
+                "sell_date": [start + dt.timedelta(days=float(d)) for d in sell_offset],
+            }
+        ).with_columns(pl.col("buy_date", "sell_date").dt.round("1d"))
+        result = self._compare(trades, gapped_prices)
+        assert result["trade_id"].n_unique() > n // 2
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Bug fix verification tests
 # ══════════════════════════════════════════════════════════════════════════════
@@ -428,6 +803,8 @@ class TestBacktestExports:
         [
             "BacktestEngine",
             "BacktestResult",
+            "DensePanel",
+            "DensePortfolioTracker",
             "PerformanceAnalyzer",
             "PortfolioTracker",
             "StrategyBase",
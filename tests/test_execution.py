@@ -11,6 +11,8 @@ import pytest
 from execution.cost_analysis import (
     breakeven_cost,
     compute_net_returns,
+    compute_trade_costs,
+    compute_trades,
     compute_turnover,
     sharpe_vs_cost_curve,
 )
@@ -156,6 +158,82 @@ class TestComputeTurnover:
             compute_turnover(bad_df)
 
 
+class TestComputeTrades:
+    """Tests for compute_trades() — the shared turnover kernel."""
+
+    @pytest.fixture
+    def churn_weights(self) -> pl.DataFrame:
+        """A → (A, B) → B: B enters on day 2, A leaves on day 3."""
+        return pl.DataFrame(
+            {
+                "date": [1, 2, 2, 3],
+                "ticker": ["A", "A", "B", "B"],
+                "weight": [1.0, 0.5, 0.5, 1.0],
+            }
+        )
+
+    def test_entering_and_leaving_tickers(self, churn_weights):
+        trades = compute_trades(churn_weights)
+        by_key = {
+            (r["date"], r["ticker"]): r["delta_weight"]
+            for r in trades.iter_rows(named=True)
+        }
+        assert by_key == {
+            (2, "A"): -0.5,
+            (2, "B"): 0.5,
+            (3, "A"): -0.5,
+            (3, "B"): 0.5,
+        }
+
+    def test_first_date_dropped(self, churn_weights):
+        trades = compute_trades(churn_weights)
+        assert trades["date"].min() == 2
+
+    def test_trade_value_column(self, churn_weights):
+        trades = compute_trades(churn_weights, portfolio_value=1_000.0)
+        np.testing.assert_allclose(trades["trade_value"].to_numpy(), 500.0)
+
+    def test_turnover_matches_half_abs_sum(self, drifting_weights):
+        trades = compute_trades(drifting_weights)
+        expected = trades.group_by("date").agg(
+            (pl.col("delta_weight").abs().sum() / 2).alias("expected")
+        )
+        to = compute_turnover(drifting_weights).join(expected, on="date")
+        np.testing.assert_allclose(to["turnover"], to["expected"], atol=1e-12)
+
+    def test_include_first_date(self, drifting_weights):
+        to = compute_turnover(drifting_weights, include_first_date=True)
+        assert to.height == drifting_weights["date"].n_unique()
+        assert to["turnover"][0] == 0.0
+
+    def test_date_dtype_preserved(self, equal_weights):
+        w = equal_weights.with_columns(pl.col("date").cast(pl.Datetime("ns")))
+        assert compute_turnover(w)["date"].dtype == pl.Datetime("ns")
+
+    def test_trade_costs_fixed_model_prices_two_way_turnover(self, drifting_weights):
+        """Linear costs: per-trade pricing == both legs of one-way turnover."""
+        model = FixedCostModel(cost_bps=10.0)
+        costs = compute_trade_costs(compute_trades(drifting_weights), model)
+        to = compute_turnover(drifting_weights)
+        np.testing.assert_allclose(
+            costs["cost"].to_numpy(), 2 * to["turnover"].to_numpy() * 10 / 10_000
+        )
+
+    def test_trade_costs_sqrt_impact_cheaper_when_split(self, drifting_weights):
+        """Concave-participation impact: many small trades < one block trade."""
+        model = SqrtImpactCostModel(eta=0.1, default_adv=1_000_000.0)
+        trades = compute_trades(drifting_weights)
+        per_trade = compute_trade_costs(trades, model, portfolio_value=1e6)
+        block = model.estimate_array(
+            trades.group_by("date")
+            .agg(pl.col("delta_weight").abs().sum())
+            .sort("date")["delta_weight"]
+            .to_numpy()
+            * 1e6
+        )
+        assert per_trade["cost"].sum() < block.sum() / 1e6
+
+
 class TestComputeNetReturns:
     """Tests for compute_net_returns()."""
 
@@ -209,3 +287,21 @@ class TestSharpeVsCostCurve:
         np.testing.assert_allclose(
             result["net_sharpe"][0], result["gross_sharpe"], atol=1e-10
         )
+
+    def test_matches_compute_net_returns(self, daily_returns, constant_turnover):
+        """The vectorized sweep equals pricing each level with FixedCostModel."""
+        result = sharpe_vs_cost_curve(
+            daily_returns, constant_turnover, cost_bps_range=np.array([0.0, 5.0])
+        )
+        net = compute_net_returns(
+            daily_returns, constant_turnover, FixedCostModel(cost_bps=5.0)
+        )
+        np.testing.assert_allclose(
+            result["net_annual_return"][1], np.mean(net) * 252, atol=1e-12
+        )
+
+    def test_negative_cost_raises(self, daily_returns, constant_turnover):
+        with pytest.raises(ValueError, match="non-negative"):
+            sharpe_vs_cost_curve(
+                daily_returns, constant_turnover, cost_bps_range=[0.0, -1.0, 5.0]
+            )
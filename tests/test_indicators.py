@@ -0,0 +1,352 @@
+"""
+Tests for src/indicators/ — rolling primitives and registered indicators.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import polars as pl
+import pytest
+
+from indicators.base import ExecutionConfig, ts_rank
+from indicators.cache import IndicatorCache
+from indicators.registry import (
+    compute_incremental,
+    get_execution,
+    get_indicator,
+    get_indicator_exprs,
+    list_indicators,
+    register,
+    set_execution,
+)
+
+N_BARS = 400
+OHLCV_TICKERS = ["AAA", "BBB", "CCC"]
+
+
+@pytest.fixture
+def ohlcv(rng: np.random.Generator) -> pl.DataFrame:
+    """Random-walk daily OHLCV for a few tickers (ticker, timestamps, ...)."""
+    start = dt.datetime(2022, 1, 3)
+    frames = []
+    for ticker in OHLCV_TICKERS:
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, N_BARS)))
+        frames.append(
+            pl.DataFrame(
+                {
+                    "ticker": ticker,
+                    "timestamps": [start + dt.timedelta(days=i) for i in range(N_BARS)],
+                    "open": close * np.exp(rng.normal(0, 0.005, N_BARS)),
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": rng.integers(1_000, 100_000, N_BARS),
+                }
+            )
+        )
+    return pl.concat(frames)
+
+
+def _loop_rank(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """The original per-row dev_pct loop from calculate_bbiboll."""
+    ranks = []
+    for i in range(len(values)):
+        start_idx = max(0, i - window + 1) if i >= min_periods else 0
+        window_values = values[start_idx : i + 1]
+        if len(window_values) >= min_periods:
+            ranks.append(np.sum(window_values <= values[i]))
+        else:
+            ranks.append(np.nan)
+    return np.array(ranks, dtype=np.float64)
+
+
+class TestTsRank:
+    """Tests for ts_rank()."""
+
+    @pytest.mark.parametrize("window", [3, 20, 252])
+    def test_matches_loop_with_nans_and_ties(self, rng, window):
+        x = np.round(rng.normal(size=600), 1)
+        x[:30] = np.nan
+        x[rng.random(600) < 0.05] = np.nan
+        min_periods = min(50, window // 3)
+        np.testing.assert_array_equal(
+            ts_rank(x, window, min_periods=min_periods, chunk_size=64),
+            _loop_rank(x, window, min_periods),
+        )
+
+    def test_warm_up_is_nan(self):
+        ranks = ts_rank(np.arange(10.0), window=5, min_periods=3)
+        assert np.isnan(ranks[:2]).all()
+        np.testing.assert_array_equal(ranks[2:], [3, 4, 5, 5, 5, 5, 5, 5])
+
+    def test_default_min_periods_is_window(self):
+        ranks = ts_rank(np.arange(6.0), window=4)
+        assert np.isnan(ranks[:3]).all()
+        assert not np.isnan(ranks[3:]).any()
+
+    def test_empty(self):
+        assert len(ts_rank(np.array([]), window=5)) == 0
+
+
+class TestBBIBOLL:
+    """Tests for the bbiboll indicator."""
+
+    def test_dev_pct_matches_loop(self, ohlcv):
+        result = get_indicator("bbiboll")(ohlcv, pct_window=60)
+        for ticker in OHLCV_TICKERS:
+            dev = result.filter(pl.col("ticker") == ticker)
+            np.testing.assert_array_equal(
+                dev["dev_pct"].to_numpy(),
+                _loop_rank(dev["dev"].to_numpy(), 60, 20),
+            )
+
+
+class TestParallelExecution:
+    """Tests for the grouped-indicator execution backends."""
+
+    @pytest.mark.parametrize("name", ["bbiboll", "obv"])
+    @pytest.mark.parametrize("chunk_size", [None, 1, 2])
+    def test_thread_matches_serial(self, ohlcv, name, chunk_size):
+        from polars.testing import assert_frame_equal
+
+        func = get_indicator(name)
+        serial = func(ohlcv).sort(["ticker", "timestamps"])
+        threaded = func(
+            ohlcv,
+            execution=ExecutionConfig("thread", n_workers=2, chunk_size=chunk_size),
+        )
+        assert_frame_equal(threaded, serial)
+
+    def test_process_matches_serial(self, ohlcv):
+        from polars.testing import assert_frame_equal
+
+        func = get_indicator("obv")
+        serial = func(ohlcv).sort(["ticker", "timestamps"])
+        spawned = func(ohlcv, execution=ExecutionConfig("process", n_workers=2))
+        assert_frame_equal(spawned, serial)
+
+    def test_set_execution_default(self, ohlcv):
+        previous = set_execution("thread", n_workers=2, chunk_size=1)
+        try:
+            assert get_execution().backend == "thread"
+            result = get_indicator("obv")(ohlcv)
+            assert result["ticker"].to_list() == sorted(result["ticker"].to_list())
+        finally:
+            set_execution(previous.backend, previous.n_workers, previous.chunk_size)
+        assert get_execution().backend == "serial"
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            ExecutionConfig("gpu")
+
+
+def _as_float(series: pl.Series) -> np.ndarray:
+    """Float array with null → NaN, so TA-Lib and Polars warm-ups compare."""
+    return series.cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+
+class TestExprIndicators:
+    """Polars-expression indicators vs. their TA-Lib counterparts."""
+
+    @pytest.fixture
+    def shuffled(self, ohlcv) -> pl.DataFrame:
+        """Expr indicators window by timestamps, so input order must not matter."""
+        return ohlcv.sample(fraction=1.0, shuffle=True, seed=7)
+
+    def test_registered_as_expr(self):
+        assert {"bbiboll_expr", "obv_expr"} <= set(list_indicators(kind="expr"))
+        assert "bbiboll" in list_indicators(kind="frame")
+
+    def test_obv_matches_talib(self, ohlcv, shuffled):
+        expected = get_indicator("obv")(ohlcv).sort(["ticker", "timestamps"])
+        result = get_indicator("obv_expr")(shuffled).sort(["ticker", "timestamps"])
+        np.testing.assert_allclose(result["obv"], expected["obv"])
+
+    @pytest.mark.parametrize("boll_length,pct_window", [(11, 252), (5, 30)])
+    def test_bbiboll_matches_talib(self, ohlcv, shuffled, boll_length, pct_window):
+        params = dict(boll_length=boll_length, boll_multiple=6, pct_window=pct_window)
+        expected = get_indicator("bbiboll")(ohlcv, **params).sort(
+            ["ticker", "timestamps"]
+        )
+        result = get_indicator("bbiboll_expr")(shuffled, **params).sort(
+            ["ticker", "timestamps"]
+        )
+        for col in ["bbi", "dev", "upr", "dwn"]:
+            np.testing.assert_allclose(
+                _as_float(result[col]),
+                _as_float(expected[col]),
+                rtol=1e-9,
+                atol=1e-8,  # TA-Lib STDDEV uses running sums
+            )
+        for col in ["dev_pct", "longterm_dev_pct_rank"]:
+            np.testing.assert_array_equal(
+                _as_float(result[col]), _as_float(expected[col])
+            )
+
+    def test_lazy_frame_composes(self, ohlcv):
+        lazy = get_indicator("obv_expr")(ohlcv.lazy())
+        assert isinstance(lazy, pl.LazyFrame)
+        eager = get_indicator("obv_expr")(ohlcv)
+        assert lazy.collect().equals(eager)
+
+    def test_get_indicator_exprs(self, ohlcv):
+        exprs = get_indicator_exprs("bbiboll_expr", boll_length=5)
+        result = ohlcv.lazy().select("ticker", "timestamps", *exprs).collect()
+        assert {"bbi", "dev", "dev_pct"} <= set(result.columns)
+        with pytest.raises(ValueError, match="not an expression indicator"):
+            get_indicator_exprs("bbiboll")
+
+    def test_unknown_kind_raises(self):
+        with pytest.raises(ValueError, match="Unknown indicator kind"):
+            register("nope", kind="udf")
+
+
+def _sma5(df: pl.DataFrame) -> pl.DataFrame:
+    """Simple lookback-5 indicator used to exercise the cache."""
+    return df.sort(["ticker", "timestamps"]).with_columns(
+        pl.col("close").rolling_mean(5).over("ticker").alias("sma5")
+    )
+
+
+class TestIndicatorCache:
+    """Tests for IndicatorCache."""
+
+    @pytest.fixture
+    def tz_ohlcv(self, ohlcv) -> pl.DataFrame:
+        return ohlcv.with_columns(
+            pl.col("timestamps")
+            .dt.replace_time_zone("America/New_York")
+            .dt.cast_time_unit("ns")
+        )
+
+    def test_round_trip_keeps_dtypes(self, tmp_path, tz_ohlcv):
+        cache = IndicatorCache(str(tmp_path))
+        result = _sma5(tz_ohlcv)
+        cache.save("sma", {"n": 5}, tz_ohlcv, result)
+        loaded = cache.load("sma", {"n": 5}, tz_ohlcv)
+        assert loaded is not None
+        assert loaded.schema == result.schema
+        assert loaded.equals(result)
+
+    def test_params_change_is_a_miss(self, tmp_path, ohlcv):
+        cache = IndicatorCache(str(tmp_path))
+        cache.save("sma", {"n": 5}, ohlcv, _sma5(ohlcv))
+        assert cache.load("sma", {"n": 6}, ohlcv) is None
+
+    def test_data_change_is_a_miss(self, tmp_path, ohlcv):
+        cache = IndicatorCache(str(tmp_path))
+        cache.save("sma", {}, ohlcv, _sma5(ohlcv))
+        edited = ohlcv.with_columns(
+            pl.when(pl.int_range(pl.len()) == 10)
+            .then(pl.col("close") + 1)
+            .otherwise(pl.col("close"))
+            .alias("close")
+        )
+        assert cache.load("sma", {}, edited) is None
+        assert cache.load("sma", {}, ohlcv.sample(fraction=1.0, seed=1)) is not None
+
+    def test_incremental_append_matches_full(self, tmp_path, ohlcv):
+        cache = IndicatorCache(str(tmp_path))
+        cutoff = ohlcv["timestamps"].sort()[300]
+        cache.get_or_compute(
+            "sma", ohlcv.filter(pl.col("timestamps") <= cutoff), _sma5, lookback=5
+        )
+
+        seen_rows = []
+
+        def tracked(df):
+            seen_rows.append(df.height)
+            return _sma5(df)
+
+        result = cache.get_or_compute("sma", ohlcv, tracked, lookback=5)
+        new_rows = ohlcv.filter(pl.col("timestamps") > cutoff).height
+        assert seen_rows == [new_rows + 5 * len(OHLCV_TICKERS)]
+
+        from polars.testing import assert_frame_equal
+
+        # rolling sums restarted from the warm-up context differ by ulps only
+        assert_frame_equal(
+            result.sort(["ticker", "timestamps"]), _sma5(ohlcv), check_exact=False
+        )
+        # The extended entry is now an exact hit
+        assert cache.load("sma", {}, ohlcv) is not None
+
+    def test_changed_prefix_recomputes_fully(self, tmp_path, ohlcv):
+        cache = IndicatorCache(str(tmp_path))
+        cutoff = ohlcv["timestamps"].sort()[300]
+        cache.get_or_compute(
+            "sma", ohlcv.filter(pl.col("timestamps") <= cutoff), _sma5, lookback=5
+        )
+        restated = ohlcv.with_columns(pl.col("close") * 2)
+        result = cache.get_or_compute("sma", restated, _sma5, lookback=5)
+        assert result.equals(_sma5(restated))
+
+
+class TestIncrementalRecompute:
+    """Appending bars recomputes only the declared lookback window."""
+
+    @pytest.fixture
+    def split(self, ohlcv):
+        cutoff = ohlcv["timestamps"].sort()[330]
+        return ohlcv.filter(pl.col("timestamps") <= cutoff), ohlcv
+
+    def _compare(self, result, expected, exact_cols=()):
+        from polars.testing import assert_frame_equal
+
+        keys = ["ticker", "timestamps"]
+        result, expected = result.sort(keys), expected.sort(keys)
+        assert_frame_equal(result, expected, check_exact=False)
+        for col in exact_cols:
+            np.testing.assert_array_equal(
+                _as_float(result[col]), _as_float(expected[col])
+            )
+
+    @pytest.mark.parametrize("name", ["obv", "obv_expr"])
+    def test_obv_reanchors_running_total(self, tmp_path, split, name):
+        head, full = split
+        cache = IndicatorCache(str(tmp_path))
+        compute_incremental(name, head, cache)
+        result = compute_incremental(name, full, cache)
+        self._compare(result, get_indicator(name)(full), exact_cols=["obv"])
+
+    @pytest.mark.parametrize("name", ["bbiboll", "bbiboll_expr"])
+    def test_bbiboll_refreshes_longterm_rank(self, tmp_path, split, name):
+        head, full = split
+        params = dict(boll_length=5, pct_window=60)
+        cache = IndicatorCache(str(tmp_path))
+        compute_incremental(name, head, cache, **params)
+
+        appended = []
+        append = cache._append
+        cache._append = (
+            lambda *a, **kw: appended.append(append(*a, **kw)) or appended[-1]
+        )
+        result = compute_incremental(name, full, cache, **params)
+        assert len(appended) == 1 and appended[0] is not None
+
+        self._compare(
+            result,
+            get_indicator(name)(full, **params),
+            exact_cols=["dev_pct", "longterm_dev_pct_rank"],
+        )
+
+    @pytest.mark.parametrize(
+        "name,kwargs",
+        [("momentum", {"lookback": 10}), ("vol_ratio", {"long_window": 30})],
+    )
+    def test_factor_matches_full(self, tmp_path, split, name, kwargs):
+        import factors.alphas.basic101  # noqa: F401
+        from factors import compute_factor_incremental, get_factor_fn
+
+        head, full = split
+        cache = IndicatorCache(str(tmp_path))
+        compute_factor_incremental(name, head, cache, **kwargs)
+        result = compute_factor_incremental(name, full, cache, **kwargs)
+        expected = get_factor_fn(name)(full, **kwargs)
+
+        from polars.testing import assert_frame_equal
+
+        keys = ["date", "ticker"]
+        assert_frame_equal(result.sort(keys), expected.sort(keys), check_exact=False)
@@ -298,6 +298,65 @@ class TestComputePortfolioReturn:
         assert dates_list == sorted(dates_list)
 
 
+# ── Test lazy sizing methods ────────────────────────────────────────────────
+
+
+class TestSizingMethods:
+    """``build_sizing_methods`` computes a method only when it is accessed."""
+
+    @pytest.fixture
+    def inputs(self, ohlcv: pl.DataFrame):
+        from portfolio.pipeline import compute_daily_returns
+
+        daily = compute_daily_returns(ohlcv)
+        composite = daily.select(
+            "date", "ticker", pl.col("daily_return").alias("value")
+        )
+        return composite, ohlcv, daily
+
+    def test_computed_on_first_access(self, inputs, monkeypatch):
+        from factors import FactorContext
+        from portfolio.pipeline import build_sizing_methods
+
+        calls = []
+        original = FactorContext.rolling_std
+
+        def counting(self, source, window):
+            calls.append(window)
+            return original(self, source, window)
+
+        monkeypatch.setattr(FactorContext, "rolling_std", counting)
+        methods = build_sizing_methods(*inputs, n_long=2, vol_window=5)
+        assert list(methods) == [
+            "Equal-Weight",
+            "Inverse-Vol",
+            "Vol-Target (10%)",
+            "Signal-Weighted",
+        ]
+        assert "Inverse-Vol" in methods and methods.computed() == []
+
+        weights = methods["Inverse-Vol"]
+        assert methods["Inverse-Vol"] is weights
+        assert methods.computed() == ["Inverse-Vol"]
+        methods["Vol-Target (10%)"]
+        assert methods.computed() == ["Inverse-Vol", "Vol-Target (10%)"]
+        assert calls == [5]  # realized vol computed once for both methods
+
+    def test_matches_direct_sizing(self, inputs):
+        from portfolio.pipeline import build_sizing_methods
+        from risk.position_sizing import (
+            compute_realized_volatility,
+            size_inverse_volatility,
+        )
+
+        composite, ohlcv, daily = inputs
+        methods = build_sizing_methods(composite, ohlcv, daily, n_long=2)
+        vol = compute_realized_volatility(ohlcv, window=20)
+        expected = size_inverse_volatility(composite, vol, n_long=2, n_short=0)
+        assert methods["Inverse-Vol"].equals(expected)
+        assert all(isinstance(w, pl.DataFrame) for w in methods.values())
+
+
 # ── Test factor registry ────────────────────────────────────────────────────
 
 
@@ -325,6 +384,371 @@ class TestFactorRegistry:
         with pytest.raises(KeyError, match="Unknown factor"):
             build_factor_pipeline(ohlcv, factor_names=["nonexistent_factor_abc"])
 
+    def test_expression_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+        from factors import get_factor_expr, list_factors, register_factor
+
+        assert {"momentum", "vol_ratio", "alpha001"} <= set(list_factors(kind="expr"))
+        assert "bbiboll" in list_factors(kind="frame")
+        assert isinstance(get_factor_expr("momentum", lookback=5), pl.Expr)
+        with pytest.raises(ValueError, match="not an expression factor"):
+            get_factor_expr("bbiboll")
+        with pytest.raises(ValueError, match="Unknown factor kind"):
+            register_factor("test_kind_xyz", kind="series")
+
+
+# ── Test factor context ─────────────────────────────────────────────────────
+
+
+class TestFactorContext:
+    """Shared intermediates across factors within one pipeline run."""
+
+    @pytest.fixture(autouse=True)
+    def _basic_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+
+    def test_factors_match_without_context(self, ohlcv: pl.DataFrame):
+        from factors import FactorContext, get_factor_fn
+
+        names = ["momentum", "vol_ratio", "bbiboll", "alpha001", "alpha003"]
+        standalone = {n: get_factor_fn(n)(ohlcv) for n in names}
+        with FactorContext(ohlcv):
+            shared = {n: get_factor_fn(n)(ohlcv) for n in names}
+        for name in names:
+            assert shared[name].equals(standalone[name]), name
+
+    def test_intermediates_computed_once(self, ohlcv: pl.DataFrame):
+        from factors import FactorContext
+        from portfolio.pipeline import build_factor_pipeline, compute_daily_returns
+
+        with FactorContext(ohlcv) as ctx:
+            compute_daily_returns(ohlcv)
+            sorted_frame = ctx.sorted
+            build_factor_pipeline(ohlcv, factor_names=["momentum", "bbiboll"])
+            assert ctx.sorted is sorted_frame
+            params = {"boll_length": 11, "boll_multiple": 6, "pct_window": 252}
+            assert ("indicator", "bbiboll", tuple(params.items())) in ctx
+            assert ctx.log_return() is ctx.log_return()
+
+    def test_context_bound_to_frame(self, ohlcv: pl.DataFrame):
+        from factors import FactorContext, active_context, factor_context
+
+        with FactorContext(ohlcv) as ctx:
+            assert factor_context(ohlcv) is ctx
+            assert factor_context(ohlcv.clone()) is not ctx
+            assert factor_context(ohlcv, ohlcv_date_col="date") is not ctx
+            with factor_context(ohlcv):
+                assert active_context() is ctx
+            assert active_context() is ctx
+        assert active_context() is None
+
+    def test_daily_returns_in_context(self, ohlcv: pl.DataFrame):
+        from factors import FactorContext
+        from portfolio.pipeline import compute_daily_returns
+
+        expected = compute_daily_returns(ohlcv)
+        with FactorContext(ohlcv):
+            assert compute_daily_returns(ohlcv).equals(expected)
+
+
+# ── Test lazy factor plan ───────────────────────────────────────────────────
+
+
+class TestFactorPlan:
+    """``engine="lazy"`` / ``"wide"`` reproduce the eager composite."""
+
+    NAMES = ["momentum", "vol_ratio", "bbiboll", "alpha001", "alpha002"]
+
+    @pytest.fixture(autouse=True)
+    def _basic_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+
+    @staticmethod
+    def _assert_same(lazy: pl.DataFrame, eager: pl.DataFrame):
+        from polars.testing import assert_frame_equal
+
+        assert lazy.height > 0
+        assert_frame_equal(
+            lazy.sort("date", "ticker"), eager.sort("date", "ticker"), check_exact=False
+        )
+
+    def test_plan_columns_match_factors(self, ohlcv: pl.DataFrame):
+        from factors import build_factor_plan, get_factor_fn
+
+        wide = build_factor_plan(ohlcv, self.NAMES, pct_window=20).collect()
+        assert wide.columns == ["date", "ticker", *self.NAMES]
+        for name in self.NAMES:
+            expected = get_factor_fn(name)(ohlcv, pct_window=20)
+            got = wide.select(
+                "date", "ticker", pl.col(name).alias("value")
+            ).drop_nulls()
+            self._assert_same(got, expected)
+
+    @pytest.mark.parametrize("engine", ["lazy", "wide"])
+    @pytest.mark.parametrize(
+        "method, window",
+        [("equal_weight", None), ("ic_weight", None), ("ic_weight", "expanding")],
+    )
+    def test_engine_matches_eager(
+        self, ohlcv: pl.DataFrame, method: str, window, engine: str
+    ):
+        from portfolio.alpha_config import AlphaConfig, FactorConfig
+        from portfolio.pipeline import (
+            build_factor_pipeline,
+            compute_daily_returns,
+            compute_next_day_returns,
+        )
+
+        config = AlphaConfig(
+            factor_names=self.NAMES,
+            combination_method=method,
+            combination_window=window,
+            combination_min_periods=5,
+            factor_configs={
+                "momentum": FactorConfig(normalize_method="rank", direction=-1),
+                "vol_ratio": FactorConfig(winsorize_pct=0.0),
+            },
+        )
+        returns = compute_next_day_returns(compute_daily_returns(ohlcv))
+        kwargs = dict(config=config, next_day_returns=returns, pct_window=20)
+        self._assert_same(
+            build_factor_pipeline(ohlcv, engine=engine, **kwargs),
+            build_factor_pipeline(ohlcv, **kwargs),
+        )
+
+    def test_single_factor_and_errors(self, ohlcv: pl.DataFrame):
+        from factors import build_factor_plan
+        from portfolio.alpha_config import FactorConfig
+        from portfolio.pipeline import build_factor_pipeline
+
+        for engine in ("lazy", "wide"):
+            self._assert_same(
+                build_factor_pipeline(ohlcv, ["alpha001"], engine=engine),
+                build_factor_pipeline(ohlcv, ["alpha001"]),
+            )
+        with pytest.raises(ValueError, match="Unknown engine"):
+            build_factor_pipeline(ohlcv, ["alpha001"], engine="spark")
+        with pytest.raises(ValueError, match="sector neutralization"):
+            build_factor_plan(
+                ohlcv, ["momentum"], {"momentum": FactorConfig(neutralize=["sector"])}
+            )
+
+
+class TestPipelineIC:
+    """IC-based combination matches the per-factor Polars rank-IC path."""
+
+    NAMES = ["momentum", "vol_ratio", "alpha001"]
+    N_TICKERS = 12
+
+    @pytest.fixture(autouse=True)
+    def _basic_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+
+    @pytest.fixture
+    def datetime_ohlcv(self, rng: np.random.Generator, dates: list[dt.date]):
+        """Datetime timestamps, rows in (ticker, date) order as loaded."""
+        n = len(dates)
+        frames = []
+        for i in range(self.N_TICKERS):
+            close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+            frames.append(
+                pl.DataFrame(
+                    {
+                        "timestamps": [
+                            dt.datetime(d.year, d.month, d.day) for d in dates
+                        ],
+                        "ticker": f"T{i:02d}",
+                        "open": close * 0.999,
+                        "high": close * 1.01,
+                        "low": close * 0.99,
+                        "close": close,
+                        "volume": rng.integers(1_000_000, 10_000_000, n),
+                    }
+                )
+            )
+        return pl.concat(frames)
+
+    @staticmethod
+    def _reference_ic_series_list(factors, next_day_returns):
+        """The per-factor join + per-date corr(rank, rank) the kernel replaced."""
+        out = []
+        for factor in factors:
+            merged = factor.join(next_day_returns, on=["date", "ticker"], how="inner")
+            out.append(
+                merged.group_by("date")
+                .agg(
+                    pl.corr(
+                        pl.col("value").rank(), pl.col("next_day_return").rank()
+                    ).alias("ic")
+                )
+                .sort("date")
+                .filter(pl.col("ic").is_not_null() & pl.col("ic").is_finite())
+            )
+        return out
+
+    def test_ic_series_match_reference(self, datetime_ohlcv):
+        from polars.testing import assert_frame_equal
+
+        from factors import get_factor_fn
+        from portfolio import pipeline
+
+        factors = [
+            get_factor_fn(name)(datetime_ohlcv, pct_window=20) for name in self.NAMES
+        ]
+        returns = pipeline.compute_next_day_returns(
+            pipeline.compute_daily_returns(datetime_ohlcv)
+        )
+        result = pipeline._compute_ic_series_list(factors, returns)
+        expected = self._reference_ic_series_list(factors, returns)
+        for got, want in zip(result, expected):
+            assert want.height > 0
+            assert_frame_equal(got, want, check_exact=False)
+
+    @pytest.mark.parametrize("engine", ["eager", "wide", "lazy"])
+    @pytest.mark.parametrize("method", ["ic_weight", "mean_variance", "risk_parity"])
+    def test_composite_matches_reference_ics(
+        self, datetime_ohlcv, monkeypatch, method: str, engine: str
+    ):
+        from polars.testing import assert_frame_equal
+
+        from portfolio import pipeline
+        from portfolio.alpha_config import AlphaConfig
+
+        config = AlphaConfig(factor_names=self.NAMES, combination_method=method)
+        returns = pipeline.compute_next_day_returns(
+            pipeline.compute_daily_returns(datetime_ohlcv)
+        )
+        kwargs = dict(config=config, next_day_returns=returns, pct_window=20)
+        result = pipeline.build_factor_pipeline(datetime_ohlcv, engine=engine, **kwargs)
+
+        monkeypatch.setattr(
+            pipeline, "_compute_ic_series_list", self._reference_ic_series_list
+        )
+        expected = pipeline.build_factor_pipeline(datetime_ohlcv, **kwargs)
+
+        assert result["date"].dtype == pl.Datetime("us")
+        assert result.height > 0
+        assert_frame_equal(
+            result.sort("date", "ticker"),
+            expected.sort("date", "ticker"),
+            check_exact=False,
+        )
+
+
+# ── Test parallel factor computation ────────────────────────────────────────
+
+
+class TestComputeFactors:
+    """Thread / process backends reproduce the serial factors."""
+
+    NAMES = ["momentum", "vol_ratio", "bbiboll", "alpha001"]
+
+    @pytest.fixture(autouse=True)
+    def _basic_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_backend_matches_serial(self, ohlcv: pl.DataFrame, backend: str):
+        from factors import compute_factors
+        from indicators.base import ExecutionConfig
+
+        serial, _ = compute_factors(ohlcv, self.NAMES, pct_window=20)
+        parallel, seconds = compute_factors(
+            ohlcv,
+            self.NAMES,
+            execution=ExecutionConfig(backend, n_workers=2),
+            pct_window=20,
+        )
+        assert set(seconds) == set(self.NAMES)
+        assert all(s >= 0 for s in seconds.values())
+        for got, expected in zip(parallel, serial):
+            assert got.equals(expected)
+
+    def test_pipeline_reports_timings(self, ohlcv: pl.DataFrame):
+        from indicators.base import ExecutionConfig
+        from portfolio.alpha_config import AlphaConfig, FactorConfig
+        from portfolio.pipeline import build_factor_pipeline
+
+        config = AlphaConfig(
+            factor_names=["momentum", "vol_ratio"],
+            factor_configs={"momentum": FactorConfig(direction=-1)},
+        )
+        timings: dict[str, float] = {}
+        threaded = build_factor_pipeline(
+            ohlcv,
+            config=config,
+            execution=ExecutionConfig("thread", n_workers=2),
+            timings=timings,
+        )
+        assert set(timings) == {"momentum", "vol_ratio"}
+        assert threaded.equals(build_factor_pipeline(ohlcv, config=config))
+
+
+# ── Test factor store ───────────────────────────────────────────────────────
+
+
+class TestFactorStore:
+    """Persisted factor values, versioned and updated incrementally."""
+
+    @pytest.fixture(autouse=True)
+    def _basic_factors(self):
+        import factors.alphas.basic101  # noqa: F401
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from factors.store import FactorStore
+
+        return FactorStore(str(tmp_path))
+
+    @staticmethod
+    def _sorted(df: pl.DataFrame) -> pl.DataFrame:
+        return df.sort("date", "ticker")
+
+    @pytest.mark.parametrize(
+        "name,params", [("momentum", {"lookback": 5}), ("bbiboll", {"pct_window": 20})]
+    )
+    def test_incremental_update_matches_full(self, store, ohlcv, name, params):
+        from factors import get_factor_fn
+
+        cutoff = sorted(ohlcv["timestamps"].unique())[39]
+        first = store.update(
+            ohlcv.filter(pl.col("timestamps") <= cutoff), name, **params
+        )
+        added = store.update(ohlcv, name, **params)
+        assert first.height > 0 and added.height > 0
+        assert added["date"].min() > cutoff
+        assert store.update(ohlcv, name, **params).is_empty()
+
+        expected = self._sorted(get_factor_fn(name)(ohlcv, **params))
+        assert store.load(name, **params).equals(expected)
+        sliced = store.load(name, start=cutoff, **params)
+        assert sliced.equals(expected.filter(pl.col("date") >= cutoff))
+
+    def test_versions(self, store, ohlcv):
+        from portfolio.alpha_config import FactorConfig
+
+        base = store.version("momentum", lookback=5)
+        assert base == store.version("momentum", lookback=5)
+        assert base != store.version("momentum", lookback=10)
+        assert base != store.version(
+            "momentum", FactorConfig(normalize_method="rank"), lookback=5
+        )
+        assert store.load("momentum", lookback=5) is None
+
+    def test_revised_history_rebuilds(self, store, ohlcv):
+        from factors import get_factor_fn
+
+        store.update(ohlcv, "momentum", lookback=5)
+        revised = ohlcv.with_columns(
+            pl.when(pl.col("timestamps") == pl.col("timestamps").min())
+            .then(pl.col("close") * 2)
+            .otherwise(pl.col("close"))
+            .alias("close")
+        )
+        factor_fn = store.get_factor_fn("momentum")
+        expected = self._sorted(get_factor_fn("momentum")(revised, lookback=5))
+        assert factor_fn(revised, lookback=5).equals(expected)
+
 
 # ── Test universe module ─────────────────────────────────────────────────────
 